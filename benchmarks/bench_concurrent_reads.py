@@ -0,0 +1,116 @@
+"""
+Write latency of FileBoard while other processes poll it.
+
+Starts reader processes that poll the board the way member triggers do, and
+measures the latency of assignments made meanwhile. Readers take no lock, so
+writes never wait for them (latency only grows with the CPU time the readers
+take away on small machines), and no read or write should fail.
+
+Usage:
+    python benchmarks/bench_concurrent_reads.py [--readers 0,4,16] [--writes 200]
+        [--poll-ms 10]
+"""
+
+import argparse
+import multiprocessing
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from zrb_squad.board import FileBoard, os_buffered  # noqa: E402
+
+MEMBERS = 4
+
+
+def _poll(file_path: str, member: str, interval: float, stop, reads, errors) -> None:
+    """Poll a member's pending tasks until told to stop."""
+    board = FileBoard(file_path, durability=os_buffered)
+    count = failed = 0
+    while not stop.is_set():
+        try:
+            board.get_pending_by_assignee(member)
+            count += 1
+        except RuntimeError:
+            failed += 1
+        time.sleep(interval)
+    with reads.get_lock():
+        reads.value += count
+    with errors.get_lock():
+        errors.value += failed
+
+
+def _run(readers: int, writes: int, poll_ms: float, base_dir: str | None) -> dict:
+    """Measure assignment latency with the given number of polling readers."""
+    work_dir = tempfile.mkdtemp(dir=base_dir)
+    file_path = os.path.join(work_dir, "board.json")
+    stop = multiprocessing.Event()
+    reads = multiprocessing.Value("l", 0)
+    errors = multiprocessing.Value("l", 0)
+    processes = [
+        multiprocessing.Process(
+            target=_poll,
+            args=(
+                file_path,
+                f"member-{i % MEMBERS}",
+                poll_ms / 1000,
+                stop,
+                reads,
+                errors,
+            ),
+        )
+        for i in range(readers)
+    ]
+    try:
+        board = FileBoard(file_path, durability=os_buffered)
+        board.assign("alice", "member-0", "seed", "benchmark")
+        for process in processes:
+            process.start()
+        time.sleep(0.2)  # let the readers start polling
+        latencies = []
+        start = time.perf_counter()
+        for i in range(writes):
+            began = time.perf_counter()
+            board.assign("alice", f"member-{i % MEMBERS}", f"task-{i}", "benchmark")
+            latencies.append((time.perf_counter() - began) * 1000)
+        elapsed = time.perf_counter() - start
+    finally:
+        stop.set()
+        for process in processes:
+            process.join()
+        shutil.rmtree(work_dir, ignore_errors=True)
+    latencies.sort()
+    return {
+        "p50": statistics.median(latencies),
+        "p95": latencies[int(len(latencies) * 0.95) - 1],
+        "reads_per_sec": reads.value / elapsed,
+        "errors": errors.value,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--readers", default="0,4,16")
+    parser.add_argument("--writes", type=int, default=200)
+    parser.add_argument("--poll-ms", type=float, default=10.0)
+    parser.add_argument("--dir", default=None, help="Directory to benchmark in")
+    args = parser.parse_args()
+
+    for readers in [int(value) for value in args.readers.split(",")]:
+        result = _run(readers, args.writes, args.poll_ms, args.dir)
+        print(
+            f"{readers:>3} readers  write p50 {result['p50']:7.2f} ms  "
+            f"p95 {result['p95']:7.2f} ms  "
+            f"{result['reads_per_sec']:9.1f} reads/sec  "
+            f"{result['errors']} failed reads"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
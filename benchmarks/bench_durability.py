@@ -0,0 +1,61 @@
+"""
+Write throughput of FileBoard per durability level.
+
+Runs a burst of assignments against a fresh board for each durability level
+and reports writes per second. Pass --dir to benchmark a specific disk (the
+default temporary directory may be memory-backed, where fsync is cheap).
+
+Usage:
+    python benchmarks/bench_durability.py [--writes 200] [--window-ms 5] [--dir .]
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from zrb_squad.board import (  # noqa: E402
+    FileBoard,
+    fsync_every_write,
+    group_commit,
+    os_buffered,
+)
+
+
+def _run(durability, writes: int, base_dir: str | None) -> float:
+    """Return the writes/sec of one durability level."""
+    work_dir = tempfile.mkdtemp(dir=base_dir)
+    try:
+        board = FileBoard(os.path.join(work_dir, "board.json"), durability=durability)
+        start = time.perf_counter()
+        for i in range(writes):
+            board.assign("alice", f"member-{i % 4}", f"task-{i}", "benchmark")
+        # The last window only counts once it is durable
+        board.flush()
+        elapsed = time.perf_counter() - start
+        return writes / elapsed
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--writes", type=int, default=200)
+    parser.add_argument("--window-ms", type=float, default=5.0)
+    parser.add_argument("--dir", default=None, help="Directory to benchmark in")
+    args = parser.parse_args()
+
+    levels = [fsync_every_write, group_commit(args.window_ms), os_buffered]
+    for durability in levels:
+        rate = _run(durability, args.writes, args.dir)
+        print(f"{str(durability):<20} {rate:10.1f} writes/sec")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
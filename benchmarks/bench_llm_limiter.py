@@ -0,0 +1,94 @@
+"""
+Wait times of member processes sharing a SquadLimiter.
+
+Starts one process per member; each starts a number of turns as fast as the
+limiter allows, holding its concurrency slot for a simulated call. Reports
+the squad's request rate (which must stay under the limit) and each
+member's average wait, which should be lowest for the weighted orchestrator.
+
+Usage:
+    python benchmarks/bench_llm_limiter.py [--executors 4] [--turns 10]
+        [--rpm 120] [--concurrent 2] [--orchestrator-weight 5]
+"""
+
+import argparse
+import asyncio
+import multiprocessing
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from zrb_squad import SquadLimiter  # noqa: E402
+
+CALL_SECONDS = 0.05
+
+
+def _member(limiter: SquadLimiter, turns: int) -> None:
+    """Start turns back to back, each holding its slot for one call."""
+
+    async def run() -> None:
+        for _ in range(turns):
+            await limiter.acquire("benchmark prompt " * 50)
+            await asyncio.sleep(CALL_SECONDS)
+            limiter.release()
+
+    asyncio.run(run())
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--executors", type=int, default=4)
+    parser.add_argument("--turns", type=int, default=10)
+    parser.add_argument("--rpm", type=int, default=120)
+    parser.add_argument("--concurrent", type=int, default=2)
+    parser.add_argument("--orchestrator-weight", type=float, default=5.0)
+    args = parser.parse_args()
+
+    work_dir = tempfile.mkdtemp()
+    try:
+        limiter = SquadLimiter(
+            os.path.join(work_dir, "llm.json"),
+            max_request_per_minute=args.rpm,
+            max_token_per_minute=10_000_000,
+            max_concurrent=args.concurrent,
+            role_weights={"orchestrator": args.orchestrator_weight},
+            burst_seconds=1.0,
+        )
+        members = [("orchestrator", "orchestrator")] + [
+            (f"executor-{i}", "executor") for i in range(args.executors)
+        ]
+        processes = [
+            multiprocessing.Process(
+                target=_member, args=(limiter.for_member(name, role), args.turns)
+            )
+            for name, role in members
+        ]
+        start = time.perf_counter()
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+        elapsed = time.perf_counter() - start
+        stats = limiter.stats()
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    total = sum(member["requests"] for member in stats["members"].values())
+    print(f"rate:  {total / elapsed * 60:.1f} requests/min (limit {args.rpm})")
+    for name, _ in members:
+        member = stats["members"][name]
+        print(
+            f"{name:<14} avg wait {member['wait_seconds_avg']:6.2f} s  "
+            f"max {member['wait_seconds_max']:6.2f} s  "
+            f"throttled {member['throttled']}/{member['requests']}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,85 @@
+"""
+Recovery time of a corrupted FileBoard.
+
+Builds a board with a snapshot and a full journal (the worst case: two
+snapshot intervals of changes to replay), corrupts the board file, and times
+how long reading the board takes to detect the corruption, replay the journal
+and rewrite the board file.
+
+Usage:
+    python benchmarks/bench_recovery.py [--stories 100000] [--interval 100] [--dir .]
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from zrb_squad.board import FileBoard, os_buffered  # noqa: E402
+from zrb_squad.board.story import Story  # noqa: E402
+
+
+def _build_board(file_path: str, stories: int, interval: int) -> FileBoard:
+    """Write a board of `stories` stories with a snapshot and a full journal."""
+    board = FileBoard(file_path, durability=os_buffered, snapshot_interval=interval)
+    items = [
+        Story(
+            assignee=f"member-{i % 4}",
+            assigner="alice",
+            description=f"task-{i}: benchmark story {i}",
+        )
+        for i in range(stories)
+    ]
+    with board._mutation_lock():
+        board._write_stories(items)
+        board._journal.snapshot([story.to_dict(compact=True) for story in items])
+        # Replay covers the changes since the previous snapshot: fill two
+        # intervals without taking another snapshot
+        for story in items[: 2 * interval - 1]:
+            story.complete("done")
+            board._journal.append([story.to_dict(compact=True)], [])
+        board._write_stories(items)
+    return board
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--stories", type=int, default=100_000)
+    parser.add_argument("--interval", type=int, default=100)
+    parser.add_argument("--dir", default=None, help="Directory to benchmark in")
+    args = parser.parse_args()
+
+    work_dir = tempfile.mkdtemp(dir=args.dir)
+    try:
+        file_path = os.path.join(work_dir, "board.json")
+        start = time.perf_counter()
+        _build_board(file_path, args.stories, args.interval)
+        print(f"build:    {time.perf_counter() - start:8.2f} s")
+
+        # Simulate a torn write of the board file
+        size = os.path.getsize(file_path)
+        with open(file_path, "r+") as f:
+            f.truncate(size // 2)
+
+        board = FileBoard(file_path, snapshot_interval=args.interval)
+        start = time.perf_counter()
+        stories = board.get_all()
+        elapsed = time.perf_counter() - start
+        completed = sum(1 for story in stories if story.is_completed)
+        print(f"recovery: {elapsed:8.2f} s")
+        print(f"restored: {len(stories)} stories, {completed} replayed completions")
+        if len(stories) != args.stories or completed != 2 * args.interval - 1:
+            print("FAIL: recovered board does not match the last consistent state")
+            return 1
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+"""
+Startup benchmark for zrb_squad.
+
+Measures how long it takes to import the package and to run `zrb --help`
+(which loads zrb_init.py and therefore defines the squad), and checks that
+importing the package stays free of side effects. Fails if zrb could not load
+zrb_init.py, since `zrb --help` would then time nothing.
+
+Usage:
+    python benchmarks/bench_startup.py [--runs 10] [--max-import-ms 50]
+"""
+
+import argparse
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+EAGER_MODULES = (
+    "zrb_squad.board.file_board",
+    "zrb_squad.board.sharded_file_board",
+)
+
+# zrb reports a zrb_init.py that fails to load with this, and still exits 0
+ZRB_LOAD_ERROR = "Error loading file"
+
+IMPORT_CHECK = """
+import sys
+import zrb_squad
+{statement}
+loaded = [name for name in {modules!r} if name in sys.modules]
+if loaded:
+    raise SystemExit(f"Importing zrb_squad eagerly loaded: {{loaded}}")
+"""
+
+
+def _time_command(command: list[str], cwd: str, runs: int) -> tuple[list[float], str]:
+    """Run a command several times; return the wall-clock times in ms and its output."""
+    env = dict(os.environ, PYTHONPATH=ROOT_DIR)
+    timings = []
+    output = ""
+    for _ in range(runs):
+        start = time.perf_counter()
+        completed = subprocess.run(
+            command, cwd=cwd, env=env, check=True, capture_output=True, text=True
+        )
+        timings.append((time.perf_counter() - start) * 1000)
+        output = completed.stdout + completed.stderr
+    return timings, output
+
+
+def _report(label: str, timings: list[float]) -> float:
+    median = statistics.median(timings)
+    print(f"{label:<28} median {median:8.1f} ms   min {min(timings):8.1f} ms")
+    return median
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument(
+        "--max-import-ms",
+        type=float,
+        default=None,
+        help="Fail if importing zrb_squad (over bare python) takes longer",
+    )
+    args = parser.parse_args()
+
+    # Run in an empty directory so no board file can be picked up or created
+    work_dir = tempfile.mkdtemp()
+    try:
+        baseline = _report(
+            "python -c pass",
+            _time_command([sys.executable, "-c", "pass"], work_dir, args.runs)[0],
+        )
+        package = _report(
+            "import zrb_squad",
+            _time_command(
+                [
+                    sys.executable,
+                    "-c",
+                    IMPORT_CHECK.format(statement="", modules=EAGER_MODULES),
+                ],
+                work_dir,
+                args.runs,
+            )[0],
+        )
+        _report(
+            "from zrb_squad import Squad",
+            _time_command(
+                [
+                    sys.executable,
+                    "-c",
+                    IMPORT_CHECK.format(
+                        statement="from zrb_squad import Squad", modules=EAGER_MODULES
+                    ),
+                ],
+                work_dir,
+                args.runs,
+            )[0],
+        )
+        zrb = shutil.which("zrb")
+        if zrb is not None:
+            timings, output = _time_command([zrb, "--help"], ROOT_DIR, args.runs)
+            errors = [line for line in output.splitlines() if ZRB_LOAD_ERROR in line]
+            if errors:
+                print("zrb could not load zrb_init.py:\n" + "\n".join(errors))
+                return 1
+            _report("zrb --help (zrb_init.py)", timings)
+        else:
+            print("zrb executable not found, skipping `zrb --help`")
+        if os.listdir(work_dir):
+            print(f"Importing zrb_squad created files: {os.listdir(work_dir)}")
+            return 1
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    overhead = package - baseline
+    print(f"{'import overhead':<28} {overhead:8.1f} ms")
+    if args.max_import_ms is not None and overhead > args.max_import_ms:
+        print(f"Import overhead exceeds {args.max_import_ms} ms")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
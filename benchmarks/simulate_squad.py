@@ -0,0 +1,87 @@
+"""
+End-to-end squad throughput with stand-in agents (no LLM calls).
+
+Simulates an orchestrator that fans every seed task out to a pool of
+executors through `role:executor`, using the real board tools and triggers,
+and reports tasks/sec, notification latency and queue depth.
+
+Usage:
+    python benchmarks/simulate_squad.py [--executors 4] [--seeds 10] [--fan-out 4]
+        [--think-ms 50 200] [--board file|sharded] [--durability group_commit:5]
+        [--min-interval 0.05] [--dir .]
+"""
+
+import argparse
+import asyncio
+import os
+import shutil
+import sys
+import tempfile
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from zrb import LLMChatTask  # noqa: E402
+
+from zrb_squad import Member, Squad  # noqa: E402
+from zrb_squad.board import FileBoard, ShardedFileBoard  # noqa: E402
+from zrb_squad.board.poll_stream import PollPolicy  # noqa: E402
+from zrb_squad.simulation import SquadSimulator, StandInAgent  # noqa: E402
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--executors", type=int, default=4)
+    parser.add_argument("--seeds", type=int, default=10)
+    parser.add_argument("--fan-out", type=int, default=4)
+    parser.add_argument("--think-ms", type=float, nargs=2, default=(50.0, 200.0))
+    parser.add_argument("--board", choices=("file", "sharded"), default="file")
+    parser.add_argument("--durability", default="group_commit:5")
+    parser.add_argument("--min-interval", type=float, default=0.05)
+    parser.add_argument("--timeout", type=float, default=120.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--dir", default=None, help="Directory to put the board in")
+    args = parser.parse_args()
+
+    work_dir = tempfile.mkdtemp(dir=args.dir)
+    try:
+        poll_policy = PollPolicy(
+            min_interval=args.min_interval, max_interval=1.0, debounce=0
+        )
+        if args.board == "sharded":
+            board = ShardedFileBoard(
+                os.path.join(work_dir, "board"),
+                durability=args.durability,
+                poll_policy=poll_policy,
+            )
+        else:
+            board = FileBoard(
+                os.path.join(work_dir, "board.json"),
+                durability=args.durability,
+                poll_policy=poll_policy,
+            )
+        executors = [f"executor-{index}" for index in range(args.executors)]
+        members = [Member("orchestrator", LLMChatTask(name="orchestrator"))]
+        members += [
+            Member(name, LLMChatTask(name=name), role="executor") for name in executors
+        ]
+        squad = Squad("simulation", members, board=board)
+
+        think_time = (args.think_ms[0] / 1000, args.think_ms[1] / 1000)
+        agents = {
+            "orchestrator": StandInAgent(
+                fan_out=args.fan_out, fan_out_to=["role:executor"]
+            )
+        }
+        agents.update({name: StandInAgent(think_time=think_time) for name in executors})
+        simulator = SquadSimulator(squad, agents, sample_interval=0.25, seed=args.seed)
+        report = asyncio.run(simulator.run(seed_tasks=args.seeds, timeout=args.timeout))
+        board.flush()
+        print(report.summary())
+        return 0 if report.completed == report.assigned else 1
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,162 @@
+"""
+Stress test of one board shared by many threads of a process.
+
+Drives a ThreadPoolExecutor through the calls a member process makes
+concurrently (parallel tool calls plus trigger polls): assignments,
+completions, progress notes and patches, reads, searches and range scans.
+Then it checks that no update was lost or duplicated and that the cached
+counters match a recount of the board. Exits with status 1 on any error or
+mismatch.
+
+Usage:
+    python benchmarks/stress_threads.py [--threads 16] [--ops 1000] [--sharded]
+"""
+
+import argparse
+import os
+import random
+import shutil
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from zrb_squad.board import FileBoard, ShardedFileBoard, os_buffered  # noqa: E402
+
+MEMBERS = ["lead", "dev-1", "dev-2", "dev-3"]
+ROLES = {"dev-1": "dev", "dev-2": "dev", "dev-3": "dev"}
+
+
+class Tally:
+    """What the threads did, to check the board against."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.assigned: list[str] = []
+        self.completed: set[str] = set()
+        self.notes: dict[str, int] = {}
+        self.errors: list[str] = []
+
+
+def _operation(board: FileBoard, tally: Tally, seed: int) -> None:
+    """Run one random board call, recording its effect."""
+    rng = random.Random(seed)
+    choice = rng.random()
+    try:
+        if choice < 0.3 or not tally.assigned:
+            assignee = rng.choice(MEMBERS[1:] + ["role:dev"])
+            description = "x" * rng.choice([50, 2000])  # some go to the blob store
+            story = board.assign("lead", assignee, f"task-{seed}", description)
+            with tally.lock:
+                tally.assigned.append(story.task_id)
+        elif choice < 0.45:
+            member = rng.choice(MEMBERS[1:])
+            pending = board.get_pending_by_assignee(member)
+            if pending:
+                story = rng.choice(pending)
+                if board.complete(story.task_id, member, result="done"):
+                    with tally.lock:
+                        if story.task_id in tally.completed:
+                            tally.errors.append(f"{story.task_id} completed twice")
+                        tally.completed.add(story.task_id)
+        elif choice < 0.6:
+            with tally.lock:
+                task_id = rng.choice(tally.assigned)
+            if choice < 0.5:
+                board.update(task_id, {"metadata": {f"key-{seed}": seed}})
+            else:
+                board.append_note(task_id, f"note {seed}", author="lead")
+                with tally.lock:
+                    tally.notes[task_id] = tally.notes.get(task_id, 0) + 1
+        elif choice < 0.7:
+            board.search("task", limit=5)
+        elif choice < 0.8:
+            board.get_since(time.time() - 1)
+        elif choice < 0.9:
+            board.queue_depth(rng.choice(MEMBERS))
+            board.members()
+        else:
+            for story in board.get_by_assigner("lead")[:5]:
+                story.description  # loads blob-stored descriptions
+    except Exception as e:
+        with tally.lock:
+            tally.errors.append(f"{type(e).__name__}: {e}")
+
+
+def _check(board: FileBoard, tally: Tally) -> list[str]:
+    """Compare the board with what the threads did."""
+    problems = list(tally.errors)
+    stories = board.get_all()
+    ids = [story.task_id for story in stories]
+    if len(ids) != len(set(ids)):
+        problems.append("duplicated stories")
+    if sorted(ids) != sorted(tally.assigned):
+        problems.append(f"{len(tally.assigned)} assigned, {len(ids)} on the board")
+    completed = {story.task_id for story in stories if story.is_completed}
+    if completed != tally.completed:
+        problems.append(f"{len(tally.completed)} completed, {len(completed)} stored")
+    for story in stories:
+        if len(story.notes) != tally.notes.get(story.task_id, 0):
+            problems.append(f"{story.task_id} lost notes")
+            break
+    for member in MEMBERS:
+        expected = sum(
+            1
+            for story in stories
+            if story.assignee == member and not story.is_completed
+        )
+        if board.queue_depth(member) != expected:
+            problems.append(f"queue depth of {member} is off")
+    return problems
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--ops", type=int, default=1000)
+    parser.add_argument("--sharded", action="store_true")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    work_dir = tempfile.mkdtemp()
+    try:
+        if args.sharded:
+            board = ShardedFileBoard(
+                os.path.join(work_dir, "board"),
+                durability=os_buffered,
+                blob_threshold=1024,
+            )
+        else:
+            board = FileBoard(
+                os.path.join(work_dir, "board.json"),
+                durability=os_buffered,
+                blob_threshold=1024,
+            )
+        board.set_valid_members(MEMBERS, roles=ROLES)
+        tally = Tally()
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.threads) as executor:
+            for i in range(args.ops):
+                executor.submit(_operation, board, tally, args.seed * args.ops + i)
+        elapsed = time.perf_counter() - start
+        problems = _check(board, tally)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    print(
+        f"{args.ops} operations on {args.threads} threads in {elapsed:.2f} s "
+        f"({args.ops / elapsed:.0f} ops/s), {len(tally.assigned)} assigned, "
+        f"{len(tally.completed)} completed"
+    )
+    for problem in problems[:20]:
+        print(f"  {problem}")
+    print("OK" if not problems else f"FAILED ({len(problems)} problems)")
+    return 0 if not problems else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,29 @@
+import os
+
+import pytest
+
+from zrb_squad.board import FileBoard, ShardedFileBoard, os_buffered
+
+MEMBERS = ["lead", "dev-1", "dev-2", "qa"]
+ROLES = {"lead": "orchestrator", "dev-1": "dev", "dev-2": "dev", "qa": "qa"}
+
+
+@pytest.fixture(params=["file", "sharded"])
+def make_board(request, tmp_path):
+    """Build boards of both kinds in a temporary directory."""
+
+    def make(**options):
+        options.setdefault("durability", os_buffered)
+        if request.param == "sharded":
+            board = ShardedFileBoard(os.path.join(tmp_path, "board"), **options)
+        else:
+            board = FileBoard(os.path.join(tmp_path, "board.json"), **options)
+        board.set_valid_members(MEMBERS, roles=ROLES)
+        return board
+
+    return make
+
+
+@pytest.fixture
+def board(make_board):
+    return make_board()
@@ -0,0 +1,400 @@
+import json
+import os
+import threading
+import time
+
+import pytest
+
+from zrb_squad.board import (
+    FileBoard,
+    QueueFullError,
+    ShardedFileBoard,
+    Story,
+    VersionConflictError,
+    new_task_id,
+    os_buffered,
+    task_id_timestamp,
+)
+
+
+def test_assign_and_complete(board):
+    story = board.assign("lead", "dev-1", "build", "Build the parser")
+    assert [item.task_id for item in board.get_pending_by_assignee("dev-1")] == [
+        story.task_id
+    ]
+    assert board.complete(story.task_id, "dev-1", result="done")
+    assert not board.complete(story.task_id, "dev-1")
+    assert board.get_pending_by_assignee("dev-1") == []
+    (completed,) = board.get_completed_by_assignee("dev-1")
+    assert completed.result == "done"
+    assert [item.task_id for item in board.get_by_assigner("lead")] == [story.task_id]
+
+
+def test_unknown_member_is_rejected(board):
+    with pytest.raises(ValueError):
+        board.assign("lead", "nobody", "build", "Build the parser")
+    with pytest.raises(ValueError):
+        board.assign("nobody", "dev-1", "build", "Build the parser")
+
+
+def test_blocked_task_waits_for_its_dependencies(board):
+    parser = board.assign("lead", "dev-1", "parser", "Build the parser")
+    tests = board.assign(
+        "lead", "qa", "tests", "Test the parser", blocked_by=[parser.task_id]
+    )
+    assert board.get_pending_by_assignee("qa") == []
+    assert [item.task_id for item in board.get_blocked_by_assignee("qa")] == [
+        tests.task_id
+    ]
+    board.complete(parser.task_id, "dev-1")
+    assert [item.task_id for item in board.get_pending_by_assignee("qa")] == [
+        tests.task_id
+    ]
+
+
+def test_unknown_dependency_is_rejected(board):
+    with pytest.raises(ValueError, match="Unknown dependency"):
+        board.assign("lead", "dev-1", "parser", "Build it", blocked_by=["missing"])
+
+
+def test_dependency_cycle_is_rejected(board):
+    first = board.assign("lead", "dev-1", "first", "First step")
+    second = board.assign(
+        "lead", "dev-1", "second", "Second step", blocked_by=[first.task_id]
+    )
+    with pytest.raises(ValueError, match="cycle"):
+        board.compare_and_update(first.task_id, 1, {"blocked_by": [second.task_id]})
+
+
+def test_role_assignment_goes_to_least_loaded_member(board):
+    board.assign("lead", "dev-1", "one", "First task")
+    story = board.assign("lead", "role:dev", "two", "Second task")
+    assert story.assignee == "dev-2"
+    assert board.queue_depth("dev-1") == 1
+    assert board.queue_depth("dev-2") == 1
+    with pytest.raises(ValueError, match="No squad member has role"):
+        board.assign("lead", "role:designer", "three", "Third task")
+
+
+def test_full_queue_spills_to_same_role(make_board):
+    board = make_board(max_pending_per_member=1)
+    board.assign("lead", "dev-1", "one", "First task")
+    spilled = board.assign("lead", "dev-1", "two", "Second task")
+    assert spilled.assignee == "dev-2"
+    with pytest.raises(QueueFullError) as error:
+        board.assign("lead", "dev-1", "three", "Third task")
+    assert error.value.queue_depth == 1
+    assert error.value.retry_after > 0
+
+
+def test_full_queue_rejects_without_spill(make_board):
+    board = make_board(max_pending_per_member=1, overflow="reject")
+    board.assign("lead", "dev-1", "one", "First task")
+    with pytest.raises(QueueFullError):
+        board.assign("lead", "dev-1", "two", "Second task")
+
+
+def test_board_wide_limit(make_board):
+    board = make_board(max_pending=2)
+    board.assign("lead", "dev-1", "one", "First task")
+    board.assign("lead", "qa", "two", "Second task")
+    with pytest.raises(QueueFullError):
+        board.assign("lead", "dev-2", "three", "Third task")
+
+
+def test_compare_and_update_checks_the_version(board):
+    story = board.assign("lead", "dev-1", "build", "Build the parser")
+    updated = board.compare_and_update(story.task_id, 1, {"result": "half done"})
+    assert updated.version == 2
+    with pytest.raises(VersionConflictError) as error:
+        board.compare_and_update(story.task_id, 1, {"result": "stale"})
+    assert error.value.version == 2
+    with pytest.raises(ValueError):
+        board.compare_and_update(story.task_id, 2, {"is_completed": True})
+
+
+def test_compare_and_update_reassigns(board):
+    story = board.assign("lead", "dev-1", "build", "Build the parser")
+    moved = board.compare_and_update(story.task_id, 1, {"assignee": "dev-2"})
+    assert moved.assignee == "dev-2"
+    assert board.queue_depth("dev-1") == 0
+    assert board.queue_depth("dev-2") == 1
+    assert [item.task_id for item in board.get_pending_by_assignee("dev-2")] == [
+        story.task_id
+    ]
+
+
+def test_notes_and_patches(board):
+    story = board.assign("lead", "dev-1", "build", "Build the parser")
+    board.append_note(story.task_id, "lexer done", author="dev-1")
+    board.update(story.task_id, {"result": "partial", "metadata": {"pr": 12}})
+    updated = board.update(story.task_id, {"metadata": {"pr": None, "ci": "green"}})
+    assert updated.version == 4
+    (stored,) = board.get_by_assignee("dev-1")
+    assert [note["text"] for note in stored.notes] == ["lexer done"]
+    assert stored.result == "partial"
+    assert stored.metadata == {"ci": "green"}
+    with pytest.raises(ValueError):
+        board.update(story.task_id, {"assignee": "qa"})
+    with pytest.raises(ValueError):
+        board.append_note(story.task_id, "  ")
+    with pytest.raises(ValueError):
+        board.append_note("missing", "note")
+
+
+def test_notes_survive_later_writes(board):
+    story = board.assign("lead", "dev-1", "build", "Build the parser")
+    board.append_note(story.task_id, "lexer done")
+    board.assign("lead", "dev-1", "docs", "Write the docs")
+    board.complete(story.task_id, "dev-1", result="done")
+    (stored,) = [item for item in board.get_all() if item.task_id == story.task_id]
+    assert [note["text"] for note in stored.notes] == ["lexer done"]
+    assert stored.is_completed
+
+
+def test_search(board):
+    parser = board.assign("lead", "dev-1", "parser", "Write the JSON parser")
+    board.assign("lead", "dev-2", "docs", "Write the user guide")
+    assert [item.task_id for item in board.search("json parser")] == [parser.task_id]
+    assert len(board.search("write")) == 2
+    assert board.search("nothing") == []
+
+
+def test_get_since(board):
+    first = board.assign("lead", "dev-1", "one", "First task")
+    second = board.assign("lead", "dev-2", "two", "Second task")
+    third = board.assign("lead", "qa", "three", "Third task")
+    assert [item.task_id for item in board.get_since(first.task_id)] == [
+        second.task_id,
+        third.task_id,
+    ]
+    assert [item.task_id for item in board.get_since(second.created_at)] == [
+        third.task_id
+    ]
+    assert board.get_since(time.time() + 60) == []
+    with pytest.raises(ValueError):
+        board.get_since("not-an-id")
+
+
+def test_stats(board):
+    story = board.assign("lead", "dev-1", "one", "First task")
+    board.assign("lead", "dev-1", "two", "Second task")
+    board.complete(story.task_id, "dev-1")
+    stats = board.stats()
+    assert stats["members"]["dev-1"]["pending"] == 1
+    assert stats["members"]["dev-1"]["completed"] == 1
+    assert stats["members"]["qa"]["pending"] == 0
+    assert stats["total"]["completed"] == 1
+
+
+def test_add_and_remove_members(board):
+    board.add_member("dev-3", role="dev")
+    assert board.members()["dev-3"] == "dev"
+    story = board.assign("lead", "dev-3", "build", "Build the parser")
+    moved = board.remove_member("dev-3", reroute_to="role:dev")
+    assert [item.task_id for item in moved] == [story.task_id]
+    assert "dev-3" not in board.members()
+    assert board.queue_depth("dev-3") == 0
+    assert moved[0].assignee in ("dev-1", "dev-2")
+    assert [item.task_id for item in board.get_pending_by_assignee(moved[0].assignee)]
+    with pytest.raises(ValueError):
+        board.assign("lead", "dev-3", "more", "More work")
+
+
+def test_large_descriptions_go_to_the_blob_store(make_board):
+    board = make_board(blob_threshold=100)
+    description = "long text " * 100
+    story = board.assign("lead", "dev-1", "build", description)
+    assert story.description_ref
+    (stored,) = board.get_by_assignee("dev-1")
+    assert stored.description == f"build: {description}"
+    assert len(stored.description_preview) < len(description)
+
+
+def test_delete_and_clear_completed(board):
+    first = board.assign("lead", "dev-1", "one", "First task")
+    second = board.assign("lead", "dev-1", "two", "Second task")
+    assert not board.delete(first.task_id, "qa")
+    assert board.delete(first.task_id, "lead")
+    board.complete(second.task_id, "dev-1")
+    assert board.clear_completed("dev-1") == 1
+    assert board.get_all() == []
+
+
+def test_reopened_board_sees_the_same_stories(tmp_path):
+    path = os.path.join(tmp_path, "board.json")
+    board = FileBoard(path, durability=os_buffered)
+    story = board.assign("lead", "dev-1", "build", "Build the parser")
+    board.append_note(story.task_id, "started")
+    (stored,) = FileBoard(path).get_all()
+    assert stored.task_id == story.task_id
+    assert stored.notes[0]["text"] == "started"
+
+
+def test_corrupted_board_is_recovered_from_the_journal(tmp_path):
+    path = os.path.join(tmp_path, "board.json")
+    board = FileBoard(path, durability=os_buffered, snapshot_interval=3)
+    stories = [board.assign("lead", "dev-1", f"t{i}", f"Task {i}") for i in range(5)]
+    board.complete(stories[0].task_id, "dev-1")
+    with open(path, "w") as f:
+        f.write('[{"task_id": "torn')
+    recovered = FileBoard(path, durability=os_buffered).get_all()
+    assert sorted(item.task_id for item in recovered) == sorted(
+        item.task_id for item in stories
+    )
+    assert [item.is_completed for item in recovered].count(True) == 1
+    assert os.path.exists(path + ".corrupted")
+    with open(path) as f:
+        assert len(json.load(f)) == 5
+
+
+def test_sharded_board_keeps_one_file_per_assignee(tmp_path):
+    board = ShardedFileBoard(os.path.join(tmp_path, "board"), durability=os_buffered)
+    board.assign("lead", "dev-1", "one", "First task")
+    board.assign("lead", "qa", "two", "Second task")
+    files = set(os.listdir(tmp_path / "board"))
+    assert {"index.json", "shard-dev-1.json", "shard-qa.json"} <= files
+    assert "shard-dev-2.json" not in files
+    (stored,) = ShardedFileBoard(os.path.join(tmp_path, "board")).get_by_assignee("qa")
+    assert stored.description == "two: Second task"
+
+
+def test_task_ids_sort_by_creation_time():
+    ids = [new_task_id() for _ in range(100)]
+    assert ids == sorted(ids)
+    assert len(set(ids)) == 100
+    assert abs(task_id_timestamp(ids[0]) - time.time()) < 5
+    assert task_id_timestamp("5f0c6a4e-0000-4000-8000-000000000000") is None
+
+
+def test_story_round_trip():
+    story = Story("dev-1", "lead", "Build it", blocked_by=["x"], metadata={"a": 1})
+    story.notes.append({"at": 1.0, "author": "dev-1", "text": "hi"})
+    copy = Story.from_dict(story.to_dict())
+    assert copy.to_dict() == story.to_dict()
+
+
+def test_search_follows_description_changes(board):
+    story = board.assign("lead", "dev-1", "build", "Write the parser")
+    assert board.search("parser")
+    board.compare_and_update(story.task_id, 1, {"description": "Write the tokenizer"})
+    assert [item.task_id for item in board.search("tokenizer")] == [story.task_id]
+    assert board.search("parser") == []
+    board.compare_and_update(story.task_id, 2, {"assignee": "dev-2"})
+    assert [item.assignee for item in board.search("tokenizer")] == ["dev-2"]
+
+
+def test_removing_a_member_leaves_its_completed_tasks(board):
+    board.add_member("dev-3", role="dev")
+    done = board.assign("lead", "dev-3", "one", "First task")
+    pending = board.assign("lead", "dev-3", "two", "Second task")
+    board.complete(done.task_id, "dev-3", result="ok")
+    moved = board.remove_member("dev-3", reroute_to="dev-1")
+    assert [item.task_id for item in moved] == [pending.task_id]
+    (completed,) = board.get_completed_by_assignee("dev-3")
+    assert completed.task_id == done.task_id
+    assert [item.task_id for item in board.get_all()].count(pending.task_id) == 1
+    stats = board.stats()
+    assert stats["members"]["dev-1"]["pending"] == 1
+    assert stats["total"]["pending"] == 1
+
+
+def test_sharded_activity_ignores_unrelated_shards(tmp_path):
+    board = ShardedFileBoard(os.path.join(tmp_path, "board"), durability=os_buffered)
+    board.set_valid_members(["lead", "dev-1", "dev-2", "qa"])
+    parser = board.assign("lead", "dev-1", "parser", "Build the parser")
+    board.assign("lead", "qa", "tests", "Test it", blocked_by=[parser.task_id])
+    other = board.assign("lead", "dev-2", "docs", "Write the docs")
+    board.assign("lead", "dev-1", "review", "Review", blocked_by=[other.task_id])
+    before = board._activity_signature("qa")
+    board.complete(other.task_id, "dev-2")
+    assert board._activity_signature("qa") == before
+    board.complete(parser.task_id, "dev-1")
+    assert board._activity_signature("qa") != before
+
+
+def test_sharded_board_limit_recounts_only_changed_shards(tmp_path, monkeypatch):
+    path = os.path.join(tmp_path, "board")
+    board = ShardedFileBoard(path, durability=os_buffered, max_pending=10)
+    board.set_valid_members(["lead", "dev-1", "dev-2", "qa"])
+    for member in ["dev-1", "dev-2", "qa"]:
+        board.assign("lead", member, "task", "Some task")
+    board.assign("lead", "dev-1", "more", "More work")
+    ShardedFileBoard(path, durability=os_buffered).assign("lead", "qa", "x", "Other")
+    reads = []
+    for member in ["dev-1", "dev-2", "qa"]:
+        shard = board._shard(member)
+        monkeypatch.setattr(
+            shard,
+            "_read_stories",
+            lambda shard=shard, member=member: reads.append(member)
+            or FileBoard._read_stories(shard),
+        )
+    board.assign("lead", "dev-2", "again", "Again")
+    # The limit only recounts the shard the other board wrote to; the write
+    # then reads its own shard
+    assert reads == ["qa", "dev-2"]
+    assert board.stats()["total"]["pending"] == 6
+
+
+def test_sharded_board_wide_limit_holds_across_threads(tmp_path):
+    board = ShardedFileBoard(
+        os.path.join(tmp_path, "board"), durability=os_buffered, max_pending=3
+    )
+    board.set_valid_members(["lead", "dev-1", "dev-2", "qa"])
+    results = []
+
+    def assign(member):
+        try:
+            results.append(board.assign("lead", member, "task", "Some task"))
+        except QueueFullError:
+            pass
+
+    threads = [
+        threading.Thread(target=assign, args=(member,))
+        for member in ["dev-1", "dev-2", "qa"] * 4
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(results) == 3
+    assert board.stats()["total"]["pending"] == 3
+
+
+def test_sharded_assignment_spills_when_another_process_fills_the_queue(
+    tmp_path, monkeypatch
+):
+    path = os.path.join(tmp_path, "board")
+    roles = {"lead": "orchestrator", "dev-1": "dev", "dev-2": "dev"}
+    board = ShardedFileBoard(path, durability=os_buffered, max_pending_per_member=1)
+    board.set_valid_members(list(roles), roles=roles)
+    other = ShardedFileBoard(path, durability=os_buffered)
+    admit = board._admit
+
+    def admit_then_fill(assignee):
+        admitted = admit(assignee)
+        if not other.get_pending_by_assignee("dev-1"):
+            other.assign("lead", "dev-1", "other", "Written by another process")
+        return admitted
+
+    monkeypatch.setattr(board, "_admit", admit_then_fill)
+    story = board.assign("lead", "dev-1", "task", "Some task")
+    assert story.assignee == "dev-2"
+    assert board.queue_depth("dev-1") == 1
+    assert [item.task_id for item in board.get_pending_by_assignee("dev-2")] == [
+        story.task_id
+    ]
+
+
+def test_task_ids_for_past_times_encode_that_time():
+    new_task_id()
+    past = time.time() - 3600
+    assert task_id_timestamp(new_task_id(past)) == pytest.approx(past, abs=0.001)
+    story = Story("dev-1", "lead", "Old task", created_at=past)
+    assert task_id_timestamp(story.task_id) == pytest.approx(past, abs=0.001)
+
+
+def test_stories_created_together_print_apart():
+    stories = [Story("dev-1", "lead", f"Task {index}") for index in range(3)]
+    assert len({repr(story).split()[0] for story in stories}) == 3
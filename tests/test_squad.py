@@ -0,0 +1,103 @@
+import asyncio
+import os
+from types import SimpleNamespace
+
+import pytest
+from zrb import LLMChatTask
+
+from zrb_squad import Member, Squad, SquadLimiter
+from zrb_squad.board import FileBoard
+
+
+def _squad(name, **options):
+    return Squad(
+        name=name,
+        members=[
+            Member("lead", LLMChatTask(name=f"{name}-lead"), role="orchestrator"),
+            Member("dev", LLMChatTask(name=f"{name}-dev"), role="dev"),
+        ],
+        **options,
+    )
+
+
+def _new_member(name, role):
+    return LLMChatTask(name=f"runtime-{name}")
+
+
+def test_serving_writes_nothing(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    _squad("quiet-squad", member_factory=_new_member).serve()
+    assert os.listdir(tmp_path) == []
+
+
+def test_runtime_members_are_created_on_load(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    _squad("growing-squad", member_factory=_new_member).board.add_member("extra", "dev")
+    squad = _squad("growing-squad", member_factory=_new_member)
+    squad.serve()
+    assert [member.name for member in squad.members] == ["lead", "dev", "extra"]
+    assert squad.board.members() == {
+        "lead": "orchestrator",
+        "dev": "dev",
+        "extra": "dev",
+    }
+
+
+def test_llm_limiter_state_is_kept_next_to_the_board(tmp_path):
+    limiter = SquadLimiter(max_request_per_minute=60)
+    lead = limiter.for_member("lead", "orchestrator")
+    squad = Squad(
+        name="limited-squad",
+        members=[
+            Member("lead", LLMChatTask(name="limited-lead", llm_limitter=lead)),
+        ],
+        board=FileBoard(os.path.join(tmp_path, "board.json")),
+        llm_limiter=limiter,
+    )
+    squad.serve()
+    asyncio.run(lead.acquire("Plan the release"))
+    lead.release()
+    assert os.path.exists(os.path.join(tmp_path, "board.llm.json"))
+    assert limiter.stats()["members"]["lead"]["requests"] == 1
+
+
+def test_legacy_board_is_kept_while_it_exists(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    legacy = FileBoard("zrb_squad_board.json")
+    story = legacy.assign("lead", "dev", "build", "Build the parser")
+    squad = _squad("upgraded-squad")
+    assert [item.task_id for item in squad.board.get_all()] == [story.task_id]
+    assert not os.path.exists("zrb_squad_boards")
+
+
+def test_member_tasks_change_the_board_in_their_actions(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    squad = _squad("changing-squad", member_factory=_new_member)
+    squad.serve()
+    squad._create_add_member_task().run(str_kwargs={"name": "erin", "role": "dev"})
+    story = squad.board.assign("lead", "erin", "build", "Build the parser")
+    # Rendering the pane script only reads the roster
+    ctx = SimpleNamespace(input=SimpleNamespace(name="erin"))
+    assert "kill-pane" in squad._build_close_member_pane_script(ctx)
+    assert "erin" in squad.board.members()
+    squad._create_remove_member_task().run(str_kwargs={"name": "erin"})
+    assert "erin" not in squad.board.members()
+    assert [item.task_id for item in squad.board.get_pending_by_assignee("dev")] == [
+        story.task_id
+    ]
+
+
+def test_member_names_are_checked_before_they_reach_the_shell(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    squad = _squad("careful-squad", member_factory=_new_member)
+    squad.serve()
+    for name, role in [
+        ('x"; touch pwned; "', ""),
+        ("$(touch pwned)", ""),
+        ("ok", "a b"),
+    ]:
+        with pytest.raises(Exception):
+            squad._create_add_member_task().run(str_kwargs={"name": name, "role": role})
+    assert list(squad.board.members()) == ["lead", "dev"]
+    assert "'$(touch pwned)'" in squad._build_kill_member_pane_command("$(touch pwned)")
+    assert not os.path.exists("pwned")
@@ -0,0 +1,349 @@
+import asyncio
+import fcntl
+import json
+import os
+import subprocess
+import sys
+import threading
+
+import pytest
+
+from zrb_squad.board import (
+    Durability,
+    FileBoard,
+    NamespacedBoard,
+    ResponseCache,
+    ShardedFileBoard,
+    fsync_every_write,
+    group_commit,
+    os_buffered,
+)
+from zrb_squad.board.digest import build_digest
+from zrb_squad.board.poll_stream import PollPolicy, to_adaptive_stream
+from zrb_squad.board.rwlock import ReadWriteLock
+from zrb_squad.dashboard import BoardDashboard
+
+
+def test_durability_parse():
+    assert Durability.parse("os_buffered") == os_buffered
+    assert Durability.parse("fsync_every_write") == fsync_every_write
+    assert Durability.parse("group_commit:20") == group_commit(20)
+    with pytest.raises(ValueError):
+        Durability.parse("sometimes")
+
+
+def test_group_commit_flushes(tmp_path):
+    board = FileBoard(os.path.join(tmp_path, "board.json"), durability=group_commit(5))
+    board.assign("lead", "dev-1", "build", "Build the parser")
+    board.flush()
+    assert len(FileBoard(os.path.join(tmp_path, "board.json")).get_all()) == 1
+
+
+def test_digest_stays_within_budget():
+    entries = [(f"[task-{i}] from lead", "word " * 200) for i in range(20)]
+    digest = build_digest("New tasks:", entries, 100, "call list_my_tasks")
+    assert len(digest) <= 100 * 4 + 200
+    assert digest.startswith("New tasks:\n- [task-0] from lead: ")
+    assert "more, call list_my_tasks" in digest
+
+
+def test_new_task_trigger_digest(tmp_path):
+    board = FileBoard(os.path.join(tmp_path, "board.json"), durability=os_buffered)
+    board.set_valid_members(["lead", "dev-1"])
+    story = board.assign("lead", "dev-1", "build", "Build the parser")
+    digest = board._format_new_tasks_digest([story])
+    assert story.task_id in digest
+    assert "Build the parser" in digest
+
+
+def test_response_cache(tmp_path):
+    cache = ResponseCache(os.path.join(tmp_path, "responses.json"))
+    key = cache.make_key("dev", "Build the parser.", [])
+    assert cache.make_key("dev", "  build the   PARSER", []) == key
+    assert cache.make_key("qa", "Build the parser", []) != key
+    assert cache.get(key) is None
+    cache.put(key, "done")
+    assert cache.get(key) == "done"
+    assert ResponseCache(cache.file_path).get(key) == "done"
+
+
+def test_response_cache_expires(tmp_path):
+    cache = ResponseCache(os.path.join(tmp_path, "responses.json"), ttl=-1)
+    key = cache.make_key("dev", "Build the parser", [])
+    cache.put(key, "done")
+    assert cache.get(key) is None
+
+
+def test_response_cache_is_offered_for_identical_tasks(tmp_path):
+    board = FileBoard(os.path.join(tmp_path, "board.json"), durability=os_buffered)
+    board.set_valid_members(["lead", "dev-1"], roles={"dev-1": "dev"})
+    board.set_response_cache(ResponseCache(os.path.join(tmp_path, "cache.json")))
+    first = board.assign("lead", "dev-1", "build", "Build the parser")
+    board.complete(first.task_id, "dev-1", result="parser.py written")
+    second = board.assign("lead", "dev-1", "build", "Build the parser")
+    assert "parser.py written" in board._format_new_tasks_digest([second])
+    # Re-plans mention other task IDs, which are not part of the key
+    board.complete(
+        board.assign("lead", "dev-1", "docs", f"Document {first.task_id}").task_id,
+        "dev-1",
+        result="docs written",
+    )
+    third = board.assign("lead", "dev-1", "docs", f"Document {second.task_id}")
+    assert "docs written" in board._format_new_tasks_digest([third])
+
+
+def test_namespaces_are_separate(tmp_path):
+    host = NamespacedBoard(os.path.join(tmp_path, "boards"), durability=os_buffered)
+    dev, qa = host.namespace("dev-team"), host.namespace("qa-team")
+    dev.assign("lead", "dev-1", "build", "Build the parser")
+    assert len(dev.get_all()) == 1
+    assert qa.get_all() == []
+    assert host.namespaces() == ["dev-team", "qa-team"]
+    sharded = NamespacedBoard(os.path.join(tmp_path, "sharded"), sharded=True)
+    assert isinstance(sharded.namespace("dev-team"), ShardedFileBoard)
+
+
+def test_namespaces_with_similar_names_get_their_own_directories(tmp_path):
+    path = os.path.join(tmp_path, "boards")
+    host = NamespacedBoard(path, durability=os_buffered)
+    boards = [host.namespace(name) for name in ["my squad", "my/squad", "my_squad"]]
+    boards[0].assign("lead", "dev-1", "build", "Build the parser")
+    assert [len(board.get_all()) for board in boards] == [1, 0, 0]
+    assert len({board.file_path for board in boards}) == 3
+    reopened = NamespacedBoard(path, durability=os_buffered).namespace("my squad")
+    assert reopened.file_path == boards[0].file_path
+    # Directories recorded by earlier versions are kept, and never shared
+    old_path = os.path.join(tmp_path, "old-boards")
+    os.makedirs(old_path)
+    with open(os.path.join(old_path, "namespaces.json"), "w") as f:
+        json.dump({"old squad": {"directory": "old_squad"}}, f)
+    old_host = NamespacedBoard(old_path, durability=os_buffered)
+    assert old_host.namespace("old squad").file_path == os.path.join(
+        old_path, "old_squad", "board.json"
+    )
+    with pytest.raises(ValueError):
+        old_host.namespace("old_squad")
+
+
+def test_poll_stream_skips_checks_while_the_board_is_quiet():
+    calls = []
+    fingerprint = [0]
+
+    def check():
+        calls.append(fingerprint[0])
+        return "new task" if fingerprint[0] == 2 else ""
+
+    policy = PollPolicy(min_interval=0.01, max_interval=0.02, debounce=0)
+    stream = to_adaptive_stream(check, policy, activity=lambda: fingerprint[0])
+
+    async def run():
+        iterator = stream().__aiter__()
+        task = asyncio.ensure_future(iterator.__anext__())
+        await asyncio.sleep(0.1)
+        assert calls == [0]
+        fingerprint[0] = 2
+        return await asyncio.wait_for(task, 1)
+
+    assert asyncio.run(run()) == "new task"
+
+
+def test_read_write_lock():
+    lock = ReadWriteLock()
+    events = []
+    with lock.read():
+        with lock.read():
+            pass
+        with pytest.raises(RuntimeError):
+            with lock.write():
+                pass
+    with lock.write():
+        with lock.read():
+            with lock.write():
+                events.append("nested")
+
+    def writer():
+        with lock.write():
+            events.append("writer")
+
+    with lock.read():
+        thread = threading.Thread(target=writer)
+        thread.start()
+        thread.join(0.05)
+        assert "writer" not in events
+    thread.join(1)
+    assert events == ["nested", "writer"]
+
+
+def test_board_is_safe_to_share_between_threads(tmp_path):
+    board = FileBoard(os.path.join(tmp_path, "board.json"), durability=os_buffered)
+    board.set_valid_members(["lead", "dev-1", "dev-2"])
+    errors = []
+
+    def work(member):
+        try:
+            for i in range(20):
+                story = board.assign("lead", member, f"t{i}", "Some task")
+                board.append_note(story.task_id, "note")
+                board.search("task")
+                board.queue_depth(member)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=work, args=(m,)) for m in ["dev-1", "dev-2"]]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert errors == []
+    stories = board.get_all()
+    assert len(stories) == 40
+    assert all(len(story.notes) == 1 for story in stories)
+    assert board.queue_depth("dev-1") == board.queue_depth("dev-2") == 20
+
+
+def test_importing_the_package_is_side_effect_free(tmp_path):
+    code = (
+        "import sys, zrb_squad\n"
+        "from zrb_squad import Squad\n"
+        "assert 'zrb_squad.board.file_board' not in sys.modules\n"
+    )
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=tmp_path,
+        env={**os.environ, "PYTHONPATH": root},
+        check=True,
+    )
+    assert os.listdir(tmp_path) == []
+
+
+def test_stats_do_not_wait_for_writers(tmp_path):
+    path = os.path.join(tmp_path, "board.json")
+    board = FileBoard(path, durability=os_buffered)
+    board.assign("lead", "dev-1", "build", "Build the parser")
+    results = []
+    with open(path + ".lock", "w") as lock_file:
+        # Another process is in the middle of a write
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        reader = FileBoard(path)
+        thread = threading.Thread(target=lambda: results.append(reader.stats()))
+        thread.start()
+        thread.join(1)
+        assert results and results[0]["total"]["pending"] == 1
+        fcntl.flock(lock_file, fcntl.LOCK_UN)
+    os.remove(path + ".stats.json")
+    assert FileBoard(path).stats()["total"]["pending"] == 1
+
+
+def test_response_cache_hits_do_not_rewrite_the_file(tmp_path):
+    cache = ResponseCache(os.path.join(tmp_path, "responses.json"))
+    key = cache.make_key("dev", "Build the parser", [])
+    cache.put(key, "done")
+    before = os.stat(cache.file_path).st_mtime_ns
+    for _ in range(3):
+        assert cache.get(key) == "done"
+    assert os.stat(cache.file_path).st_mtime_ns == before
+
+
+def test_response_cache_keeps_hashes_that_are_not_task_ids(tmp_path):
+    make_key = ResponseCache.make_key
+    first = make_key("dev", "Check build 0123456789abcdef", [])
+    assert make_key("dev", "Check build 0fedcba987654321", []) != first
+    assert make_key(
+        "dev", "Check build 0123456789abcdef", [], ["0123456789abcdef"]
+    ) == (make_key("dev", "Check build 0fedcba987654321", [], ["0fedcba987654321"]))
+
+
+def test_new_task_digest_keys_every_task_with_one_read(tmp_path, monkeypatch):
+    board = FileBoard(os.path.join(tmp_path, "board.json"), durability=os_buffered)
+    board.set_valid_members(["lead", "dev-1"], roles={"dev-1": "dev"})
+    board.set_response_cache(ResponseCache(os.path.join(tmp_path, "cache.json")))
+    parser = board.assign("lead", "dev-1", "parser", "Build the parser")
+    tasks = [
+        board.assign("lead", "dev-1", f"t{i}", "Use it", blocked_by=[parser.task_id])
+        for i in range(5)
+    ]
+    reads = []
+    read_stories = board._read_stories
+    monkeypatch.setattr(
+        board, "_read_stories", lambda: reads.append(1) or read_stories()
+    )
+    board._format_new_tasks_digest(tasks)
+    assert len(reads) == 1
+
+
+def test_poll_stream_keeps_comparing_fingerprints_quickly():
+    fingerprints = []
+    policy = PollPolicy(min_interval=0.01, max_interval=10, debounce=0)
+    stream = to_adaptive_stream(
+        lambda: "", policy, activity=lambda: fingerprints.append(1)
+    )
+
+    async def run():
+        task = asyncio.ensure_future(stream().__aiter__().__anext__())
+        await asyncio.sleep(0.2)
+        task.cancel()
+
+    asyncio.run(run())
+    # Backing off to max_interval would compare it only a handful of times
+    assert len(fingerprints) > 8
+
+
+def test_dashboard_follows_the_journal(make_board):
+    board = make_board()
+    story = board.assign("lead", "dev-1", "build", "Build the parser")
+    dashboard = BoardDashboard(board)
+    assert dashboard.refresh()
+    assert not dashboard.refresh()
+    board.assign("lead", "qa", "test", "Test the parser")
+    board.complete(story.task_id, "dev-1")
+    assert dashboard.refresh()
+    rows = {
+        line.split()[0]: line.split()[1:3]
+        for line in dashboard.render().split("\n")[1:5]
+    }
+    assert rows["dev-1"] == ["0", "1"]
+    assert rows["qa"] == ["1", "0"]
+
+
+def _dashboard_rows(dashboard):
+    return {
+        line.split()[0]: line.split()[1:3]
+        for line in dashboard.render().split("\n")[1:]
+        if line and not line.startswith(" ") and line != "Oldest pending:"
+    }
+
+
+@pytest.mark.parametrize("refresh_before_move", [True, False])
+def test_dashboard_keeps_stories_moved_between_shards(tmp_path, refresh_before_move):
+    board = ShardedFileBoard(os.path.join(tmp_path, "board"), durability=os_buffered)
+    roles = {"lead": "orchestrator", "a-dev": "dev", "z-dev": "dev"}
+    board.set_valid_members(list(roles), roles=roles)
+    dashboard = BoardDashboard(board)
+    dashboard.refresh()
+    board.assign("lead", "a-dev", "first", "First task")
+    story = board.assign("lead", "z-dev", "second", "Second task")
+    if refresh_before_move:
+        dashboard.refresh()
+    board.compare_and_update(story.task_id, 1, {"assignee": "a-dev"})
+    dashboard.refresh()
+    assert _dashboard_rows(dashboard)["a-dev"] == ["2", "0"]
+    assert _dashboard_rows(dashboard)["z-dev"] == ["0", "0"]
+    board.assign("lead", "z-dev", "third", "Third task")
+    dashboard.refresh()
+    board.remove_member("z-dev", reroute_to="a-dev")
+    dashboard.refresh()
+    assert _dashboard_rows(dashboard)["a-dev"] == ["3", "0"]
+
+
+def test_dashboard_forgets_cleared_completions(make_board):
+    board = make_board()
+    story = board.assign("lead", "dev-1", "build", "Build the parser")
+    board.complete(story.task_id, "dev-1")
+    dashboard = BoardDashboard(board)
+    dashboard.refresh()
+    assert _dashboard_rows(dashboard)["dev-1"] == ["0", "1"]
+    board.clear_completed("dev-1")
+    dashboard.refresh()
+    assert _dashboard_rows(dashboard)["dev-1"] == ["0", "0"]
+    assert _dashboard_rows(dashboard)["total"] == ["0", "0"]
@@ -13,6 +13,7 @@ dev_squad = Squad(
     members=[
         Member(
             name="alice",
+            role="orchestrator",
             chat_task=LLMChatTask(
                 name="manager",
                 ui_ascii_art="hello-kitty",
@@ -27,7 +28,9 @@ dev_squad = Squad(
                             "- Once requirement is clear, ask bob (The Planner) to create plan\n"
                             "- Bob will come up with plan, If you are okay with it, assign charlie and diaz\n"
                             "- If you are not okay with the plan, ask bob to revise the plan and get assign back to you for approval\n"
-                            "- When assigning tasks to charlie and diaz, be mindful, one task at a time for each of them\n"
+                            "- When assigning tasks to charlie and diaz, submit the whole plan up front; "
+                            "use `blocked_by` with the IDs of earlier tasks when a task depends on them, "
+                            "so independent tasks can run in parallel\n"
                         )
                     ],
                 ),
@@ -37,6 +40,7 @@ dev_squad = Squad(
         ),
         Member(
             name="bob",
+            role="planner",
             chat_task=LLMChatTask(
                 name="techlead",
                 ui_ascii_art="clover",
@@ -60,6 +64,7 @@ dev_squad = Squad(
         ),
         Member(
             name="charlie",
+            role="executor",
             chat_task=LLMChatTask(
                 name="coder",
                 ui_ascii_art="batman",
@@ -81,6 +86,7 @@ dev_squad = Squad(
         ),
         Member(
             name="diaz",
+            role="executor",
             chat_task=LLMChatTask(
                 name="documenter",
                 ui_ascii_art="cat",
@@ -2,7 +2,61 @@
 Zrb Squad - Multi-agent workflow extension for zrb
 """
 
-from .board import AnyBoard, FileBoard, Story, create_board
-from .squad import Member, Squad
+import importlib
+from typing import TYPE_CHECKING, Any
 
-__all__ = ["Squad", "Member", "Story", "AnyBoard", "FileBoard", "create_board"]
+if TYPE_CHECKING:
+    from .board import (
+        AnyBoard,
+        FileBoard,
+        NamespacedBoard,
+        ShardedFileBoard,
+        Story,
+        create_board,
+        create_namespaced_board,
+        create_sharded_board,
+    )
+    from .llm_limiter import SquadLimiter
+    from .squad import Member, Squad
+
+# Submodules are imported on first attribute access, so importing zrb_squad
+# (e.g., from zrb_init.py on every zrb command) stays cheap
+_LAZY_ATTRIBUTES = {
+    "Squad": ".squad",
+    "Member": ".squad",
+    "SquadLimiter": ".llm_limiter",
+    "Story": ".board",
+    "AnyBoard": ".board",
+    "FileBoard": ".board",
+    "ShardedFileBoard": ".board",
+    "NamespacedBoard": ".board",
+    "create_board": ".board",
+    "create_sharded_board": ".board",
+    "create_namespaced_board": ".board",
+}
+
+__all__ = [
+    "Squad",
+    "Member",
+    "SquadLimiter",
+    "Story",
+    "AnyBoard",
+    "FileBoard",
+    "ShardedFileBoard",
+    "NamespacedBoard",
+    "create_board",
+    "create_sharded_board",
+    "create_namespaced_board",
+]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + __all__)
@@ -2,9 +2,68 @@
 Board package for zrb_squad - provides kanban board functionality for squad members.
 """
 
-from .any_board import AnyBoard
-from .factory import create_board
-from .file_board import FileBoard
-from .story import Story
+import importlib
+from typing import TYPE_CHECKING, Any
 
-__all__ = ["Story", "AnyBoard", "FileBoard", "create_board"]
+if TYPE_CHECKING:
+    from .any_board import AnyBoard
+    from .durability import Durability, fsync_every_write, group_commit, os_buffered
+    from .factory import create_board, create_namespaced_board, create_sharded_board
+    from .file_board import FileBoard, QueueFullError, VersionConflictError
+    from .namespaced_board import NamespacedBoard
+    from .response_cache import ResponseCache
+    from .sharded_file_board import ShardedFileBoard
+    from .story import Story, new_task_id, task_id_timestamp
+
+# Implementations (and fcntl) are only imported when they are first used
+_LAZY_ATTRIBUTES = {
+    "Story": ".story",
+    "new_task_id": ".story",
+    "task_id_timestamp": ".story",
+    "AnyBoard": ".any_board",
+    "Durability": ".durability",
+    "fsync_every_write": ".durability",
+    "group_commit": ".durability",
+    "os_buffered": ".durability",
+    "FileBoard": ".file_board",
+    "QueueFullError": ".file_board",
+    "VersionConflictError": ".file_board",
+    "NamespacedBoard": ".namespaced_board",
+    "ResponseCache": ".response_cache",
+    "ShardedFileBoard": ".sharded_file_board",
+    "create_board": ".factory",
+    "create_sharded_board": ".factory",
+    "create_namespaced_board": ".factory",
+}
+
+__all__ = [
+    "Story",
+    "new_task_id",
+    "task_id_timestamp",
+    "AnyBoard",
+    "Durability",
+    "fsync_every_write",
+    "group_commit",
+    "os_buffered",
+    "FileBoard",
+    "QueueFullError",
+    "VersionConflictError",
+    "NamespacedBoard",
+    "ResponseCache",
+    "ShardedFileBoard",
+    "create_board",
+    "create_sharded_board",
+    "create_namespaced_board",
+]
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_ATTRIBUTES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(list(globals()) + __all__)
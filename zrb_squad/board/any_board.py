@@ -3,10 +3,13 @@ Abstract base class for a kanban board.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Callable, Dict, List
+from typing import TYPE_CHECKING, Any, Callable, Dict, List
 
 from .story import Story
 
+if TYPE_CHECKING:
+    from .response_cache import ResponseCache
+
 
 class AnyBoard(ABC):
     """
@@ -17,22 +20,85 @@ class AnyBoard(ABC):
     """
 
     @abstractmethod
-    def set_valid_members(self, members: list[str]) -> None:
-        """Set the list of valid member names for validation."""
+    def set_valid_members(
+        self, members: list[str], roles: dict[str, str] | None = None
+    ) -> None:
+        """
+        Set the list of valid member names for validation.
+
+        Args:
+            members: Names of the squad members
+            roles: Optional mapping of member name to role, used to route
+                assignments made to `role:<role>`
+        """
+        pass
+
+    def set_response_cache(self, cache: "ResponseCache | None") -> None:
+        """
+        Share results of completed tasks with later, identical tasks.
+
+        Optional: boards that do not support a response cache ignore it.
+
+        Args:
+            cache: The squad's response cache, or None to disable caching
+        """
+        pass
+
+    @abstractmethod
+    def members(self) -> Dict[str, str]:
+        """
+        Get the current squad members, including those added at runtime.
+
+        Returns:
+            Mapping of member name to role ("" for no role)
+        """
+        pass
+
+    @abstractmethod
+    def add_member(self, name: str, role: str = "") -> None:
+        """
+        Add a member to a running squad, for every process using the board.
+
+        Args:
+            name: Name of the new member
+            role: Role used for `role:<role>` assignments
+        """
+        pass
+
+    @abstractmethod
+    def remove_member(self, name: str, reroute_to: str | None = None) -> List[Story]:
+        """
+        Remove a member from a running squad, for every process using the board.
+
+        Args:
+            name: Name of the member to remove
+            reroute_to: Member (or `role:<role>`) that takes over the removed
+                member's incomplete tasks; None leaves them in place
+
+        Returns:
+            The rerouted stories
+        """
         pass
 
     @abstractmethod
     def assign(
-        self, assigner: str, assignee: str, task_name: str, description: str
+        self,
+        assigner: str,
+        assignee: str,
+        task_name: str,
+        description: str,
+        blocked_by: list[str] | None = None,
     ) -> Story:
         """
         Assign a new task to a squad member.
 
         Args:
             assigner: Who is assigning the task
-            assignee: Who the task is assigned to
+            assignee: Who the task is assigned to, or `role:<role>` to route
+                the task to the least loaded member with that role
             task_name: Name/identifier for the task
             description: Detailed description of the task
+            blocked_by: IDs of tasks that must be completed before this one
 
         Returns:
             The created Story object
@@ -66,19 +132,71 @@ class AnyBoard(ABC):
         pass
 
     @abstractmethod
-    def complete(self, task_id: str, assignee: str) -> bool:
+    def complete(self, task_id: str, assignee: str, result: str | None = None) -> bool:
         """
         Mark a task as completed.
 
         Args:
             task_id: The ID of the task to complete
             assignee: The assignee (for verification)
+            result: Optional summary of the outcome for the assigner
 
         Returns:
             True if the task was successfully completed, False otherwise
         """
         pass
 
+    @abstractmethod
+    def compare_and_update(
+        self, task_id: str, expected_version: int, changes: Dict[str, Any]
+    ) -> Story:
+        """
+        Change a story, unless it changed since the writer read it.
+
+        Args:
+            task_id: ID of the story
+            expected_version: `Story.version` the changes are based on
+            changes: New values for "assignee" (a member or `role:<role>`),
+                "description", "blocked_by" and/or "result"
+
+        Returns:
+            The updated story, with its new version
+
+        Raises:
+            VersionConflictError: If the story is at another version
+        """
+        pass
+
+    @abstractmethod
+    def update(self, task_id: str, patch: Dict[str, Any]) -> Story:
+        """
+        Set a story's result and/or metadata without rewriting the board.
+
+        Args:
+            task_id: ID of the story
+            patch: New "result" and/or "metadata" keys to merge (a None
+                value removes the key)
+
+        Returns:
+            The updated story
+        """
+        pass
+
+    @abstractmethod
+    def append_note(self, task_id: str, text: str, author: str = "") -> Story:
+        """
+        Add a progress note to a story without rewriting the board.
+
+        Args:
+            task_id: ID of the story
+            text: The note
+            author: Who wrote the note
+
+        Returns:
+            The updated story
+        """
+        pass
+
     @abstractmethod
     def get_all(self) -> List[Story]:
         """
@@ -89,11 +207,28 @@ class AnyBoard(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_since(self, since: float | str) -> List[Story]:
+        """
+        Get the tasks created after a point in time.
+
+        Args:
+            since: A timestamp, or the ID of a task; only tasks created after
+                it are returned
+
+        Returns:
+            List of Story objects, oldest first
+        """
+        pass
+
     @abstractmethod
     def get_pending_by_assignee(self, assignee: str) -> List[Story]:
         """
         Get pending (incomplete) tasks assigned to a specific squad member.
 
+        Tasks whose dependencies are not completed yet are excluded, so this
+        is the member's ready queue.
+
         Args:
             assignee: The squad member to get pending tasks for
 
@@ -102,6 +237,19 @@ class AnyBoard(ABC):
         """
         pass
 
+    @abstractmethod
+    def get_blocked_by_assignee(self, assignee: str) -> List[Story]:
+        """
+        Get incomplete tasks that are still waiting for their dependencies.
+
+        Args:
+            assignee: The squad member to get blocked tasks for
+
+        Returns:
+            List of blocked Story objects assigned to the member
+        """
+        pass
+
     @abstractmethod
     def get_completed_by_assignee(self, assignee: str) -> List[Story]:
         """
@@ -115,6 +263,32 @@ class AnyBoard(ABC):
         """
         pass
 
+    @abstractmethod
+    def search(self, text: str, limit: int = 10) -> List[Story]:
+        """
+        Full-text search over the descriptions and names of every task.
+
+        Args:
+            text: The query; tasks matching more of its words rank higher
+            limit: Maximum number of results
+
+        Returns:
+            List of matching Story objects, best matches first
+        """
+        pass
+
+    @abstractmethod
+    def stats(self) -> Dict[str, Any]:
+        """
+        Summarize the workload of every member without scanning the board.
+
+        Returns:
+            Dictionary with, per member and for the whole squad, the number
+            of pending and completed tasks, the completions per minute over
+            a recent window and the p50/p95 time-to-complete in seconds
+        """
+        pass
+
     @abstractmethod
     def create_tools(self, agent_name: str) -> List[callable]:
         """
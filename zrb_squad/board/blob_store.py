@@ -0,0 +1,91 @@
+"""
+Content-addressed storage for large story descriptions.
+"""
+
+import hashlib
+import os
+import threading
+import zlib
+from collections import OrderedDict
+
+
+class BlobStore:
+    """
+    Stores text as zlib-compressed blobs named after their SHA-256 digest.
+
+    Identical text is stored once, so a description that is re-assigned on
+    every retry or re-plan only costs a digest in the board file. Blobs are
+    immutable, which makes reads safe without file locks; only the in-memory
+    cache is shared, under a lock, by the threads of a process.
+    """
+
+    def __init__(self, dir_path: str, cache_size: int = 64):
+        """
+        Initialize the blob store.
+
+        Args:
+            dir_path: Directory holding the blobs (created on first write)
+            cache_size: Number of decompressed blobs kept in memory
+        """
+        self.dir_path = os.path.expanduser(dir_path)
+        self._cache: OrderedDict[str, str] = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._cache_size = cache_size
+
+    def _blob_path(self, digest: str) -> str:
+        return os.path.join(self.dir_path, digest[:2], f"{digest}.z")
+
+    def put(self, text: str) -> str:
+        """
+        Store a text and return its digest.
+
+        Args:
+            text: The text to store
+
+        Returns:
+            The SHA-256 hex digest that identifies the text
+        """
+        data = text.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        blob_path = self._blob_path(digest)
+        if not os.path.exists(blob_path):
+            os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+            temp_path = f"{blob_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(temp_path, "wb") as f:
+                f.write(zlib.compress(data))
+                f.flush()
+                os.fsync(f.fileno())
+            # Concurrent writers of the same digest write identical content
+            os.replace(temp_path, blob_path)
+        self._remember(digest, text)
+        return digest
+
+    def get(self, digest: str) -> str:
+        """
+        Load a text by its digest.
+
+        Raises:
+            KeyError: If the blob does not exist or does not match its digest
+        """
+        with self._cache_lock:
+            text = self._cache.get(digest)
+            if text is not None:
+                self._cache.move_to_end(digest)
+                return text
+        try:
+            with open(self._blob_path(digest), "rb") as f:
+                data = zlib.decompress(f.read())
+        except (OSError, zlib.error) as e:
+            raise KeyError(f"Blob {digest} could not be read: {e}")
+        if hashlib.sha256(data).hexdigest() != digest:
+            raise KeyError(f"Blob {digest} is corrupted")
+        text = data.decode("utf-8")
+        self._remember(digest, text)
+        return text
+
+    def _remember(self, digest: str, text: str) -> None:
+        with self._cache_lock:
+            self._cache[digest] = text
+            self._cache.move_to_end(digest)
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
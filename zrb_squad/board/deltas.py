@@ -0,0 +1,136 @@
+"""
+Small per-story changes appended next to the board instead of rewriting it.
+"""
+
+import json
+import os
+from typing import Dict, List
+
+from .story import Story
+
+NOTE_DELTA = "note"
+PATCH_DELTA = "patch"
+# Fields a patch may set
+PATCHABLE_FIELDS = ("result", "metadata")
+# Size of the log at which it is folded into the board file
+FOLD_THRESHOLD_BYTES = 64 * 1024
+
+
+class DeltaLog:
+    """
+    Append-only log of progress notes and patches to stories.
+
+    Appending a note costs one short line instead of a rewrite (and fsync) of
+    the whole board. Readers apply the log on top of the board file; the next
+    full write of the board folds the log in and empties it. Applying a
+    record twice has no further effect, so a crash between the fold and the
+    truncation is harmless.
+
+    Layout:
+        <board>.deltas   one JSON record per line
+    """
+
+    def __init__(self, file_path: str):
+        """
+        Initialize the log.
+
+        Args:
+            file_path: Path of the board file the log belongs to
+        """
+        self.file_path = file_path + ".deltas"
+
+    def signature(self) -> tuple:
+        """Return a cheap fingerprint of the log, empty if there is none."""
+        try:
+            stat = os.stat(self.file_path)
+        except OSError:
+            return ()
+        return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+    def size(self) -> int:
+        """Return the size of the log in bytes."""
+        try:
+            return os.path.getsize(self.file_path)
+        except OSError:
+            return 0
+
+    def append(self, record: Dict, fsync: bool) -> None:
+        """
+        Append one record.
+
+        Must be called while holding the board's mutation lock.
+
+        Args:
+            record: The delta, see `apply_deltas`
+            fsync: Make the record durable before returning
+        """
+        with open(self.file_path, "a") as f:
+            f.write(json.dumps(record) + "\n")
+            f.flush()
+            if fsync:
+                os.fsync(f.fileno())
+
+    def read(self) -> List[Dict]:
+        """Read the records, stopping at a torn last line."""
+        records = []
+        try:
+            with open(self.file_path, "r") as f:
+                for line in f:
+                    try:
+                        records.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        break
+        except OSError:
+            pass
+        return records
+
+    def clear(self) -> None:
+        """Drop every record, once they are folded into the board file."""
+        try:
+            os.remove(self.file_path)
+        except FileNotFoundError:
+            pass
+
+    def flush(self) -> None:
+        """Make every appended record durable."""
+        try:
+            fd = os.open(self.file_path, os.O_RDONLY)
+        except FileNotFoundError:
+            return
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+
+def apply_deltas(stories: List[Story], records: List[Dict]) -> None:
+    """
+    Apply delta records to the stories they belong to.
+
+    Records are {"task_id", "op", "version", "data"}, where a "note" carries
+    {"at", "author", "text"} and a "patch" carries the new `result` and/or
+    `metadata` keys (a None metadata value removes the key).
+
+    Args:
+        stories: Stories read from the board file, changed in place
+        records: Records of the delta log, oldest first
+    """
+    if not records:
+        return
+    stories_by_id = {story.task_id: story for story in stories}
+    for record in records:
+        story = stories_by_id.get(record["task_id"])
+        if story is None or story.version >= record["version"]:
+            # Deleted, or already folded into the board file
+            continue
+        if record["op"] == NOTE_DELTA:
+            story.notes.append(record["data"])
+        elif record["op"] == PATCH_DELTA:
+            if "result" in record["data"]:
+                story.result = record["data"]["result"]
+            for key, value in record["data"].get("metadata", {}).items():
+                if value is None:
+                    story.metadata.pop(key, None)
+                else:
+                    story.metadata[key] = value
+        story.version = record["version"]
@@ -0,0 +1,51 @@
+"""
+Token-budgeted digests of stories for trigger notifications.
+"""
+
+from typing import List
+
+# Rough size of a token, good enough to keep notifications within budget
+CHARS_PER_TOKEN = 4
+# Smallest useful share of the budget for a single entry
+MIN_ENTRY_CHARS = 80
+
+
+def shorten(text: str, max_chars: int) -> str:
+    """Cut a text to at most `max_chars` characters, marking the cut."""
+    text = " ".join(text.split())
+    if len(text) <= max_chars:
+        return text
+    return text[: max(0, max_chars - 1)] + "…"
+
+
+def build_digest(
+    header: str, entries: List[tuple[str, str]], token_budget: int, overflow_hint: str
+) -> str:
+    """
+    Build a notification listing several stories within a token budget.
+
+    The budget is shared evenly by the entries. Each entry body is shortened
+    to its share, and entries that no longer fit are summarized in a final
+    line pointing at `overflow_hint`.
+
+    Args:
+        header: First line of the notification
+        entries: (prefix, body) pairs; prefixes (IDs, members) are kept intact
+        token_budget: Approximate maximum size of the digest in tokens
+        overflow_hint: What to do to see the entries that were cut
+
+    Returns:
+        The digest text
+    """
+    budget = token_budget * CHARS_PER_TOKEN - len(header)
+    share = max(MIN_ENTRY_CHARS, budget // max(1, len(entries)))
+    lines = [header]
+    for index, (prefix, body) in enumerate(entries):
+        line = f"- {prefix}: {shorten(body, max(0, share - len(prefix) - 4))}"
+        remaining = len(entries) - index
+        if len(line) > budget and index > 0:
+            lines.append(f"- … and {remaining} more, {overflow_hint}")
+            break
+        lines.append(line)
+        budget -= len(line) + 1
+    return "\n".join(lines)
@@ -0,0 +1,76 @@
+"""
+Durability levels for board writes.
+"""
+
+FSYNC_EVERY_WRITE_MODE = "fsync_every_write"
+GROUP_COMMIT_MODE = "group_commit"
+OS_BUFFERED_MODE = "os_buffered"
+
+
+class Durability:
+    """
+    How a board makes its writes durable.
+
+    Every level writes to a temporary file and atomically renames it over the
+    board, so readers never see a torn file and a crash of the writing process
+    never loses an acknowledged write. The levels differ in what an OS crash
+    or power loss can lose:
+
+    - fsync_every_write: the file and its directory are fsynced before a
+      mutation returns. Nothing acknowledged is lost.
+    - group_commit(window_ms): mutations are visible immediately, and one
+      fsync at the end of each window makes every mutation of the window
+      durable. Up to `window_ms` of acknowledged mutations can be lost.
+    - os_buffered: no fsync at all; the OS writes the file back on its own
+      schedule (about 30 seconds on a default Linux setup). Up to that
+      writeback interval of acknowledged mutations can be lost.
+    """
+
+    def __init__(self, mode: str, window_ms: float = 0.0):
+        """
+        Initialize a durability level.
+
+        Args:
+            mode: One of "fsync_every_write", "group_commit" or "os_buffered"
+            window_ms: Group commit window in milliseconds
+        """
+        if mode not in (FSYNC_EVERY_WRITE_MODE, GROUP_COMMIT_MODE, OS_BUFFERED_MODE):
+            raise ValueError(f"Invalid durability mode '{mode}'")
+        if mode == GROUP_COMMIT_MODE and window_ms <= 0:
+            raise ValueError("Group commit window must be greater than 0 ms")
+        self.mode = mode
+        self.window_ms = window_ms if mode == GROUP_COMMIT_MODE else 0.0
+
+    @classmethod
+    def parse(cls, value: "Durability | str") -> "Durability":
+        """
+        Create a durability level from its name.
+
+        Accepts "fsync_every_write", "os_buffered", "group_commit" (5 ms
+        window) or "group_commit:<window_ms>".
+        """
+        if isinstance(value, Durability):
+            return value
+        mode, _, window = value.partition(":")
+        if mode == GROUP_COMMIT_MODE:
+            return group_commit(float(window) if window else 5.0)
+        return cls(mode)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Durability):
+            return NotImplemented
+        return (self.mode, self.window_ms) == (other.mode, other.window_ms)
+
+    def __repr__(self) -> str:
+        if self.mode == GROUP_COMMIT_MODE:
+            return f"group_commit({self.window_ms:g})"
+        return self.mode
+
+
+def group_commit(window_ms: float = 5.0) -> Durability:
+    """Coalesce the fsyncs of all mutations within `window_ms` into one."""
+    return Durability(GROUP_COMMIT_MODE, window_ms)
+
+
+fsync_every_write = Durability(FSYNC_EVERY_WRITE_MODE)
+os_buffered = Durability(OS_BUFFERED_MODE)
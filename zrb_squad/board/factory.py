@@ -3,17 +3,60 @@ Factory functions for creating board instances.
 """
 
 from .any_board import AnyBoard
+from .durability import Durability, fsync_every_write
 from .file_board import FileBoard
+from .namespaced_board import NamespacedBoard
+from .sharded_file_board import ShardedFileBoard
 
 
-def create_board(file_path: str = "zrb_squad_board.json") -> AnyBoard:
+def create_board(
+    file_path: str = "zrb_squad_board.json",
+    durability: Durability | str = fsync_every_write,
+) -> AnyBoard:
     """
     Create a default file-based board.
 
     Args:
         file_path: Path to the JSON file for storage
+        durability: How writes are made durable
 
     Returns:
         An instance of FileBoard
     """
-    return FileBoard(file_path)
+    return FileBoard(file_path, durability=durability)
+
+
+def create_sharded_board(
+    dir_path: str = "zrb_squad_board",
+    durability: Durability | str = fsync_every_write,
+) -> AnyBoard:
+    """
+    Create a file-based board with one storage file per assignee.
+
+    Args:
+        dir_path: Directory holding the index and the shard files
+        durability: How shard writes are made durable
+
+    Returns:
+        An instance of ShardedFileBoard
+    """
+    return ShardedFileBoard(dir_path, durability=durability)
+
+
+def create_namespaced_board(
+    dir_path: str = "zrb_squad_boards",
+    durability: Durability | str = fsync_every_write,
+    sharded: bool = False,
+) -> NamespacedBoard:
+    """
+    Create a board host that gives every squad its own namespace.
+
+    Args:
+        dir_path: Directory holding one sub-directory per namespace
+        durability: How writes are made durable
+        sharded: Give each namespace one storage file per assignee
+
+    Returns:
+        An instance of NamespacedBoard
+    """
+    return NamespacedBoard(dir_path, sharded=sharded, durability=durability)
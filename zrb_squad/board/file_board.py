@@ -2,108 +2,424 @@
 File-based implementation of the kanban board.
 """
 
+import atexit
+import bisect
 import fcntl  # For file locking to prevent race conditions
 import json
 import os
+import threading
 import time
-from typing import Any, Callable, Dict, List
-
-from zrb import to_infinite_stream
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, Iterator, List
 
 from .any_board import AnyBoard
-from .story import Story
+from .blob_store import BlobStore
+from .deltas import (
+    FOLD_THRESHOLD_BYTES,
+    NOTE_DELTA,
+    PATCH_DELTA,
+    PATCHABLE_FIELDS,
+    DeltaLog,
+    apply_deltas,
+)
+from .digest import MIN_ENTRY_CHARS, build_digest, shorten
+from .durability import (
+    FSYNC_EVERY_WRITE_MODE,
+    GROUP_COMMIT_MODE,
+    Durability,
+    fsync_every_write,
+)
+from .journal import BoardJournal, JournalTail
+from .poll_stream import PollPolicy, to_adaptive_stream
+from .response_cache import ResponseCache, find_task_ids
+from .rwlock import ReadWriteLock
+from .search_index import SearchIndex
+from .stats import ASSIGNED, COMPLETED, REMOVED, BoardStats, summarize
+from .story import Story, task_id_timestamp
+
+ROLE_PREFIX = "role:"
+ROUTE_BY_QUEUE_DEPTH = "queue_depth"
+ROUTE_BY_COMPLETION_TIME = "completion_time"
+OVERFLOW_SPILL = "spill"
+OVERFLOW_REJECT = "reject"
+# Suggested wait when a full queue has no completion history to go by
+DEFAULT_RETRY_AFTER = 30.0
+# Fields `compare_and_update` may change; completion goes through `complete`
+UPDATABLE_FIELDS = ("assignee", "description", "blocked_by", "result")
+# Most recent progress notes shown with a completed task
+NOTES_IN_DIGEST = 3
+
+
+class QueueFullError(RuntimeError):
+    """Raised when an assignment would exceed a pending-task limit."""
+
+    def __init__(self, message: str, retry_after: float, queue_depth: int):
+        """
+        Initialize the error.
+
+        Args:
+            message: What limit was hit
+            retry_after: Suggested seconds to wait before assigning again
+            queue_depth: Pending tasks in the full queue
+        """
+        super().__init__(message)
+        self.retry_after = retry_after
+        self.queue_depth = queue_depth
+
+
+class VersionConflictError(RuntimeError):
+    """Raised when a story changed since the version an update expected."""
+
+    def __init__(self, task_id: str, expected_version: int, version: int | None):
+        """
+        Initialize the error.
+
+        Args:
+            task_id: ID of the story
+            expected_version: Version the writer read
+            version: Current version of the story, None if it moved away
+        """
+        super().__init__(
+            f"Task '{task_id}' changed: expected version {expected_version}, "
+            f"found {version if version is not None else 'a moved story'}"
+        )
+        self.task_id = task_id
+        self.expected_version = expected_version
+        self.version = version
 
 
 class FileBoard(AnyBoard):
     """
     File-based implementation of the kanban board.
 
-    Uses a JSON file for storage with file locking to prevent race conditions
-    when accessed by multiple processes.
+    Uses a JSON file for storage. Writers serialize on a lock file and
+    publish each new version of the board with an atomic rename; readers take
+    no lock, so any number of polling members never slow writers down. The
+    threads of one process may share a board: an in-process reader/writer
+    lock, taken before the file lock, guards its in-memory caches.
     """
 
-    def __init__(self, file_path: str = "zrb_squad_board.json"):
+    def __init__(
+        self,
+        file_path: str = "zrb_squad_board.json",
+        routing: str = ROUTE_BY_QUEUE_DEPTH,
+        durability: Durability | str = fsync_every_write,
+        blob_threshold: int = 1024,
+        blob_dir: str | None = None,
+        poll_policy: PollPolicy | None = None,
+        digest_token_budget: int = 1000,
+        snapshot_interval: int = 100,
+        max_pending_per_member: int | None = None,
+        max_pending: int | None = None,
+        overflow: str = OVERFLOW_SPILL,
+    ):
         """
         Initialize the file-based board.
 
         Args:
             file_path: Path to the JSON file for storage
+            routing: How `role:<role>` assignments pick a member, either
+                "queue_depth" (smallest pending queue) or "completion_time"
+                (shortest estimated time to finish the queue)
+            durability: How writes are made durable, see `Durability` for the
+                crash-loss window of each level
+            blob_threshold: Descriptions longer than this many characters are
+                stored once as compressed, content-addressed blobs
+            blob_dir: Directory for the blobs (defaults to `<file_path>.blobs`)
+            poll_policy: How triggers poll the board (back off while the board
+                is quiet, debounce bursts of notifications)
+            digest_token_budget: Approximate size limit, in tokens, of a
+                trigger notification listing new or completed tasks
+            snapshot_interval: Number of journaled changes between two
+                checksummed snapshots; bounds how much is replayed when a
+                corrupted board file is recovered
+            max_pending_per_member: Most incomplete tasks a member may have;
+                None for no limit
+            max_pending: Most incomplete tasks on the whole board; None for
+                no limit
+            overflow: What happens when the assignee's queue is full, either
+                "spill" (hand the task to the least busy member of the same
+                role that has room, reject if there is none) or "reject"
         """
+        if routing not in (ROUTE_BY_QUEUE_DEPTH, ROUTE_BY_COMPLETION_TIME):
+            raise ValueError(f"Invalid routing strategy '{routing}'")
+        if overflow not in (OVERFLOW_SPILL, OVERFLOW_REJECT):
+            raise ValueError(f"Invalid overflow policy '{overflow}'")
         self.file_path = os.path.expanduser(file_path)
+        self.routing = routing
+        self.durability = Durability.parse(durability)
+        self.blob_threshold = blob_threshold
+        self.poll_policy = poll_policy if poll_policy is not None else PollPolicy()
+        self.digest_token_budget = digest_token_budget
+        self.max_pending_per_member = max_pending_per_member
+        self.max_pending = max_pending
+        self.overflow = overflow
+        self._blob_store = BlobStore(
+            blob_dir if blob_dir is not None else self.file_path + ".blobs"
+        )
+        self.snapshot_interval = snapshot_interval
+        self._open_storage()
+        # Guards the in-memory state below against the other threads of this
+        # process; the file locks only keep other processes out
+        self._lock = ReadWriteLock()
+        # Nesting depth of the mutation lock held by this board
+        self._mutation_depth = 0
+        self._mutation_lock_file = None
+        self._group_commit_lock = threading.Lock()
+        self._group_commit_timer: threading.Timer | None = None
+        self._is_flush_registered = False
         self._valid_members: list[str] = []
-        self._ensure_file_exists()
+        self._member_roles: dict[str, str] = {}
+        # Members given by the squad definition; the roster file records the
+        # members added or removed at runtime on top of them
+        self._declared_members: list[str] = []
+        self._declared_roles: dict[str, str] = {}
+        self._roster_path = self.file_path + ".members.json"
+        self._roster_signature: tuple | None = None
+        # Queue-depth counters, kept in sync with our own writes and only
+        # recounted when another process has changed the file
+        self._queue_depths: dict[str, int] = {}
+        self._completion_totals: dict[str, tuple[int, float]] = {}
+        self._queue_depths_signature: tuple | None = None
+        self._response_cache: ResponseCache | None = None
+        self._search_index = SearchIndex()
+        self._search_index_signature: tuple | None = None
+        # Stories in creation order, for range scans by time or ID
+        self._ordered_stories: List[Story] = []
+        self._ordered_keys: List[tuple[float, str]] = []
+        self._ordered_positions: Dict[str, int] = {}
+        self._ordered_signature: tuple | None = None
+        # The storage file is created on the first write, so constructing a
+        # board never touches the disk
+
+    def _open_storage(self) -> None:
+        """Set up the journal, delta log and running aggregates of the file."""
+        self._journal = BoardJournal(
+            self.file_path, self.durability, self.snapshot_interval
+        )
+        self._deltas = DeltaLog(self.file_path)
+        self._stats = BoardStats(self.file_path)
 
-    def set_valid_members(self, members: list[str]) -> None:
+    def set_valid_members(
+        self, members: list[str], roles: dict[str, str] | None = None
+    ) -> None:
         """Set the list of valid member names for validation."""
-        self._valid_members = members
+        with self._lock.write():
+            self._declared_members = list(members)
+            self._declared_roles = dict(roles) if roles else {}
+            self._roster_signature = None
+            self._sync_members(force=True)
+
+    def members(self) -> Dict[str, str]:
+        """Get the current members and their roles ("" for no role)."""
+        self._sync_members()
+        with self._lock.read():
+            return {
+                member: self._member_roles.get(member, "")
+                for member in self._valid_members
+            }
 
-    def _ensure_file_exists(self) -> None:
-        """Ensure the storage file exists with proper permissions."""
-        if not os.path.exists(self.file_path):
-            with open(self.file_path, "w") as f:
-                json.dump([], f)
-            os.chmod(self.file_path, 0o644)  # Read/write for owner, read for others
+    def add_member(self, name: str, role: str = "") -> None:
+        """
+        Add a member at runtime, for every process using the board.
 
-    def _acquire_lock(self, file_obj) -> bool:
+        Args:
+            name: Name of the new member
+            role: Role used for `role:<role>` assignments
         """
-        Acquire an exclusive lock on the file.
+
+        def add(roster: Dict[str, Any]) -> None:
+            roster["removed"] = [
+                member for member in roster["removed"] if member != name
+            ]
+            roster["added"][name] = role
+
+        self._update_roster(add)
+
+    def remove_member(self, name: str, reroute_to: str | None = None) -> List[Story]:
+        """
+        Remove a member at runtime, for every process using the board.
 
         Args:
-            file_obj: The file object to lock
+            name: Name of the member to remove
+            reroute_to: Member (or `role:<role>`) that takes over the removed
+                member's incomplete tasks; None leaves them in place
 
         Returns:
-            True if lock was acquired, False otherwise
+            The rerouted stories
+        """
+        if name not in self.members():
+            raise ValueError(f"Unknown member '{name}'")
+
+        def remove(roster: Dict[str, Any]) -> None:
+            roster["added"].pop(name, None)
+            if name not in roster["removed"]:
+                roster["removed"].append(name)
+
+        self._update_roster(remove)
+        if reroute_to is None:
+            return []
+        return self.reassign_pending(name, reroute_to)
+
+    def reassign_pending(self, from_member: str, to: str) -> List[Story]:
         """
+        Hand every incomplete task of a member to another member.
+
+        Pending-task limits do not apply, so no task is dropped.
+
+        Args:
+            from_member: Member whose incomplete tasks are moved
+            to: Member taking them over, or `role:<role>` to spread them over
+                the least busy members of that role
+
+        Returns:
+            The moved stories
+        """
+        with self._mutation_lock():
+            stories = self._read_stories()
+            self._sync_queue_depths(stories)
+            moved = []
+            stats_changes = []
+            for story in stories:
+                if story.assignee != from_member or story.is_completed:
+                    continue
+                target = self._reroute_target(to)
+                story.assignee = target
+                story.version += 1
+                # Route the next story with this one counted
+                self._queue_depths[from_member] = max(
+                    0, self._queue_depths.get(from_member, 0) - 1
+                )
+                self._queue_depths[target] = self._queue_depths.get(target, 0) + 1
+                moved.append(story)
+                stats_changes += [(REMOVED, from_member), (ASSIGNED, target)]
+            if moved:
+                self._commit(stories, upserts=moved, stats_changes=stats_changes)
+                self._update_queue_depths({})
+        return moved
+
+    def _reroute_target(self, to: str) -> str:
+        """Resolve the member taking over a rerouted task."""
+        self._sync_members()
+        if to.startswith(ROLE_PREFIX):
+            return self._route_to_role(to[len(ROLE_PREFIX) :])
+        if self._valid_members and to not in self._valid_members:
+            raise ValueError(
+                f"Invalid assignee '{to}'. "
+                f"Must be one of: {', '.join(self._valid_members)}"
+            )
+        return to
+
+    def _read_roster(self) -> Dict[str, Any]:
+        try:
+            with open(self._roster_path, "r") as f:
+                roster = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            roster = {}
+        roster.setdefault("added", {})
+        roster.setdefault("removed", [])
+        return roster
+
+    def _update_roster(self, change: Callable[[Dict[str, Any]], None]) -> None:
+        """Apply a change to the roster file under its own lock."""
+        dir_path = os.path.dirname(self._roster_path)
+        if dir_path:
+            os.makedirs(dir_path, exist_ok=True)
+        with open(self._roster_path + ".lock", "w") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                # Re-read under the lock so concurrent changes are not lost
+                roster = self._read_roster()
+                change(roster)
+                temp_path = self._roster_path + ".tmp"
+                with open(temp_path, "w") as f:
+                    json.dump(roster, f, indent=2)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(temp_path, self._roster_path)
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+        self._sync_members(force=True)
+
+    def _sync_members(self, force: bool = False) -> None:
+        """Apply the members added or removed at runtime, by any process."""
         try:
-            fcntl.flock(file_obj, fcntl.LOCK_EX | fcntl.LOCK_NB)
-            return True
-        except BlockingIOError:
-            return False
+            stat = os.stat(self._roster_path)
+            signature = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            signature = None
+        if not force and signature == self._roster_signature:
+            return
+        with self._lock.write():
+            roster = self._read_roster()
+            removed = set(roster["removed"])
+            members = [
+                member for member in self._declared_members if member not in removed
+            ]
+            roles = {
+                member: role
+                for member, role in self._declared_roles.items()
+                if member not in removed
+            }
+            for member, role in roster["added"].items():
+                if member not in members:
+                    members.append(member)
+                if role:
+                    roles[member] = role
+                else:
+                    roles.pop(member, None)
+            self._valid_members = members
+            self._member_roles = roles
+            self._roster_signature = signature
+
+    def set_response_cache(self, cache: ResponseCache | None) -> None:
+        """Share results of completed tasks with later, identical tasks."""
+        self._response_cache = cache
 
     def _release_lock(self, file_obj) -> None:
         """Release the lock on the file."""
         fcntl.flock(file_obj, fcntl.LOCK_UN)
 
     def _read_stories(self) -> List[Story]:
-        """Read all stories from the file with locking."""
+        """
+        Read all stories from the file, without taking any lock.
+
+        Writers never change a published board file: every write publishes a
+        complete new file with an atomic rename (see `_write_stories`), so an
+        open file is an immutable, consistent version of the board, and a
+        new version shows up as a new signature. Polling readers therefore
+        never wait for writers, and writers never wait for readers.
+        """
         max_retries = 10
         retry_delay = 0.1  # seconds
 
         for attempt in range(max_retries):
+            signature = self._file_signature()
             try:
                 # Check if file exists and has content
-                if (
-                    not os.path.exists(self.file_path)
-                    or os.path.getsize(self.file_path) == 0
-                ):
+                if signature is None:
+                    return []
+                if signature[2] == 0:
+                    # An empty file is a new board, unless a crash truncated it
+                    if self._journal.has_history():
+                        return self._recover_stories(signature)
                     return []
 
-                with open(self.file_path, "r") as f:
-                    if self._acquire_lock(f):
-                        try:
-                            data = json.load(f)
-                            return [Story.from_dict(item) for item in data]
-                        finally:
-                            self._release_lock(f)
-                    else:
-                        if attempt < max_retries - 1:
-                            time.sleep(retry_delay)
-                            continue
-                        raise RuntimeError(
-                            f"Could not acquire lock on {self.file_path} after {max_retries} attempts"
-                        )
+                with open(self.file_path, "rb") as f:
+                    data = json.loads(f.read())
+                stories = [Story.from_dict(item, self._blob_store.get) for item in data]
+                apply_deltas(stories, self._deltas.read())
+                # A newer version was published while we read: the delta log
+                # may no longer match the file we read, so read again
+                if attempt < max_retries - 1 and self._file_signature() != signature:
+                    continue
+                return stories
             except json.JSONDecodeError as e:
-                # If the file contains invalid JSON, log and return empty list
-                if attempt < max_retries - 1:
-                    time.sleep(retry_delay)
+                # Writes replace the file atomically, so invalid JSON means
+                # corruption unless the file was replaced while we read it
+                if attempt < max_retries - 1 and self._file_signature() != signature:
                     continue
-                # Try to backup the corrupted file and start fresh
-                backup_path = self.file_path + ".corrupted"
-                try:
-                    os.rename(self.file_path, backup_path)
-                except OSError:
-                    pass
-                return []
+                return self._recover_stories(signature)
             except IOError as e:
                 if attempt < max_retries - 1:
                     time.sleep(retry_delay)
@@ -112,8 +428,102 @@ class FileBoard(AnyBoard):
 
         return []  # Should never reach here
 
+    def _recover_stories(self, signature: tuple | None) -> List[Story]:
+        """
+        Restore a corrupted board file from its snapshot and journal.
+
+        The corrupted file is kept as `<file_path>.corrupted` for inspection.
+
+        Args:
+            signature: Signature of the corrupted file
+        """
+        with self._mutation_lock():
+            if self._file_signature() != signature:
+                # Another process recovered or rewrote the file while we waited
+                return self._read_stories()
+            data = self._journal.recover() if self._journal.has_history() else []
+            try:
+                os.replace(self.file_path, self.file_path + ".corrupted")
+            except OSError:
+                pass
+            stories = [Story.from_dict(item, self._blob_store.get) for item in data]
+            apply_deltas(stories, self._deltas.read())
+            self._write_stories(stories)
+            return stories
+
+    @contextmanager
+    def _mutation_lock(self) -> Iterator[None]:
+        """
+        Serialize read-modify-write cycles across threads and processes.
+
+        The in-process write lock is taken first, so only one thread of this
+        process ever waits on the file lock, and the file lock's nesting depth
+        is only touched by the thread holding both. The lock is re-entrant,
+        so a mutation may call helpers that lock too.
+        """
+        with self._lock.write():
+            if self._mutation_depth == 0:
+                dir_path = os.path.dirname(self.file_path)
+                if dir_path:
+                    os.makedirs(dir_path, exist_ok=True)
+                self._mutation_lock_file = open(self.file_path + ".lock", "w")
+                fcntl.flock(self._mutation_lock_file, fcntl.LOCK_EX)
+            self._mutation_depth += 1
+            try:
+                yield
+            finally:
+                self._mutation_depth -= 1
+                if self._mutation_depth == 0:
+                    self._release_lock(self._mutation_lock_file)
+                    self._mutation_lock_file.close()
+                    self._mutation_lock_file = None
+
+    def _commit(
+        self,
+        stories: List[Story],
+        upserts: Iterable[Story] = (),
+        deletes: Iterable[str] = (),
+        stats_changes: Iterable[tuple] = (),
+    ) -> None:
+        """
+        Journal a mutation, write the resulting board and update the stats.
+
+        Must be called while holding the mutation lock.
+
+        Args:
+            stories: Every story on the board after the mutation
+            upserts: Stories created or changed by the mutation
+            deletes: IDs of stories removed by the mutation
+            stats_changes: Changes to the running aggregates, see
+                `BoardStats.apply`
+        """
+        # Fold pending notes and patches into this write; the journal must
+        # carry them too, since the delta log is emptied afterwards
+        noted_ids = {record["task_id"] for record in self._deltas.read()}
+        upserts = {story.task_id: story for story in upserts}
+        for story in stories:
+            if story.task_id in noted_ids and story.task_id not in upserts:
+                upserts[story.task_id] = story
+        previous_seq = self._journal.seq
+        self._journal.append(
+            [story.to_dict(compact=True) for story in upserts.values()], list(deletes)
+        )
+        self._write_stories(stories)
+        if noted_ids:
+            self._deltas.clear()
+        self._stats.apply(previous_seq, self._journal.seq, stats_changes, stories)
+        if self._journal.is_snapshot_due():
+            self._journal.snapshot([story.to_dict(compact=True) for story in stories])
+
     def _write_stories(self, stories: List[Story]) -> None:
-        """Write all stories to the file with locking."""
+        """
+        Publish a new version of the board file.
+
+        The stories are written to a temporary file that is then renamed over
+        the board file, so readers see either the old or the new version in
+        full. Must be called while holding the mutation lock, which also
+        makes this process the only user of the temporary file.
+        """
         max_retries = 10
         retry_delay = 0.1  # seconds
 
@@ -127,18 +537,21 @@ class FileBoard(AnyBoard):
                 # Write to a temporary file first
                 temp_path = self.file_path + ".tmp"
                 with open(temp_path, "w") as f:
-                    if self._acquire_lock(f):
-                        try:
-                            json.dump(
-                                [story.to_dict() for story in stories], f, indent=2
-                            )
-                            f.flush()
-                            os.fsync(f.fileno())
-                        finally:
-                            self._release_lock(f)
+                    # One-shot, unindented dumps uses the C encoder, which
+                    # matters for boards with many stories
+                    f.write(
+                        json.dumps([story.to_dict(compact=True) for story in stories])
+                    )
+                    f.flush()
+                    if self.durability.mode == FSYNC_EVERY_WRITE_MODE:
+                        os.fsync(f.fileno())
 
                 # Atomically replace the original file
                 os.replace(temp_path, self.file_path)
+                if self.durability.mode == FSYNC_EVERY_WRITE_MODE:
+                    self._fsync_directory()
+                elif self.durability.mode == GROUP_COMMIT_MODE:
+                    self._schedule_group_commit()
                 return
 
             except (IOError, OSError) as e:
@@ -147,10 +560,99 @@ class FileBoard(AnyBoard):
                     continue
                 raise RuntimeError(f"Failed to write stories to {self.file_path}: {e}")
 
+    def _fsync_directory(self) -> None:
+        """Make the rename of the storage file durable."""
+        dir_fd = os.open(os.path.dirname(self.file_path) or ".", os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+    def _schedule_group_commit(self) -> None:
+        """Make sure one fsync is pending at the end of the current window."""
+        with self._group_commit_lock:
+            if self._group_commit_timer is not None:
+                # This write joins the commit that is already pending
+                return
+            if not self._is_flush_registered:
+                # Do not drop the last window when the process exits
+                atexit.register(self.flush)
+                self._is_flush_registered = True
+            self._group_commit_timer = threading.Timer(
+                self.durability.window_ms / 1000, self.flush
+            )
+            self._group_commit_timer.daemon = True
+            self._group_commit_timer.start()
+
+    def flush(self) -> None:
+        """
+        Make every write so far durable.
+
+        With group commit this runs once per window and covers every write
+        of the window; it can also be called to end the window early.
+        """
+        with self._group_commit_lock:
+            if self._group_commit_timer is not None:
+                self._group_commit_timer.cancel()
+                self._group_commit_timer = None
+            self._journal.flush()
+            self._deltas.flush()
+            try:
+                fd = os.open(self.file_path, os.O_RDONLY)
+            except FileNotFoundError:
+                return
+            try:
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            self._fsync_directory()
+
     def assign(
-        self, assigner: str, assignee: str, task_name: str, description: str
+        self,
+        assigner: str,
+        assignee: str,
+        task_name: str,
+        description: str,
+        blocked_by: list[str] | None = None,
     ) -> Story:
         """Assign a new task to a squad member."""
+        with self._mutation_lock():
+            stories = self._read_stories()
+            self._sync_queue_depths(stories)
+            assignee = self._admit(self._resolve_assignee(assigner, assignee))
+
+            full_description = f"{task_name}: {description}"
+            story = Story(
+                assignee=assignee,
+                assigner=assigner,
+                description=full_description,
+                blocked_by=blocked_by,
+            )
+            self._store_description(story)
+
+            self._validate_dependencies(story, stories)
+            stories.append(story)
+            self._commit(stories, upserts=[story], stats_changes=[(ASSIGNED, assignee)])
+            self._update_queue_depths({assignee: 1})
+
+        return story
+
+    def _store_description(self, story: Story) -> None:
+        """Move a large description into the blob store."""
+        if len(story.description) > self.blob_threshold:
+            story.description_ref = self._blob_store.put(story.description)
+
+    def _resolve_assignee(self, assigner: str, assignee: str) -> str:
+        """
+        Route `role:<role>` assignees and validate both member names.
+
+        Returns:
+            The name of the member the task should be assigned to
+        """
+        self._sync_members()
+        if assignee.startswith(ROLE_PREFIX):
+            assignee = self._route_to_role(assignee[len(ROLE_PREFIX) :])
+
         # Validate assigner and assignee are valid member names
         if self._valid_members:
             if assigner not in self._valid_members:
@@ -163,17 +665,196 @@ class FileBoard(AnyBoard):
                     f"Invalid assignee '{assignee}'. "
                     f"Must be one of: {', '.join(self._valid_members)}"
                 )
+        return assignee
+
+    def _admit(self, assignee: str) -> str:
+        """
+        Apply the pending-task limits to an assignment.
+
+        Returns:
+            The member to assign to: the assignee, or a member of the same
+            role if the assignee's queue is full and the task may spill
 
-        full_description = f"{task_name}: {description}"
-        story = Story(
-            assignee=assignee, assigner=assigner, description=full_description
+        Raises:
+            QueueFullError: If the board or the assignee's queue is full
+        """
+        if self.max_pending is not None:
+            total = self._total_pending()
+            if total >= self.max_pending:
+                raise QueueFullError(
+                    f"The board already has {total} pending tasks "
+                    f"(limit {self.max_pending})",
+                    self._retry_after(list(self._queue_depths)),
+                    total,
+                )
+        limit = self.max_pending_per_member
+        if limit is None:
+            return assignee
+        depth = self._pending_count(assignee)
+        if depth < limit:
+            return assignee
+        role = self._member_roles.get(assignee)
+        if self.overflow == OVERFLOW_SPILL and role:
+            candidates = [
+                member
+                for member in self._valid_members
+                if member != assignee
+                and self._member_roles.get(member) == role
+                and self._pending_count(member) < limit
+            ]
+            if candidates:
+                return min(candidates, key=self._estimate_load)
+        raise QueueFullError(
+            f"{assignee} already has {depth} pending tasks (limit {limit})",
+            self._retry_after([assignee]),
+            depth,
         )
 
-        stories = self._read_stories()
-        stories.append(story)
-        self._write_stories(stories)
+    def _pending_count(self, member: str) -> int:
+        """Get a member's number of incomplete tasks from the counters."""
+        return self._queue_depths.get(member, 0)
 
-        return story
+    def _total_pending(self) -> int:
+        """Get the number of incomplete tasks on the board from the counters."""
+        return sum(self._queue_depths.values())
+
+    def _retry_after(self, members: List[str]) -> float:
+        """Estimate when one of the members will have finished a task."""
+        averages = [
+            total / count
+            for member, (count, total) in self._completion_totals.items()
+            if count and member in members
+        ]
+        return round(min(averages), 1) if averages else DEFAULT_RETRY_AFTER
+
+    def queue_depth(self, member: str) -> int:
+        """Get the number of incomplete tasks assigned to a member."""
+        self._sync_queue_depths()
+        with self._lock.read():
+            return self._pending_count(member)
+
+    def _file_signature(self) -> tuple | None:
+        """Return a cheap fingerprint of the stored board, including its deltas."""
+        try:
+            stat = os.stat(self.file_path)
+        except OSError:
+            return None
+        return (stat.st_ino, stat.st_mtime_ns, stat.st_size) + self._deltas.signature()
+
+    def _sync_queue_depths(self, stories: List[Story] | None = None) -> None:
+        """Recount the queue-depth counters if another process changed the file."""
+        signature = self._file_signature()
+        if signature is not None and signature == self._queue_depths_signature:
+            return
+        with self._lock.write():
+            if stories is None:
+                stories = self._read_stories()
+            self._queue_depths = {}
+            self._completion_totals = {}
+            for story in stories:
+                if not story.is_completed:
+                    self._queue_depths[story.assignee] = (
+                        self._queue_depths.get(story.assignee, 0) + 1
+                    )
+                elif story.completed_at is not None:
+                    self._add_completion_time(story)
+            self._queue_depths_signature = signature
+
+    def _update_queue_depths(
+        self, deltas: Dict[str, int], completed: List[Story] | None = None
+    ) -> None:
+        """Apply the changes of our own write to the queue-depth counters."""
+        if self._queue_depths_signature is None:
+            # Counters were never loaded; they will be recounted on next use
+            return
+        for assignee, delta in deltas.items():
+            self._queue_depths[assignee] = max(
+                0, self._queue_depths.get(assignee, 0) + delta
+            )
+        for story in completed or []:
+            self._add_completion_time(story)
+        self._queue_depths_signature = self._file_signature()
+
+    def _add_completion_time(self, story: Story) -> None:
+        """Add a completed story to its assignee's completion-time totals."""
+        count, total = self._completion_totals.get(story.assignee, (0, 0.0))
+        self._completion_totals[story.assignee] = (
+            count + 1,
+            total + max(0.0, story.completed_at - story.created_at),
+        )
+
+    def _route_to_role(self, role: str) -> str:
+        """Pick the member of a role with the lightest load."""
+        candidates = [
+            member
+            for member in self._valid_members
+            if self._member_roles.get(member) == role
+        ]
+        if not candidates:
+            raise ValueError(f"No squad member has role '{role}'")
+        return min(candidates, key=self._estimate_load)
+
+    def _estimate_load(self, member: str) -> float:
+        """Estimate a member's load according to the routing strategy."""
+        depth = self._queue_depths.get(member, 0)
+        if self.routing == ROUTE_BY_QUEUE_DEPTH:
+            return depth
+        count, total = self._completion_totals.get(member, (0, 0.0))
+        if count == 0:
+            # No history yet; fall back to the squad-wide average
+            counts = [c for c, _ in self._completion_totals.values()]
+            totals = [t for _, t in self._completion_totals.values()]
+            count, total = (sum(counts), sum(totals)) if sum(counts) else (1, 1.0)
+        return (depth + 1) * (total / count)
+
+    def _validate_dependencies(self, story: Story, stories: List[Story]) -> None:
+        """
+        Make sure the dependencies of a story exist and do not form a cycle.
+
+        Raises:
+            ValueError: If a dependency is unknown or the graph has a cycle
+        """
+        stories_by_id = {item.task_id: item for item in stories}
+        for task_id in story.blocked_by:
+            if task_id == story.task_id:
+                raise ValueError(f"Task '{task_id}' cannot depend on itself")
+            if task_id not in stories_by_id:
+                raise ValueError(f"Unknown dependency '{task_id}'")
+        stories_by_id[story.task_id] = story
+
+        # Depth-first search over the blocked_by edges, starting from the new story
+        visiting: set[str] = set()
+        visited: set[str] = set()
+
+        def visit(task_id: str, path: list[str]) -> None:
+            if task_id in visited or task_id not in stories_by_id:
+                return
+            if task_id in visiting:
+                cycle = path[path.index(task_id) :] + [task_id]
+                raise ValueError(f"Dependency cycle detected: {' -> '.join(cycle)}")
+            visiting.add(task_id)
+            for dependency_id in stories_by_id[task_id].blocked_by:
+                visit(dependency_id, path + [task_id])
+            visiting.discard(task_id)
+            visited.add(task_id)
+
+        visit(story.task_id, [])
+
+    def _split_by_readiness(
+        self, stories: List[Story], assignee: str
+    ) -> tuple[List[Story], List[Story]]:
+        """Split an assignee's incomplete stories into (ready, blocked)."""
+        known_ids = {story.task_id for story in stories}
+        completed_ids = {story.task_id for story in stories if story.is_completed}
+        ready, blocked = [], []
+        for story in stories:
+            if story.assignee != assignee or story.is_completed:
+                continue
+            if story.is_ready(completed_ids, known_ids):
+                ready.append(story)
+            else:
+                blocked.append(story)
+        return ready, blocked
 
     def get_by_assignee(self, assignee: str) -> List[Story]:
         """Get all tasks assigned to a specific squad member."""
@@ -185,34 +866,344 @@ class FileBoard(AnyBoard):
         stories = self._read_stories()
         return [story for story in stories if story.assigner == assigner]
 
-    def complete(self, task_id: str, assignee: str) -> bool:
+    def complete(self, task_id: str, assignee: str, result: str | None = None) -> bool:
         """Mark a task as completed."""
-        stories = self._read_stories()
+        with self._mutation_lock():
+            stories = self._read_stories()
+            self._sync_queue_depths(stories)
 
-        for story in stories:
-            if (
-                story.task_id == task_id
-                and story.assignee == assignee
-                and not story.is_completed
-            ):
-                story.complete()
-                self._write_stories(stories)
-                return True
+            for story in stories:
+                if (
+                    story.task_id == task_id
+                    and story.assignee == assignee
+                    and not story.is_completed
+                ):
+                    story.complete(result)
+                    duration = max(0.0, story.completed_at - story.created_at)
+                    self._commit(
+                        stories,
+                        upserts=[story],
+                        stats_changes=[
+                            (COMPLETED, assignee, duration, story.completed_at)
+                        ],
+                    )
+                    self._update_queue_depths({assignee: -1}, completed=[story])
+                    break
+            else:
+                return False
 
-        return False
+        self._remember_response(story)
+        return True
+
+    def compare_and_update(
+        self, task_id: str, expected_version: int, changes: Dict[str, Any]
+    ) -> Story:
+        """
+        Change a story, unless it changed since the writer read it.
+
+        The check and the write happen in one short critical section, so a
+        stale write fails right away instead of overwriting a newer change.
+
+        Args:
+            task_id: ID of the story
+            expected_version: Version of the story the changes are based on
+            changes: New values of `UPDATABLE_FIELDS`; `assignee` may be
+                `role:<role>`
+
+        Returns:
+            The updated story, with its new version
+
+        Raises:
+            VersionConflictError: If the story is at another version
+            ValueError: If the story is unknown or a change is invalid
+        """
+        self._validate_changes(changes)
+        with self._mutation_lock():
+            stories = self._read_stories()
+            self._sync_queue_depths(stories)
+            story = next((item for item in stories if item.task_id == task_id), None)
+            if story is None:
+                raise ValueError(f"Unknown task '{task_id}'")
+            if story.version != expected_version:
+                raise VersionConflictError(task_id, expected_version, story.version)
+            previous_assignee = story.assignee
+            if "assignee" in changes:
+                changes = dict(
+                    changes, assignee=self._reroute_target(changes["assignee"])
+                )
+            self._apply_changes(story, changes, stories)
+            stats_changes = []
+            deltas: Dict[str, int] = {}
+            if story.assignee != previous_assignee and not story.is_completed:
+                stats_changes = [
+                    (REMOVED, previous_assignee),
+                    (ASSIGNED, story.assignee),
+                ]
+                deltas = {previous_assignee: -1, story.assignee: 1}
+            self._commit(stories, upserts=[story], stats_changes=stats_changes)
+            self._update_queue_depths(deltas)
+        return story
+
+    def update(self, task_id: str, patch: Dict[str, Any]) -> Story:
+        """
+        Set a story's result and/or metadata without rewriting the board.
+
+        The patch is appended to the delta log as one short record, and
+        bumps the story's version like any other change.
+
+        Args:
+            task_id: ID of the story
+            patch: New "result" and/or "metadata" keys to merge (a None
+                value removes the key)
+
+        Returns:
+            The updated story
+
+        Raises:
+            ValueError: If the story is unknown or the patch is invalid
+        """
+        unknown = sorted(set(patch) - set(PATCHABLE_FIELDS))
+        if unknown:
+            raise ValueError(
+                f"Cannot patch {', '.join(unknown)}. "
+                f"Patchable fields: {', '.join(PATCHABLE_FIELDS)}"
+            )
+        if not isinstance(patch.get("metadata", {}), dict):
+            raise ValueError("metadata must be a dictionary")
+        return self._append_delta(task_id, PATCH_DELTA, dict(patch))
+
+    def append_note(self, task_id: str, text: str, author: str = "") -> Story:
+        """
+        Add a progress note to a story without rewriting the board.
+
+        Args:
+            task_id: ID of the story
+            text: The note
+            author: Who wrote the note
+
+        Returns:
+            The updated story
+
+        Raises:
+            ValueError: If the story is unknown or the note is empty
+        """
+        if not text.strip():
+            raise ValueError("Note cannot be empty")
+        note = {"at": time.time(), "author": author, "text": text}
+        return self._append_delta(task_id, NOTE_DELTA, note)
+
+    def _append_delta(self, task_id: str, op: str, data: Dict[str, Any]) -> Story:
+        """Append a note or patch to the delta log, folding the log when large."""
+        with self._mutation_lock():
+            stories = self._read_stories()
+            self._sync_queue_depths(stories)
+            story = next((item for item in stories if item.task_id == task_id), None)
+            if story is None:
+                raise ValueError(f"Unknown task '{task_id}'")
+            record = {
+                "task_id": task_id,
+                "op": op,
+                "version": story.version + 1,
+                "data": data,
+            }
+            self._deltas.append(
+                record, fsync=self.durability.mode == FSYNC_EVERY_WRITE_MODE
+            )
+            apply_deltas([story], [record])
+            if self._deltas.size() >= FOLD_THRESHOLD_BYTES:
+                self._commit(stories)
+            elif self.durability.mode == GROUP_COMMIT_MODE:
+                self._schedule_group_commit()
+            # Notes never change queue depths
+            self._update_queue_depths({})
+        return story
+
+    def _validate_changes(self, changes: Dict[str, Any]) -> None:
+        """Reject changes to fields `compare_and_update` does not handle."""
+        unknown = sorted(set(changes) - set(UPDATABLE_FIELDS))
+        if unknown:
+            raise ValueError(
+                f"Cannot update {', '.join(unknown)}. "
+                f"Updatable fields: {', '.join(UPDATABLE_FIELDS)}"
+            )
+
+    def _apply_changes(
+        self, story: Story, changes: Dict[str, Any], stories: List[Story]
+    ) -> None:
+        """
+        Apply validated changes to a story and bump its version.
+
+        Args:
+            story: The story to change
+            changes: New field values, with `assignee` already resolved
+            stories: Stories the new dependencies are checked against
+        """
+        if "assignee" in changes:
+            story.assignee = changes["assignee"]
+        if "description" in changes:
+            story.description = changes["description"]
+            self._store_description(story)
+        if "blocked_by" in changes:
+            story.blocked_by = list(changes["blocked_by"] or [])
+            self._validate_dependencies(story, stories)
+        if "result" in changes:
+            story.result = changes["result"]
+        story.version += 1
 
     def get_all(self) -> List[Story]:
         """Get all tasks in the board."""
         return self._read_stories()
 
-    def get_pending_by_assignee(self, assignee: str) -> List[Story]:
-        """Get pending (incomplete) tasks assigned to a specific squad member."""
+    def get_since(self, since: float | str) -> List[Story]:
+        """Get the stories created after a timestamp, or after a given story."""
+        return self._stories_after(self._resolve_since(since))
+
+    def journal_sources(self) -> List[str]:
+        """
+        Name the storage files whose journals together record every change.
+
+        A FileBoard has a single file, named "". See `read_and_follow`.
+        """
+        return [""]
+
+    def read_and_follow(self, source: str = "") -> tuple[List[Story], JournalTail]:
+        """
+        Read the stories of a storage file and start following its journal.
+
+        Both are taken in one critical section, so the reader returns exactly
+        the changes made after the stories were read. Following the journal
+        then costs a `stat` while the board is quiet, whatever its size.
+
+        Args:
+            source: A name from `journal_sources`
+
+        Returns:
+            The stories, and a reader of the journal records after them
+        """
+        with self._mutation_lock():
+            tail = JournalTail(self._journal)
+            tail.reset(self._journal.seq)
+            return self._read_stories(), tail
+
+    def _resolve_since(self, since: float | str) -> tuple[float, str]:
+        """
+        Turn a timestamp or task ID into a position in creation order.
+
+        Raises:
+            ValueError: If the task is unknown and its ID carries no time
+        """
+        if not isinstance(since, str):
+            # Sorts after every story created at exactly `since`
+            return (float(since), "\U0010ffff")
+        self._sync_ordered_stories()
+        with self._lock.read():
+            position = self._ordered_positions.get(since)
+            if position is not None:
+                return self._ordered_keys[position]
+        timestamp = task_id_timestamp(since)
+        if timestamp is None:
+            raise ValueError(f"Unknown task '{since}'")
+        return (timestamp, since)
+
+    def _stories_after(self, key: tuple[float, str]) -> List[Story]:
+        """Bisect the stories in creation order for the ones after `key`."""
+        self._sync_ordered_stories()
+        with self._lock.read():
+            start = bisect.bisect_right(self._ordered_keys, key)
+            return self._ordered_stories[start:]
+
+    def _sync_ordered_stories(self) -> None:
+        """Re-read the stories in creation order if the file changed."""
+        signature = self._file_signature()
+        if signature is not None and signature == self._ordered_signature:
+            return
         stories = self._read_stories()
-        return [
-            story
+        # Stories are appended as they are created, so this sort is ~linear
+        stories.sort(key=lambda story: (story.created_at, story.task_id))
+        keys = [(story.created_at, story.task_id) for story in stories]
+        positions = {story.task_id: position for position, story in enumerate(stories)}
+        with self._lock.write():
+            self._ordered_stories = stories
+            self._ordered_keys = keys
+            self._ordered_positions = positions
+            self._ordered_signature = signature
+
+    def _locate_stories(
+        self, task_ids: set[str], hint_assignees: List[str] | None = None
+    ) -> Dict[str, Story]:
+        """Find stories by ID."""
+        if not task_ids:
+            return {}
+        return {
+            story.task_id: story
+            for story in self._read_stories()
+            if story.task_id in task_ids
+        }
+
+    def _response_cache_keys(self, stories: List[Story]) -> Dict[str, str]:
+        """
+        Key stories by their assignee's role, description and dependency results.
+
+        The dependencies of every story, and the task IDs their descriptions
+        mention, are looked up together, so keying a batch costs one read.
+        Only the mentioned IDs found on the board are left out of a key.
+
+        Returns:
+            The key of each story, by task ID
+        """
+        wanted: Dict[str, set[str]] = {
+            story.task_id: set(story.blocked_by) | find_task_ids(story.description)
             for story in stories
-            if story.assignee == assignee and not story.is_completed
-        ]
+        }
+        found = self._locate_stories(
+            set().union(*wanted.values()), [story.assignee for story in stories]
+        )
+        keys = {}
+        for story in stories:
+            context = [
+                f"{found[task_id].description} => {found[task_id].result or ''}"
+                for task_id in story.blocked_by
+                if task_id in found
+            ]
+            role = self._member_roles.get(story.assignee) or story.assignee
+            keys[story.task_id] = ResponseCache.make_key(
+                role, story.description, context, wanted[story.task_id] & found.keys()
+            )
+        return keys
+
+    def _remember_response(self, story: Story) -> None:
+        """Cache the result of a completed story for later, identical stories."""
+        if self._response_cache is None or not story.result:
+            return
+        try:
+            key = self._response_cache_keys([story])[story.task_id]
+            self._response_cache.put(key, story.result)
+        except OSError:
+            # The cache is an optimization; never fail a completion over it
+            pass
+
+    def _cached_responses(self, stories: List[Story]) -> Dict[str, str]:
+        """Get the cached results of earlier stories identical to these, by task ID."""
+        if self._response_cache is None:
+            return {}
+        try:
+            keys = self._response_cache_keys(stories)
+            cached = {
+                task_id: self._response_cache.get(key) for task_id, key in keys.items()
+            }
+        except OSError:
+            return {}
+        return {task_id: result for task_id, result in cached.items() if result}
+
+    def get_pending_by_assignee(self, assignee: str) -> List[Story]:
+        """Get pending (incomplete) tasks assigned to a specific squad member."""
+        ready, _ = self._split_by_readiness(self._read_stories(), assignee)
+        return ready
+
+    def get_blocked_by_assignee(self, assignee: str) -> List[Story]:
+        """Get incomplete tasks that are still waiting for their dependencies."""
+        _, blocked = self._split_by_readiness(self._read_stories(), assignee)
+        return blocked
 
     def get_completed_by_assignee(self, assignee: str) -> List[Story]:
         """Get completed tasks assigned to a specific squad member."""
@@ -223,6 +1214,43 @@ class FileBoard(AnyBoard):
             if story.assignee == assignee and story.is_completed
         ]
 
+    def stats(self) -> Dict[str, Any]:
+        """Get per-member queue depth, completion rate and time-to-complete."""
+        self._sync_members()
+        return summarize(self._raw_stats(), self._valid_members)
+
+    def _raw_stats(self) -> Dict[str, dict]:
+        """
+        Get the running aggregates, rebuilding them only if they are stale.
+
+        A current sidecar is read without the file lock, so polling stats
+        never waits for writers; only a rebuild takes the mutation lock.
+        """
+        if self._file_signature() is None:
+            return {}
+        with self._lock.write():
+            # Guards the cached positions of the journal and the sidecar
+            members = self._stats.read(self._journal.seq)
+        if members is not None:
+            return members
+        with self._mutation_lock():
+            return self._stats.current(self._journal.seq, self._read_stories)
+
+    def search(self, text: str, limit: int = 10) -> List[Story]:
+        """Full-text search over the descriptions and names of every task."""
+        return [story for _, story in self._search_scored(text, limit)]
+
+    def _search_scored(self, text: str, limit: int) -> List[tuple[int, Story]]:
+        """Search the inverted index, syncing it first if the file changed."""
+        signature = self._file_signature()
+        if signature is None or signature != self._search_index_signature:
+            stories = self._read_stories()
+            with self._lock.write():
+                self._search_index.sync(stories)
+                self._search_index_signature = signature
+        with self._lock.read():
+            return self._search_index.search(text, limit)
+
     def delete(self, task_id: str, assigner: str) -> bool:
         """
         Delete a task from the board.
@@ -234,13 +1262,23 @@ class FileBoard(AnyBoard):
         Returns:
             True if the task was successfully deleted, False otherwise
         """
-        stories = self._read_stories()
-
-        for i, story in enumerate(stories):
-            if story.task_id == task_id and story.assigner == assigner:
-                del stories[i]
-                self._write_stories(stories)
-                return True
+        with self._mutation_lock():
+            stories = self._read_stories()
+            self._sync_queue_depths(stories)
+
+            for i, story in enumerate(stories):
+                if story.task_id == task_id and story.assigner == assigner:
+                    del stories[i]
+                    self._commit(
+                        stories,
+                        deletes=[task_id],
+                        stats_changes=(
+                            [] if story.is_completed else [(REMOVED, story.assignee)]
+                        ),
+                    )
+                    if not story.is_completed:
+                        self._update_queue_depths({story.assignee: -1})
+                    return True
 
         return False
 
@@ -254,21 +1292,107 @@ class FileBoard(AnyBoard):
         Returns:
             Number of tasks cleared
         """
-        stories = self._read_stories()
-        initial_count = len(stories)
+        with self._mutation_lock():
+            stories = self._read_stories()
+            cleared_ids = [
+                story.task_id
+                for story in stories
+                if story.assignee == assignee and story.is_completed
+            ]
+
+            if cleared_ids:
+                # Keep only incomplete tasks or tasks not assigned to this assignee
+                cleared = set(cleared_ids)
+                stories = [story for story in stories if story.task_id not in cleared]
+                self._commit(stories, deletes=cleared_ids)
+                # Completed-time totals now differ from the file; recount on next use
+                self._queue_depths_signature = None
+
+        return len(cleared_ids)
+
+    # Storage API of a single board file. ShardedFileBoard keeps one FileBoard
+    # per assignee and changes its shards only through these methods, which
+    # take the (re-entrant) mutation lock themselves; a caller holds it too
+    # when a change must be atomic with its own read or with other shards.
+
+    def _insert_story(self, story: Story, limit: int | None = None) -> None:
+        """
+        Add a new or moved story to this board's file.
 
-        # Keep only incomplete tasks or tasks not assigned to this assignee
-        stories = [
-            story
-            for story in stories
-            if not (story.assignee == assignee and story.is_completed)
-        ]
+        Args:
+            story: The story, already validated
+            limit: Most incomplete tasks its assignee may have
 
-        cleared_count = initial_count - len(stories)
-        if cleared_count > 0:
-            self._write_stories(stories)
+        Raises:
+            QueueFullError: If the story is pending and its assignee's queue
+                is full
+        """
+        is_pending = not story.is_completed
+        with self._mutation_lock():
+            stories = self._read_stories()
+            self._sync_queue_depths(stories)
+            depth = self._queue_depths.get(story.assignee, 0)
+            if is_pending and limit is not None and depth >= limit:
+                raise QueueFullError(
+                    f"{story.assignee} already has {depth} pending tasks "
+                    f"(limit {limit})",
+                    self._retry_after([story.assignee]),
+                    depth,
+                )
+            stories.append(story)
+            self._commit(
+                stories,
+                upserts=[story],
+                stats_changes=[(ASSIGNED, story.assignee)] if is_pending else [],
+            )
+            self._update_queue_depths({story.assignee: 1} if is_pending else {})
+
+    def _replace_story(self, story: Story) -> None:
+        """Write a changed story, still assigned to the same member, in place."""
+        with self._mutation_lock():
+            stories = self._read_stories()
+            self._sync_queue_depths(stories)
+            stories = [
+                story if item.task_id == story.task_id else item for item in stories
+            ]
+            self._commit(stories, upserts=[story])
+            self._update_queue_depths({})
+
+    def _remove_story(self, task_id: str) -> Story | None:
+        """
+        Remove a story from this board's file, e.g. after it moved away.
 
-        return cleared_count
+        Returns:
+            The removed story as stored, or None if it is not here
+        """
+        with self._mutation_lock():
+            stories = self._read_stories()
+            self._sync_queue_depths(stories)
+            story = next((item for item in stories if item.task_id == task_id), None)
+            if story is None:
+                return None
+            is_pending = not story.is_completed
+            self._commit(
+                [item for item in stories if item.task_id != task_id],
+                deletes=[task_id],
+                stats_changes=[(REMOVED, story.assignee)] if is_pending else [],
+            )
+            self._update_queue_depths({story.assignee: -1} if is_pending else {})
+            return story
+
+    def _member_load(self, member: str) -> tuple[int, tuple[int, float] | None]:
+        """
+        Get a member's pending count and completion-time totals.
+
+        Returns:
+            (pending, (completed, seconds) or None if nothing completed yet)
+        """
+        self._sync_queue_depths()
+        with self._lock.read():
+            return (
+                self._queue_depths.get(member, 0),
+                self._completion_totals.get(member),
+            )
 
     def create_tools(self, agent_name: str) -> List[callable]:
         """
@@ -284,6 +1408,10 @@ class FileBoard(AnyBoard):
             self._create_assign_task_tool(agent_name),
             self._create_list_my_tasks_tool(agent_name),
             self._create_complete_my_task_tool(agent_name),
+            self._create_update_task_tool(agent_name),
+            self._create_add_task_note_tool(agent_name),
+            self._create_search_tasks_tool(agent_name),
+            self._create_board_stats_tool(agent_name),
         ]
 
     def create_triggers(self, agent_name: str) -> List[Callable]:
@@ -302,16 +1430,36 @@ class FileBoard(AnyBoard):
         ]
 
     def _assign_task_tool(
-        self, assigner: str, assignee: str, task_name: str, description: str
+        self,
+        assigner: str,
+        assignee: str,
+        task_name: str,
+        description: str,
+        blocked_by: list[str] | None = None,
     ) -> Dict[str, Any]:
         """Tool implementation for assigning a task."""
         try:
-            story = self.assign(assigner, assignee, task_name, description)
+            story = self.assign(
+                assigner, assignee, task_name, description, blocked_by=blocked_by
+            )
             return {
                 "success": True,
-                "message": f"Task assigned to {assignee}",
+                "message": f"Task assigned to {story.assignee}",
+                "assignee": story.assignee,
                 "task_id": story.task_id,
-                "task": story.to_dict(),
+                "queue_depth": self.queue_depth(story.assignee),
+                "queue_limit": self.max_pending_per_member,
+                "task": story.to_dict(compact=True),
+            }
+        except QueueFullError as e:
+            return {
+                "success": False,
+                "message": (
+                    f"Failed to assign task: {str(e)}. Retry in about "
+                    f"{e.retry_after:g} seconds, or assign it to someone else."
+                ),
+                "queue_depth": e.queue_depth,
+                "retry_after_seconds": e.retry_after,
             }
         except Exception as e:
             return {"success": False, "message": f"Failed to assign task: {str(e)}"}
@@ -321,22 +1469,26 @@ class FileBoard(AnyBoard):
         try:
             tasks = self.get_by_assignee(agent_name)
             pending = self.get_pending_by_assignee(agent_name)
+            blocked = self.get_blocked_by_assignee(agent_name)
             completed = self.get_completed_by_assignee(agent_name)
 
             return {
                 "success": True,
                 "total_tasks": len(tasks),
                 "pending_tasks": len(pending),
+                "blocked_tasks": len(blocked),
                 "completed_tasks": len(completed),
                 "tasks": [task.to_dict() for task in tasks],
             }
         except Exception as e:
             return {"success": False, "message": f"Failed to list tasks: {str(e)}"}
 
-    def _complete_my_task_tool(self, task_id: str, agent_name: str) -> Dict[str, Any]:
+    def _complete_my_task_tool(
+        self, task_id: str, agent_name: str, result: str | None = None
+    ) -> Dict[str, Any]:
         """Tool implementation for completing a task."""
         try:
-            success = self.complete(task_id, agent_name)
+            success = self.complete(task_id, agent_name, result=result)
             if success:
                 return {
                     "success": True,
@@ -350,19 +1502,79 @@ class FileBoard(AnyBoard):
         except Exception as e:
             return {"success": False, "message": f"Failed to complete task: {str(e)}"}
 
+    def _update_task_tool(
+        self,
+        task_id: str,
+        agent_name: str,
+        patch: Dict[str, Any] | None = None,
+        note: str | None = None,
+    ) -> Dict[str, Any]:
+        """Tool implementation for patching a task or adding a note to it."""
+        try:
+            story = self._locate_stories({task_id}, [agent_name]).get(task_id)
+            if story is None or agent_name not in (story.assignee, story.assigner):
+                return {
+                    "success": False,
+                    "message": f"Task {task_id} not found or not yours",
+                }
+            if note is not None:
+                story = self.append_note(task_id, note, author=agent_name)
+            else:
+                story = self.update(task_id, patch or {})
+            return {
+                "success": True,
+                "message": f"Task {task_id} updated",
+                "version": story.version,
+            }
+        except Exception as e:
+            return {"success": False, "message": f"Failed to update task: {str(e)}"}
+
+    def _search_tasks_tool(self, query: str, limit: int) -> Dict[str, Any]:
+        """Tool implementation for searching the board."""
+        try:
+            stories = self.search(query, limit)
+            return {
+                "success": True,
+                "total_results": len(stories),
+                "results": [
+                    {
+                        "task_id": story.task_id,
+                        "assignee": story.assignee,
+                        "assigner": story.assigner,
+                        "description": story.description_preview,
+                        "is_completed": story.is_completed,
+                    }
+                    for story in stories
+                ],
+            }
+        except Exception as e:
+            return {"success": False, "message": f"Failed to search tasks: {str(e)}"}
+
+    def _board_stats_tool(self) -> Dict[str, Any]:
+        """Tool implementation for summarizing the workload of the squad."""
+        try:
+            return {"success": True, **self.stats()}
+        except Exception as e:
+            return {"success": False, "message": f"Failed to get board stats: {str(e)}"}
+
     def _create_assign_task_tool(self, agent_name: str) -> callable:
         """Create a tool for assigning tasks to other agents."""
 
         def assign_task_to_agent(
-            assignee: str, task_name: str, description: str
+            assignee: str,
+            task_name: str,
+            description: str,
+            blocked_by: list[str] | None = None,
         ) -> Dict[str, Any]:
             """
             Assign a new task to another agent.
 
             Args:
-                assignee: The agent to assign the task to
+                assignee: The agent to assign the task to, or `role:<role>`
+                    to hand it to the least busy agent with that role
                 task_name: Short name/identifier for the task
                 description: Detailed description of what needs to be done
+                blocked_by: IDs of tasks that must be completed first
 
             Returns:
                 Dictionary with success status and task information
@@ -372,12 +1584,19 @@ class FileBoard(AnyBoard):
                 assignee=assignee,
                 task_name=task_name,
                 description=description,
+                blocked_by=blocked_by,
             )
 
         # Add metadata to the function for tool registration
         assign_task_to_agent.__name__ = f"assign_task_to_agent"
         assign_task_to_agent.__doc__ = (
-            f"Assign a new task to another agent. You are {agent_name}."
+            f"Assign a new task to another agent. You are {agent_name}. "
+            "Use `role:<role>` as the assignee to let the board pick the least "
+            "busy agent with that role. The response reports the assignee's "
+            "queue depth; if a queue is full, wait `retry_after_seconds` before "
+            "assigning more. Pass the task IDs returned by earlier assignments "
+            "as `blocked_by` to hold this task until they are completed; "
+            "independent tasks run in parallel."
         )
         return assign_task_to_agent
 
@@ -401,30 +1620,135 @@ class FileBoard(AnyBoard):
     def _create_complete_my_task_tool(self, agent_name: str) -> callable:
         """Create a tool for completing tasks assigned to the current agent."""
 
-        def complete_my_task(task_id: str) -> Dict[str, Any]:
+        def complete_my_task(task_id: str, result: str = "") -> Dict[str, Any]:
             """
             Complete a task that is assigned to you.
 
             Args:
                 task_id: The ID of the task to complete
+                result: Short summary of the outcome, sent to the assigner
 
             Returns:
                 Dictionary with success status
             """
-            return self._complete_my_task_tool(task_id, agent_name)
+            return self._complete_my_task_tool(task_id, agent_name, result or None)
 
         # Add metadata to the function for tool registration
         complete_my_task.__name__ = f"complete_my_task"
         complete_my_task.__doc__ = (
-            f"Complete a task that is assigned to you ({agent_name})."
+            f"Complete a task that is assigned to you ({agent_name}). "
+            "Include a short `result` summary; it is sent to the assigner."
         )
         return complete_my_task
 
+    def _create_update_task_tool(self, agent_name: str) -> callable:
+        """Create a tool for recording a task's result or metadata."""
+
+        def update_task(
+            task_id: str, result: str = "", metadata: Dict[str, Any] | None = None
+        ) -> Dict[str, Any]:
+            """
+            Record the (partial) result or metadata of a task.
+
+            Args:
+                task_id: The ID of the task, assigned to or by you
+                result: Outcome so far; left unchanged if empty
+                metadata: Key/value data to merge; a null value removes a key
+
+            Returns:
+                Dictionary with success status and the task's new version
+            """
+            patch: Dict[str, Any] = {}
+            if result:
+                patch["result"] = result
+            if metadata:
+                patch["metadata"] = metadata
+            return self._update_task_tool(task_id, agent_name, patch=patch)
+
+        # Add metadata to the function for tool registration
+        update_task.__name__ = f"update_task"
+        update_task.__doc__ = (
+            "Record the result so far or key/value metadata of a task assigned "
+            f"to or by you ({agent_name}), without completing it."
+        )
+        return update_task
+
+    def _create_add_task_note_tool(self, agent_name: str) -> callable:
+        """Create a tool for adding progress notes to a task."""
+
+        def add_task_note(task_id: str, note: str) -> Dict[str, Any]:
+            """
+            Add a progress note to a task.
+
+            Args:
+                task_id: The ID of the task, assigned to or by you
+                note: Short progress update
+
+            Returns:
+                Dictionary with success status and the task's new version
+            """
+            return self._update_task_tool(task_id, agent_name, note=note)
+
+        # Add metadata to the function for tool registration
+        add_task_note.__name__ = f"add_task_note"
+        add_task_note.__doc__ = (
+            f"Add a short progress note to a task assigned to or by you "
+            f"({agent_name}). The latest notes are sent to the assigner along "
+            "with the result when the task is completed."
+        )
+        return add_task_note
+
+    def _create_search_tasks_tool(self, agent_name: str) -> callable:
+        """Create a tool for searching every task on the board."""
+
+        def search_tasks(query: str, limit: int = 10) -> Dict[str, Any]:
+            """
+            Search every task on the board by keywords.
+
+            Args:
+                query: Keywords to look for in task names and descriptions
+                limit: Maximum number of results
+
+            Returns:
+                Dictionary with the matching tasks
+            """
+            return self._search_tasks_tool(query, limit)
+
+        # Add metadata to the function for tool registration
+        search_tasks.__name__ = f"search_tasks"
+        search_tasks.__doc__ = (
+            "Search every task on the board (not only yours) by keywords, "
+            f"e.g. to find prior or duplicate work. You are {agent_name}."
+        )
+        return search_tasks
+
+    def _create_board_stats_tool(self, agent_name: str) -> callable:
+        """Create a tool for summarizing the workload of every member."""
+
+        def board_stats() -> Dict[str, Any]:
+            """
+            Summarize the workload of every squad member.
+
+            Returns:
+                Dictionary with pending and completed tasks, completions per
+                minute and p50/p95 time-to-complete per member
+            """
+            return self._board_stats_tool()
+
+        # Add metadata to the function for tool registration
+        board_stats.__name__ = f"board_stats"
+        board_stats.__doc__ = (
+            "Show, per squad member, pending tasks, completions per minute and "
+            "p50/p95 seconds to complete a task. Use it to find bottlenecks and "
+            f"balance work before assigning. You are {agent_name}."
+        )
+        return board_stats
+
     def _create_new_task_trigger(self, agent_name: str) -> Callable:
         """
         Create a trigger that checks for new tasks assigned to this agent.
 
-        This trigger should be added to an LLMChatTask with to_infinite_stream().
+        The returned stream can be added to an LLMChatTask as a trigger.
         """
         # Track which tasks we've already notified about
         notified_tasks = set()
@@ -448,26 +1772,20 @@ class FileBoard(AnyBoard):
                         notified_tasks.add(task.task_id)
 
                 if new_tasks:
-                    if len(new_tasks) == 1:
-                        task = new_tasks[0]
-                        return f"📋 New task assigned to you by {task.assigner}: {task.description}"
-                    else:
-                        return (
-                            f"📋 You have {len(new_tasks)} new task(s) assigned to you"
-                        )
+                    return self._format_new_tasks_digest(new_tasks)
                 return ""
             except Exception as e:
                 # Don't crash the trigger on error
                 return f"Error checking for new tasks: {str(e)}"
 
         check_new_tasks.__name__ = f"check_new_tasks_{agent_name}"
-        return to_infinite_stream(check_new_tasks)
+        return self._to_trigger_stream(check_new_tasks, agent_name)
 
     def _create_task_completed_trigger(self, agent_name: str) -> Callable:
         """
         Create a trigger that checks for tasks completed by this agent (as assigner).
 
-        This trigger should be added to an LLMChatTask with to_infinite_stream().
+        The returned stream can be added to an LLMChatTask as a trigger.
         """
         # Track which completed tasks we've already notified about
         notified_completions = set()
@@ -491,17 +1809,74 @@ class FileBoard(AnyBoard):
                         notified_completions.add(task.task_id)
 
                 if new_completions:
-                    if len(new_completions) == 1:
-                        task = new_completions[0]
-                        return (
-                            f"✅ Task completed by {task.assignee}: {task.description}"
-                        )
-                    else:
-                        return f"✅ {len(new_completions)} task(s) you assigned have been completed"
+                    return self._format_completed_tasks_digest(new_completions)
                 return ""
             except Exception as e:
                 # Don't crash the trigger on error
                 return f"Error checking for completed tasks: {str(e)}"
 
         check_completed_tasks.__name__ = f"check_completed_tasks_{agent_name}"
-        return to_infinite_stream(check_completed_tasks)
+        return self._to_trigger_stream(check_completed_tasks, agent_name)
+
+    def _format_new_tasks_digest(self, tasks: List[Story]) -> str:
+        """Describe new tasks well enough to act on them without another call."""
+        if len(tasks) == 1:
+            header = f"📋 New task assigned to you by {tasks[0].assigner}:"
+        else:
+            header = f"📋 You have {len(tasks)} new task(s) assigned to you:"
+        cached_responses = self._cached_responses(tasks)
+        entries = []
+        for task in tasks:
+            body = task.description
+            cached = cached_responses.get(task.task_id)
+            if cached:
+                # Put the cached result first so shortening keeps it visible
+                body = (
+                    f"(identical task done before, result: {cached}; if it still "
+                    f"applies, complete this task with it) {body}"
+                )
+            entries.append((f"[{task.task_id}] from {task.assigner}", body))
+        return build_digest(
+            header,
+            entries,
+            self.digest_token_budget,
+            "call list_my_tasks for the full list",
+        )
+
+    def _format_completed_tasks_digest(self, tasks: List[Story]) -> str:
+        """Describe completed tasks, including their results, in one message."""
+        if len(tasks) == 1:
+            header = f"✅ Task completed by {tasks[0].assignee}:"
+        else:
+            header = f"✅ {len(tasks)} task(s) you assigned have been completed:"
+        entries = []
+        for task in tasks:
+            body = shorten(task.description, MIN_ENTRY_CHARS)
+            if task.result:
+                body = f"{body} → result: {task.result}"
+            if task.notes:
+                notes = task.notes[-NOTES_IN_DIGEST:]
+                body = f"{body} → notes: " + "; ".join(note["text"] for note in notes)
+            entries.append((f"[{task.task_id}] by {task.assignee}", body))
+        return build_digest(
+            header,
+            entries,
+            self.digest_token_budget,
+            "call search_tasks to look them up",
+        )
+
+    def _to_trigger_stream(self, check: Callable[[], str], agent_name: str) -> Callable:
+        """Wrap a trigger check into an adaptive polling stream."""
+        return to_adaptive_stream(
+            check,
+            self.poll_policy,
+            activity=lambda: self._activity_signature(agent_name),
+        )
+
+    def _activity_signature(self, agent_name: str) -> Any:
+        """
+        Return a cheap fingerprint of the storage an agent's triggers read.
+
+        Triggers skip their check while the fingerprint is unchanged.
+        """
+        return self._file_signature()
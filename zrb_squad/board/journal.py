@@ -0,0 +1,343 @@
+"""
+Write-ahead journal and checksummed snapshots for crash recovery.
+"""
+
+import hashlib
+import json
+import os
+import zlib
+from typing import Dict, Iterable, List
+
+from .durability import FSYNC_EVERY_WRITE_MODE, Durability
+
+UPSERT_OP = "upsert"
+DELETE_OP = "delete"
+# Marks the position a snapshot was taken at; carries no data
+SNAPSHOT_OP = "snapshot"
+
+
+def _record_crc(seq: int, op: str, data: object) -> int:
+    """CRC of a journal record, to detect torn or corrupted lines."""
+    payload = json.dumps([seq, op, data], sort_keys=True, separators=(",", ":"))
+    return zlib.crc32(payload.encode("utf-8"))
+
+
+def _format_record(seq: int, op: str, data: object) -> str:
+    """Serialize a journal record as one line."""
+    record = {"seq": seq, "op": op, "data": data, "crc": _record_crc(seq, op, data)}
+    return json.dumps(record) + "\n"
+
+
+class BoardJournal:
+    """
+    Write-ahead journal of board mutations plus periodic snapshots.
+
+    Every mutation appends one record per changed story to `<board>.wal`
+    before the board file is rewritten. Every `snapshot_interval` records,
+    the whole board is written to `<board>.snapshot` after a header line
+    holding its sequence number and SHA-256 checksum; the previous snapshot
+    is kept as `<board>.snapshot.prev`. The journal keeps the records since
+    the previous snapshot, so recovery falls back to the older snapshot if
+    the newest one is damaged, and never replays more than two snapshot
+    intervals.
+
+    The journal must only be appended to while holding the board's mutation
+    lock, which gives every record a unique, increasing sequence number.
+    """
+
+    def __init__(
+        self, file_path: str, durability: Durability, snapshot_interval: int = 100
+    ):
+        """
+        Initialize the journal.
+
+        Args:
+            file_path: Path of the board file the journal belongs to
+            durability: Durability level of the board
+            snapshot_interval: Number of records between two snapshots
+        """
+        self.wal_path = file_path + ".wal"
+        self.snapshot_path = file_path + ".snapshot"
+        self.previous_snapshot_path = self.snapshot_path + ".prev"
+        self.durability = durability
+        self.snapshot_interval = snapshot_interval
+        # Cached position of the journal, valid while the WAL file is unchanged
+        self._seq = 0
+        self._snapshot_seq = 0
+        self._wal_signature: tuple | None = None
+
+    def _signature(self) -> tuple | None:
+        try:
+            stat = os.stat(self.wal_path)
+        except OSError:
+            return None
+        return (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+    def _load_position(self) -> None:
+        """Find the current sequence number if another process appended."""
+        signature = self._signature()
+        if signature is not None and signature == self._wal_signature:
+            return
+        records = self._read_records()
+        markers = [record["seq"] for record in records if record["op"] == SNAPSHOT_OP]
+        if markers:
+            self._snapshot_seq = markers[-1]
+        else:
+            # Only happens before the first snapshot or if the WAL was removed
+            snapshot = self._read_snapshot(self.snapshot_path)
+            self._snapshot_seq = snapshot["seq"] if snapshot is not None else 0
+        self._seq = max([self._snapshot_seq] + [record["seq"] for record in records])
+        self._wal_signature = signature
+
+    def _read_snapshot(self, path: str) -> dict | None:
+        """Read a snapshot, returning None if it is missing or damaged."""
+        try:
+            with open(path, "rb") as f:
+                header = json.loads(f.readline())
+                data = f.read()
+            # The checksum covers the stored bytes, so checking it is a hash
+            if hashlib.sha256(data).hexdigest() != header["checksum"]:
+                return None
+            return {"seq": header["seq"], "stories": json.loads(data)}
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def _read_records(self) -> List[dict]:
+        """Read journal records, stopping at the first torn or corrupted one."""
+        records = []
+        try:
+            with open(self.wal_path, "r") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        break
+                    crc = _record_crc(record["seq"], record["op"], record["data"])
+                    if crc != record.get("crc"):
+                        break
+                    records.append(record)
+        except OSError:
+            pass
+        return records
+
+    @property
+    def seq(self) -> int:
+        """Sequence number of the last appended record."""
+        self._load_position()
+        return self._seq
+
+    def append(self, upserts: Iterable[dict], deletes: Iterable[str]) -> None:
+        """
+        Append the records of one mutation.
+
+        Args:
+            upserts: Serialized stories that were created or changed
+            deletes: IDs of stories that were removed
+        """
+        self._load_position()
+        lines = []
+        for op, items in ((UPSERT_OP, upserts), (DELETE_OP, deletes)):
+            for data in items:
+                self._seq += 1
+                lines.append(_format_record(self._seq, op, data))
+        if not lines:
+            return
+        with open(self.wal_path, "a") as f:
+            f.write("".join(lines))
+            f.flush()
+            if self.durability.mode == FSYNC_EVERY_WRITE_MODE:
+                os.fsync(f.fileno())
+        self._wal_signature = self._signature()
+
+    def is_snapshot_due(self) -> bool:
+        """Check whether enough records were appended since the last snapshot."""
+        self._load_position()
+        if not os.path.exists(self.snapshot_path):
+            # Boards that predate the journal need a base to replay onto
+            return True
+        return self._seq - self._snapshot_seq >= self.snapshot_interval
+
+    def snapshot(self, stories: List[dict]) -> None:
+        """
+        Write a checksummed snapshot and trim the journal.
+
+        Args:
+            stories: Every serialized story on the board, up to the last
+                appended record
+        """
+        self._load_position()
+        previous_snapshot_seq = self._snapshot_seq
+        data = json.dumps(stories).encode("utf-8")
+        header = {"seq": self._seq, "checksum": hashlib.sha256(data).hexdigest()}
+        temp_path = self.snapshot_path + ".tmp"
+        with open(temp_path, "wb") as f:
+            f.write(json.dumps(header).encode("utf-8") + b"\n" + data)
+            f.flush()
+            os.fsync(f.fileno())
+        if os.path.exists(self.snapshot_path):
+            os.replace(self.snapshot_path, self.previous_snapshot_path)
+        os.replace(temp_path, self.snapshot_path)
+        self._snapshot_seq = self._seq
+
+        # Keep the records needed to recover from the previous snapshot
+        lines = [
+            _format_record(record["seq"], record["op"], record["data"])
+            for record in self._read_records()
+            if record["seq"] > previous_snapshot_seq and record["op"] != SNAPSHOT_OP
+        ]
+        lines.append(_format_record(self._seq, SNAPSHOT_OP, None))
+        temp_path = self.wal_path + ".tmp"
+        with open(temp_path, "w") as f:
+            f.write("".join(lines))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.wal_path)
+        self._wal_signature = self._signature()
+
+    def flush(self) -> None:
+        """Make every appended record durable."""
+        try:
+            fd = os.open(self.wal_path, os.O_RDONLY)
+        except FileNotFoundError:
+            return
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+
+    def has_history(self) -> bool:
+        """Check whether there is anything to recover from."""
+        return any(
+            os.path.exists(path)
+            for path in (self.wal_path, self.snapshot_path, self.previous_snapshot_path)
+        )
+
+    def recover(self) -> List[dict]:
+        """
+        Rebuild the board from the newest valid snapshot and the journal.
+
+        Returns:
+            Every serialized story of the last consistent state
+        """
+        records = [
+            record for record in self._read_records() if record["op"] != SNAPSHOT_OP
+        ]
+        first_seq = records[0]["seq"] if records else None
+        stories: Dict[str, dict] = {}
+        base_seq = 0
+        for path in (self.snapshot_path, self.previous_snapshot_path):
+            snapshot = self._read_snapshot(path)
+            # The journal must reach back to the snapshot for a gapless replay
+            if snapshot is None or (
+                first_seq is not None and first_seq > snapshot["seq"] + 1
+            ):
+                continue
+            stories = {story["task_id"]: story for story in snapshot["stories"]}
+            base_seq = snapshot["seq"]
+            break
+        for record in records:
+            if record["seq"] <= base_seq:
+                continue
+            if record["op"] == UPSERT_OP:
+                stories[record["data"]["task_id"]] = record["data"]
+            else:
+                stories.pop(record["data"], None)
+        return list(stories.values())
+
+
+class JournalTail:
+    """
+    Follows a board journal, returning each new record once.
+
+    Only the bytes appended since the previous read are parsed. When a
+    snapshot rewrites the journal, the records the reader has not seen yet
+    are picked out of the new file, unless the rewrite already dropped some
+    of them; the reader then has to reload the board.
+    """
+
+    def __init__(self, journal: BoardJournal):
+        """
+        Initialize the reader.
+
+        Args:
+            journal: The journal to follow
+        """
+        self.journal = journal
+        # Sequence number of the last record returned
+        self.seq = 0
+        self._inode: int | None = None
+        self._offset = 0
+
+    def reset(self, seq: int) -> None:
+        """
+        Continue after the given record, from the end of the journal.
+
+        Must be called while holding the board's mutation lock, so that the
+        end of the journal is the record `seq`.
+        """
+        self.seq = seq
+        try:
+            stat = os.stat(self.journal.wal_path)
+        except OSError:
+            self._inode, self._offset = None, 0
+            return
+        self._inode, self._offset = stat.st_ino, stat.st_size
+
+    def read(self) -> List[dict] | None:
+        """
+        Read the records appended since the last call.
+
+        Returns:
+            The new upsert and delete records, or None if records were lost
+            to a journal rewrite and the board must be reloaded
+        """
+        try:
+            stat = os.stat(self.journal.wal_path)
+        except OSError:
+            return []
+        if stat.st_ino != self._inode or stat.st_size < self._offset:
+            # Rewritten by a snapshot: look for our position in the new file
+            self._inode, self._offset = stat.st_ino, 0
+            records = self._read_new_lines()
+            first_seq = min(
+                (record["seq"] for record in records if record["op"] != SNAPSHOT_OP),
+                default=None,
+            )
+            last_seq = max((record["seq"] for record in records), default=self.seq)
+            if last_seq > self.seq and (first_seq is None or first_seq > self.seq + 1):
+                return None
+        elif stat.st_size == self._offset:
+            return []
+        else:
+            records = self._read_new_lines()
+        new_records = [
+            record
+            for record in records
+            if record["seq"] > self.seq and record["op"] != SNAPSHOT_OP
+        ]
+        self.seq = max([self.seq] + [record["seq"] for record in records])
+        return new_records
+
+    def _read_new_lines(self) -> List[dict]:
+        """Parse the complete records after the current offset."""
+        records = []
+        try:
+            with open(self.journal.wal_path, "rb") as f:
+                f.seek(self._offset)
+                data = f.read()
+        except OSError:
+            return records
+        # A partial last line is still being written; read it next time
+        end = data.rfind(b"\n") + 1
+        for line in data[:end].splitlines():
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                break
+            if _record_crc(record["seq"], record["op"], record["data"]) != record.get(
+                "crc"
+            ):
+                break
+            records.append(record)
+        self._offset += end
+        return records
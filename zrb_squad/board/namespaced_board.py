@@ -0,0 +1,151 @@
+"""
+Board host that keeps the boards of several squads apart.
+"""
+
+import fcntl  # For file locking to prevent race conditions
+import hashlib
+import json
+import os
+import re
+import time
+from typing import Any, Dict, List
+
+from .file_board import FileBoard
+from .sharded_file_board import ShardedFileBoard
+
+
+class NamespacedBoard:
+    """
+    Hosts the boards of several squads under one directory.
+
+    Each squad gets its own namespace: a board with its own storage file,
+    lock, journal, search index, queue-depth counters and valid members, so
+    squads sharing a host (or a working directory) never contend on a lock,
+    scan each other's stories or overwrite each other's member list. A small
+    registry lists the namespaces and the directory each one owns.
+
+    Layout:
+        <dir_path>/namespaces.json
+        <dir_path>/<namespace>/board.json   (or the shard directory)
+    """
+
+    def __init__(
+        self,
+        dir_path: str = "zrb_squad_boards",
+        sharded: bool = False,
+        **board_options: Any,
+    ):
+        """
+        Initialize the board host.
+
+        Args:
+            dir_path: Directory holding one sub-directory per namespace
+            sharded: Give each namespace a ShardedFileBoard instead of a
+                FileBoard
+            **board_options: Options passed to every namespace's board
+                (e.g., routing, durability, poll_policy)
+        """
+        self.dir_path = os.path.expanduser(dir_path)
+        self.sharded = sharded
+        self.board_options = board_options
+        self.registry_path = os.path.join(self.dir_path, "namespaces.json")
+        self._boards: Dict[str, FileBoard] = {}
+        self._directories: Dict[str, str] = {}
+        self._registered: set[str] = set()
+
+    def namespace(self, name: str, register: bool = True) -> FileBoard:
+        """
+        Get (or open) the board of a namespace.
+
+        Args:
+            name: Namespace name, usually the squad name
+            register: Record the namespace in the registry. Opening a board
+                without registering it never writes to the disk, so it can be
+                read (e.g., for its members) without side effects.
+
+        Returns:
+            The namespace's board
+
+        Raises:
+            ValueError: If another namespace already owns the directory
+        """
+        if name not in self._boards:
+            entry = self._read_registry().get(name)
+            directory = entry["directory"] if entry else _directory_name(name)
+            namespace_dir = os.path.join(self.dir_path, directory)
+            if self.sharded:
+                board = ShardedFileBoard(namespace_dir, **self.board_options)
+            else:
+                board = FileBoard(
+                    os.path.join(namespace_dir, "board.json"), **self.board_options
+                )
+            self._boards[name] = board
+            self._directories[name] = directory
+        if register and name not in self._registered:
+            self._register(name, self._directories[name])
+            self._registered.add(name)
+        return self._boards[name]
+
+    def namespaces(self) -> List[str]:
+        """List every registered namespace."""
+        return sorted(self._read_registry())
+
+    def _read_registry(self) -> Dict[str, dict]:
+        try:
+            with open(self.registry_path, "r") as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return {}
+
+    def _register(self, name: str, directory: str) -> None:
+        """
+        Record a namespace in the registry, unless it is already there.
+
+        Raises:
+            ValueError: If another namespace already owns the directory
+        """
+        if name in self._read_registry():
+            return
+        os.makedirs(self.dir_path, exist_ok=True)
+        with open(self.registry_path + ".lock", "w") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                # Re-read under the lock so concurrent registrations are not lost
+                registry = self._read_registry()
+                if name in registry:
+                    return
+                owner = next(
+                    (
+                        other
+                        for other, entry in registry.items()
+                        if entry.get("directory") == directory
+                    ),
+                    None,
+                )
+                if owner is not None:
+                    raise ValueError(
+                        f"Namespace '{name}' would share the directory "
+                        f"'{directory}' of namespace '{owner}'"
+                    )
+                registry[name] = {"directory": directory, "created_at": time.time()}
+                temp_path = self.registry_path + ".tmp"
+                with open(temp_path, "w") as f:
+                    json.dump(registry, f, indent=2)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(temp_path, self.registry_path)
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def _directory_name(name: str) -> str:
+    """
+    Name the directory of a namespace.
+
+    Names that are not safe file names get a hash of the original name, so
+    "my squad", "my/squad" and "my_squad" get three directories.
+    """
+    safe_name = re.sub(r"[^A-Za-z0-9_.-]", "_", name)
+    if safe_name == name:
+        return name
+    return f"{safe_name}-{hashlib.sha1(name.encode()).hexdigest()[:8]}"
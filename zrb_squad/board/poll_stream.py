@@ -0,0 +1,102 @@
+"""
+Adaptive polling streams for board triggers.
+"""
+
+import asyncio
+from typing import Any, AsyncIterable, Callable
+
+
+class PollPolicy:
+    """
+    How board triggers poll the board.
+
+    Triggers with a cheap fingerprint of the board (see `to_adaptive_stream`)
+    compare it every `min_interval` seconds and only run their check when it
+    changed, so a change is seen within `min_interval` however long the board
+    was quiet. Triggers without one run their check every `min_interval`
+    seconds while the board is busy and back off exponentially (by
+    `backoff_factor`, up to `max_interval`) while it is quiet; a notification
+    snaps them back to `min_interval`. When a notification is found, the
+    trigger keeps polling every `debounce` seconds until a poll comes back
+    empty (or `max_batch_wait` has passed) and emits everything it found as a
+    single notification.
+    """
+
+    def __init__(
+        self,
+        min_interval: float = 0.5,
+        max_interval: float = 30.0,
+        backoff_factor: float = 2.0,
+        debounce: float = 1.0,
+        max_batch_wait: float = 5.0,
+    ):
+        if min_interval <= 0 or max_interval < min_interval:
+            raise ValueError("Poll intervals must satisfy 0 < min <= max")
+        if backoff_factor < 1:
+            raise ValueError("Backoff factor must be at least 1")
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff_factor = backoff_factor
+        self.debounce = debounce
+        self.max_batch_wait = max_batch_wait
+
+
+def to_adaptive_stream(
+    check: Callable[[], str],
+    policy: PollPolicy,
+    activity: Callable[[], Any] | None = None,
+) -> Callable[[], AsyncIterable[str]]:
+    """
+    Turn a check function into a trigger that polls adaptively.
+
+    Args:
+        check: Returns a notification message, or an empty string
+        policy: Polling and debouncing settings
+        activity: Returns a cheap fingerprint of the board (e.g., file
+            stats), compared every `min_interval` seconds. While it is
+            unchanged the check is skipped; only checks without a fingerprint
+            back off.
+
+    Returns:
+        A callable returning an infinite AsyncIterable of notifications
+    """
+
+    async def stream() -> AsyncIterable[str]:
+        interval = policy.min_interval
+        last_fingerprint = None
+        is_first_poll = True
+        while True:
+            fingerprint = activity() if activity is not None else None
+            has_changed = is_first_poll or fingerprint != last_fingerprint
+            is_first_poll = False
+            last_fingerprint = fingerprint
+            message = check() if activity is None or has_changed else ""
+            if message:
+                yield await _collect_burst(check, policy, message)
+                last_fingerprint = activity() if activity is not None else None
+                interval = policy.min_interval
+                continue
+            if activity is not None:
+                # Skipped checks cost a stat, so there is nothing to back off
+                await asyncio.sleep(policy.min_interval)
+                continue
+            await asyncio.sleep(interval)
+            interval = min(policy.max_interval, interval * policy.backoff_factor)
+
+    return stream
+
+
+async def _collect_burst(
+    check: Callable[[], str], policy: PollPolicy, first_message: str
+) -> str:
+    """Keep polling while notifications keep coming, then merge them."""
+    messages = [first_message]
+    waited = 0.0
+    while policy.debounce > 0 and waited < policy.max_batch_wait:
+        await asyncio.sleep(policy.debounce)
+        waited += policy.debounce
+        message = check()
+        if not message:
+            break
+        messages.append(message)
+    return "\n".join(messages)
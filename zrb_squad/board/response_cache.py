@@ -0,0 +1,210 @@
+"""
+Squad-wide cache of task results, keyed by what the task asks for.
+"""
+
+import fcntl  # For file locking to prevent race conditions
+import hashlib
+import json
+import os
+import re
+import time
+from contextlib import contextmanager
+from typing import Collection, Dict, Iterator, List, Set
+
+from .rwlock import ReadWriteLock
+
+# Words shaped like task IDs: legacy uuid4 IDs and compact IDs. Hex hashes
+# can look the same, so only the IDs of stories on the board are left out of
+# a key.
+_TASK_ID_PATTERN = re.compile(
+    r"\b(?:[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}"
+    r"|0[0-9a-hjkmnp-tv-z]{15})\b",
+    re.IGNORECASE,
+)
+# Recency only orders evictions, so a hit records it at most this often
+LAST_USED_RESOLUTION_SECONDS = 60.0
+
+
+def find_task_ids(text: str) -> Set[str]:
+    """Find the words of a text that look like task IDs."""
+    return set(_TASK_ID_PATTERN.findall(text))
+
+
+def normalize(text: str, task_ids: Collection[str] = ()) -> str:
+    """
+    Normalize a text so near-identical descriptions map to the same key.
+
+    Args:
+        text: The text to normalize
+        task_ids: IDs of stories on the board; task IDs differ between
+            re-plans of the same work, so they are not part of a key
+    """
+    text = text.casefold()
+    if task_ids:
+        known = {task_id.casefold() for task_id in task_ids}
+        text = _TASK_ID_PATTERN.sub(
+            lambda match: "<task>" if match.group(0) in known else match.group(0),
+            text,
+        )
+    return " ".join(text.split()).strip(" .")
+
+
+class ResponseCache:
+    """
+    Results of completed tasks, shared by every member of a squad.
+
+    Entries are keyed by a hash of the assignee's role, the normalized task
+    description and the task's context (the results of its dependencies), so
+    a re-plan that re-assigns the same work to any member of the same role
+    finds the earlier result. Entries expire after `ttl` seconds; beyond
+    `max_entries`, the least recently used ones are evicted. Results longer
+    than `max_result_chars` are not cached.
+    """
+
+    def __init__(
+        self,
+        file_path: str = "zrb_squad_responses.json",
+        ttl: float = 7 * 24 * 3600,
+        max_entries: int = 256,
+        max_result_chars: int = 4000,
+    ):
+        """
+        Initialize the response cache.
+
+        Args:
+            file_path: Path to the JSON file for storage (created on first put)
+            ttl: Seconds an entry stays valid
+            max_entries: Maximum number of entries kept
+            max_result_chars: Longest result that is cached
+        """
+        self.file_path = os.path.expanduser(file_path)
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_result_chars = max_result_chars
+        # Guards the cached entries against the other threads of this process;
+        # the file lock only keeps other processes out
+        self._thread_lock = ReadWriteLock()
+        self._entries: Dict[str, dict] = {}
+        self._signature: tuple | None = None
+
+    @staticmethod
+    def make_key(
+        role: str,
+        description: str,
+        context: List[str],
+        task_ids: Collection[str] = (),
+    ) -> str:
+        """
+        Build the cache key of a task.
+
+        Args:
+            role: Role of the assignee (or its name if it has no role)
+            description: Description of the task
+            context: Texts the result depends on, e.g. dependency results
+            task_ids: IDs of stories on the board mentioned in the texts
+
+        Returns:
+            A SHA-256 hex digest
+        """
+        payload = json.dumps(
+            [
+                role,
+                normalize(description, task_ids),
+                sorted(normalize(item, task_ids) for item in context),
+            ]
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> str | None:
+        """
+        Look up a cached result.
+
+        Returns:
+            The cached result, or None if there is no valid entry
+        """
+        entry = self._load().get(key)
+        now = time.time()
+        if entry is None or now - entry["stored_at"] > self.ttl:
+            return None
+        if now - entry["last_used"] >= LAST_USED_RESOLUTION_SECONDS:
+            with self._lock():
+                entries = dict(self._load())
+                if key in entries:
+                    entries[key] = dict(entries[key], last_used=now)
+                    self._save(entries)
+        return entry["result"]
+
+    def put(self, key: str, result: str) -> None:
+        """
+        Cache the result of a task.
+
+        Args:
+            key: Cache key from `make_key`
+            result: The result to cache
+        """
+        if not result or len(result) > self.max_result_chars:
+            return
+        with self._lock():
+            entries = dict(self._load())
+            now = time.time()
+            entries[key] = {"result": result, "stored_at": now, "last_used": now}
+            self._save(self._evict(entries, now))
+
+    def _evict(self, entries: Dict[str, dict], now: float) -> Dict[str, dict]:
+        """Drop expired entries, then the least recently used ones."""
+        live = {
+            key: entry
+            for key, entry in entries.items()
+            if now - entry["stored_at"] <= self.ttl
+        }
+        if len(live) <= self.max_entries:
+            return live
+        kept = sorted(live.items(), key=lambda item: item[1]["last_used"])
+        return dict(kept[-self.max_entries :])
+
+    def _file_signature(self) -> tuple | None:
+        try:
+            stat = os.stat(self.file_path)
+        except OSError:
+            return None
+        return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+    def _load(self) -> Dict[str, dict]:
+        """Read the entries, reusing them while the file is unchanged."""
+        signature = self._file_signature()
+        with self._thread_lock.read():
+            if signature == self._signature:
+                return self._entries
+        try:
+            with open(self.file_path, "r") as f:
+                entries = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            # A missing or damaged cache only costs cache misses
+            entries = {}
+        with self._thread_lock.write():
+            self._entries = entries
+            self._signature = signature
+        return entries
+
+    def _save(self, entries: Dict[str, dict]) -> None:
+        temp_path = self.file_path + ".tmp"
+        with open(temp_path, "w") as f:
+            json.dump(entries, f)
+        os.replace(temp_path, self.file_path)
+        with self._thread_lock.write():
+            self._entries = entries
+            self._signature = self._file_signature()
+
+    @contextmanager
+    def _lock(self) -> Iterator[None]:
+        """Serialize read-modify-write cycles across threads and processes."""
+        dir_path = os.path.dirname(self.file_path)
+        if dir_path:
+            os.makedirs(dir_path, exist_ok=True)
+        with self._thread_lock.write():
+            with open(self.file_path + ".lock", "w") as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
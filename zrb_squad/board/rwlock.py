@@ -0,0 +1,76 @@
+"""
+Reader/writer lock for the threads of one process sharing a board.
+"""
+
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator
+
+
+class ReadWriteLock:
+    """
+    Lets many threads read at once, or one thread write.
+
+    Waiting writers go first, so a steady stream of readers (e.g., trigger
+    polls) cannot starve an assignment. Both sides are re-entrant: a thread
+    that reads may read again, and a thread that writes may read or write
+    again. A reader may not start writing, since two readers doing so at once
+    would wait for each other forever.
+    """
+
+    def __init__(self):
+        self._condition = threading.Condition(threading.Lock())
+        # Read depth of every thread currently reading
+        self._readers: Dict[int, int] = {}
+        self._writer: int | None = None
+        self._write_depth = 0
+        self._waiting_writers = 0
+
+    @contextmanager
+    def read(self) -> Iterator[None]:
+        """Hold the lock shared for the duration of the block."""
+        thread = threading.get_ident()
+        with self._condition:
+            if self._writer != thread and thread not in self._readers:
+                while self._writer is not None or self._waiting_writers:
+                    self._condition.wait()
+            self._readers[thread] = self._readers.get(thread, 0) + 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                depth = self._readers.pop(thread) - 1
+                if depth:
+                    self._readers[thread] = depth
+                elif not self._readers:
+                    self._condition.notify_all()
+
+    @contextmanager
+    def write(self) -> Iterator[None]:
+        """
+        Hold the lock exclusively for the duration of the block.
+
+        Raises:
+            RuntimeError: If the calling thread is reading
+        """
+        thread = threading.get_ident()
+        with self._condition:
+            if self._writer != thread:
+                if thread in self._readers:
+                    raise RuntimeError("Cannot upgrade a read lock to a write lock")
+                self._waiting_writers += 1
+                try:
+                    while self._writer is not None or self._readers:
+                        self._condition.wait()
+                finally:
+                    self._waiting_writers -= 1
+                self._writer = thread
+            self._write_depth += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._write_depth -= 1
+                if not self._write_depth:
+                    self._writer = None
+                    self._condition.notify_all()
@@ -0,0 +1,88 @@
+"""
+Inverted index for full-text search over board stories.
+"""
+
+import re
+from typing import Dict, List
+
+from .story import Story
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: str) -> set[str]:
+    """Split a text into lowercase search tokens."""
+    return {token for token in _TOKEN_PATTERN.findall(text.lower()) if len(token) > 1}
+
+
+class SearchIndex:
+    """
+    Inverted index from tokens to story IDs.
+
+    The index is maintained incrementally: syncing it with the board only
+    tokenizes stories that are new or changed (every change bumps a story's
+    version) and drops the ones that are gone, so keeping it up to date costs
+    a set difference rather than a re-index.
+    """
+
+    def __init__(self):
+        self._postings: Dict[str, set[str]] = {}
+        self._tokens: Dict[str, set[str]] = {}
+        self._stories: Dict[str, Story] = {}
+        # Version of each story when it was tokenized
+        self._versions: Dict[str, int] = {}
+
+    def sync(self, stories: List[Story]) -> None:
+        """Bring the index in line with the current stories."""
+        current = {story.task_id: story for story in stories}
+        for task_id in self._stories.keys() - current.keys():
+            self._remove(task_id)
+        for task_id, story in current.items():
+            version = self._versions.get(task_id)
+            if version == story.version:
+                continue
+            if version is not None:
+                # Changed since it was tokenized, e.g. a new description
+                self._remove(task_id)
+            self._add(story)
+        # Keep the latest objects so results reflect completion status
+        self._stories = current
+
+    def _add(self, story: Story) -> None:
+        tokens = tokenize(story.description)
+        self._tokens[story.task_id] = tokens
+        self._versions[story.task_id] = story.version
+        for token in tokens:
+            self._postings.setdefault(token, set()).add(story.task_id)
+
+    def _remove(self, task_id: str) -> None:
+        self._versions.pop(task_id, None)
+        for token in self._tokens.pop(task_id, set()):
+            postings = self._postings.get(token)
+            if postings is None:
+                continue
+            postings.discard(task_id)
+            if not postings:
+                del self._postings[token]
+
+    def search(self, text: str, limit: int = 10) -> List[tuple[int, Story]]:
+        """
+        Find the stories matching the most query tokens.
+
+        Args:
+            text: The query
+            limit: Maximum number of results
+
+        Returns:
+            (score, story) pairs, best matches (then most recent) first
+        """
+        scores: Dict[str, int] = {}
+        for token in tokenize(text):
+            for task_id in self._postings.get(token, ()):
+                scores[task_id] = scores.get(task_id, 0) + 1
+        ranked = sorted(
+            scores.items(),
+            key=lambda item: (item[1], self._stories[item[0]].created_at),
+            reverse=True,
+        )
+        return [(score, self._stories[task_id]) for task_id, score in ranked[:limit]]
@@ -0,0 +1,647 @@
+"""
+Sharded file-based implementation of the kanban board.
+"""
+
+import fcntl  # For file locking to prevent race conditions
+import heapq
+import json
+import os
+import re
+import threading
+from contextlib import ExitStack
+from typing import Any, Dict, List
+
+from .durability import Durability, fsync_every_write
+from .file_board import (
+    OVERFLOW_SPILL,
+    ROUTE_BY_QUEUE_DEPTH,
+    FileBoard,
+    VersionConflictError,
+)
+from .journal import JournalTail
+from .poll_stream import PollPolicy
+from .story import Story, task_id_timestamp
+
+
+class ShardedFileBoard(FileBoard):
+    """
+    File-based kanban board with one storage file per assignee.
+
+    Every assignee gets its own shard (a JSON file with its own lock), so
+    writes for different members proceed in parallel. A small index file keeps
+    track of which shards each assigner has assigned into and where stories
+    that others depend on live, so triggers only read the shards they need.
+
+    Layout:
+        <dir_path>/index.json
+        <dir_path>/shard-<assignee>.json
+    """
+
+    def __init__(
+        self,
+        dir_path: str = "zrb_squad_board",
+        routing: str = ROUTE_BY_QUEUE_DEPTH,
+        durability: Durability | str = fsync_every_write,
+        blob_threshold: int = 1024,
+        poll_policy: PollPolicy | None = None,
+        snapshot_interval: int = 100,
+        max_pending_per_member: int | None = None,
+        max_pending: int | None = None,
+        overflow: str = OVERFLOW_SPILL,
+    ):
+        """
+        Initialize the sharded board.
+
+        Args:
+            dir_path: Directory holding the index and the shard files
+            routing: How `role:<role>` assignments pick a member
+            durability: How shard writes are made durable
+            blob_threshold: Descriptions longer than this many characters are
+                stored as blobs, shared by every shard
+            poll_policy: How triggers poll their shards
+            snapshot_interval: Number of journaled changes between two
+                snapshots of a shard
+            max_pending_per_member: Most incomplete tasks a member may have
+            max_pending: Most incomplete tasks across every shard
+            overflow: What happens when the assignee's queue is full, either
+                "spill" or "reject"
+        """
+        self.dir_path = os.path.expanduser(dir_path)
+        self._shards: Dict[str, FileBoard] = {}
+        self._shards_lock = threading.Lock()
+        # External dependencies of each assignee's incomplete stories, keyed
+        # by the signature of the assignee's shard
+        self._waiting_on_cache: Dict[str, tuple[tuple | None, set[str]]] = {}
+        # Pending count of each shard, keyed by the signature of the shard
+        self._pending_cache: Dict[str, tuple[tuple | None, int]] = {}
+        # Assignments of this process admitted but not written yet, by assignee
+        self._in_flight: Dict[str, int] = {}
+        super().__init__(
+            os.path.join(self.dir_path, "index.json"),
+            routing=routing,
+            durability=durability,
+            blob_threshold=blob_threshold,
+            blob_dir=os.path.join(self.dir_path, "blobs"),
+            poll_policy=poll_policy,
+            snapshot_interval=snapshot_interval,
+            max_pending_per_member=max_pending_per_member,
+            max_pending=max_pending,
+            overflow=overflow,
+        )
+
+    def _open_storage(self) -> None:
+        """Keep no journal, delta log or aggregates; the shards hold the stories."""
+
+    def _shard(self, assignee: str) -> FileBoard:
+        """Get (or open) the shard holding an assignee's stories."""
+        shard = self._shards.get(assignee)
+        if shard is not None:
+            return shard
+        with self._shards_lock:
+            # Threads must share one shard object, and with it its locks
+            if assignee not in self._shards:
+                safe_name = re.sub(r"[^A-Za-z0-9_.-]", "_", assignee)
+                shard_path = os.path.join(self.dir_path, f"shard-{safe_name}.json")
+                self._shards[assignee] = FileBoard(
+                    shard_path,
+                    routing=self.routing,
+                    durability=self.durability,
+                    blob_threshold=self.blob_threshold,
+                    blob_dir=self._blob_store.dir_path,
+                    snapshot_interval=self.snapshot_interval,
+                )
+            return self._shards[assignee]
+
+    def flush(self) -> None:
+        """Make every write so far durable, in every open shard."""
+        for shard in list(self._shards.values()):
+            shard.flush()
+
+    def _read_index(self) -> dict:
+        """Read the directory/index file."""
+        try:
+            with open(self.file_path, "r") as f:
+                index = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            index = {}
+        index.setdefault("assigners", {})
+        index.setdefault("dependencies", {})
+        return index
+
+    def _update_index(
+        self, assigner: str, assignee: str, dependencies: Dict[str, str]
+    ) -> None:
+        """
+        Record an assigner -> assignee edge and dependency locations.
+
+        The index only changes when a new edge or dependency shows up, so most
+        assignments never take the index lock.
+        """
+        index = self._read_index()
+        known_assignees = index["assigners"].get(assigner, [])
+        new_dependencies = {
+            task_id: owner
+            for task_id, owner in dependencies.items()
+            if index["dependencies"].get(task_id) != owner
+        }
+        if assignee in known_assignees and not new_dependencies:
+            return
+
+        os.makedirs(self.dir_path, exist_ok=True)
+        with open(self.file_path + ".lock", "w") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                # Re-read under the lock so concurrent updates are not lost
+                index = self._read_index()
+                assignees = index["assigners"].setdefault(assigner, [])
+                if assignee not in assignees:
+                    assignees.append(assignee)
+                index["dependencies"].update(dependencies)
+                temp_path = self.file_path + ".tmp"
+                with open(temp_path, "w") as f:
+                    json.dump(index, f, indent=2)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(temp_path, self.file_path)
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _known_assignees(self, index: dict | None = None) -> List[str]:
+        """List every assignee that has a shard."""
+        if index is None:
+            index = self._read_index()
+        assignees = set(self._valid_members)
+        for targets in index["assigners"].values():
+            assignees.update(targets)
+        return sorted(assignees)
+
+    def _locate_stories(
+        self, task_ids: set[str], hint_assignees: List[str] | None = None
+    ) -> Dict[str, Story]:
+        """
+        Find stories by ID, reading as few shards as possible.
+
+        Stories recorded in the index are read from their shard directly,
+        otherwise the hinted shards are searched before all the others.
+        """
+        if not task_ids:
+            return {}
+        found: Dict[str, Story] = {}
+        index = self._read_index()
+        by_owner: Dict[str, set[str]] = {}
+        for task_id in task_ids:
+            owner = index["dependencies"].get(task_id)
+            if owner is not None:
+                by_owner.setdefault(owner, set()).add(task_id)
+        search_order = list(by_owner) + list(hint_assignees or [])
+        search_order += self._known_assignees(index)
+        for owner in dict.fromkeys(search_order):
+            missing = task_ids - found.keys()
+            if not missing:
+                break
+            for story in self._shard(owner)._read_stories():
+                if story.task_id in missing:
+                    found[story.task_id] = story
+        return found
+
+    def _dependency_closure(
+        self, task_ids: List[str], hint_assignees: List[str]
+    ) -> List[Story]:
+        """Collect the given stories and everything they transitively depend on."""
+        closure: Dict[str, Story] = {}
+        pending = set(task_ids)
+        while pending:
+            found = self._locate_stories(pending, hint_assignees)
+            closure.update(found)
+            pending = {
+                dependency_id
+                for story in found.values()
+                for dependency_id in story.blocked_by
+                if dependency_id not in closure
+            }
+            if not found:
+                break
+        return list(closure.values())
+
+    def _shard_pending(self, member: str) -> int:
+        """Get a member's number of incomplete tasks from its shard."""
+        depth, totals = self._shard(member)._member_load(member)
+        with self._lock.write():
+            self._queue_depths[member] = depth
+            if totals is not None:
+                self._completion_totals[member] = totals
+        return depth
+
+    def _pending_count(self, member: str) -> int:
+        """Get a member's incomplete tasks, counting assignments in flight."""
+        depth = self._shard_pending(member)
+        with self._lock.read():
+            return depth + self._in_flight.get(member, 0)
+
+    def _total_pending(self) -> int:
+        """
+        Get the number of incomplete tasks across every shard.
+
+        Only the shards written since the last count are recounted; the
+        others cost one `stat` each. A board-wide counter in the index would
+        put every assignment and completion back on the index lock.
+        Assignments this process admitted but has not written yet count too.
+        """
+        total = 0
+        for member in self._known_assignees():
+            signature = self._shard(member)._file_signature()
+            with self._lock.read():
+                cached = self._pending_cache.get(member)
+            if cached is None or cached[0] != signature:
+                cached = (signature, self._shard_pending(member))
+                with self._lock.write():
+                    self._pending_cache[member] = cached
+            total += cached[1]
+        with self._lock.read():
+            return total + sum(self._in_flight.values())
+
+    def queue_depth(self, member: str) -> int:
+        """Get the number of incomplete tasks assigned to a member."""
+        return self._shard_pending(member)
+
+    def _route_to_role(self, role: str) -> str:
+        """Pick the member of a role with the lightest load, per shard."""
+        for member, member_role in self._member_roles.items():
+            if member_role == role:
+                self._pending_count(member)
+        return super()._route_to_role(role)
+
+    def assign(
+        self,
+        assigner: str,
+        assignee: str,
+        task_name: str,
+        description: str,
+        blocked_by: list[str] | None = None,
+    ) -> Story:
+        """
+        Assign a new task to a squad member.
+
+        Routing and the limits are checked under the board's in-process lock,
+        and an admitted assignment counts against them until it is written,
+        so this process's threads see each other's choices. Other processes
+        only see written tasks: the per-member limit is checked again under
+        the shard's lock, while the board-wide `max_pending` is soft across
+        processes. Only the write itself holds the shard's lock.
+        """
+        with self._lock.write():
+            target = self._resolve_assignee(assigner, assignee)
+        story = Story(
+            assignee=target,
+            assigner=assigner,
+            description=f"{task_name}: {description}",
+            blocked_by=blocked_by,
+        )
+        self._store_description(story)
+        dependencies: Dict[str, str] = {}
+        if story.blocked_by:
+            hints = self._read_index()["assigners"].get(assigner, [])
+            closure = self._dependency_closure(story.blocked_by, hints)
+            self._validate_dependencies(story, closure)
+            dependencies = {
+                item.task_id: item.assignee
+                for item in closure
+                if item.task_id in story.blocked_by
+            }
+
+        while True:
+            with self._lock.write():
+                story.assignee = self._admit(target)
+                self._in_flight[story.assignee] = (
+                    self._in_flight.get(story.assignee, 0) + 1
+                )
+            try:
+                if self._write_new_story(story, dependencies):
+                    return story
+            finally:
+                with self._lock.write():
+                    self._in_flight[story.assignee] -= 1
+                    if not self._in_flight[story.assignee]:
+                        del self._in_flight[story.assignee]
+            # Another process filled the queue since it was checked; admitting
+            # again spills to a peer of the same role or rejects the task
+
+    def _write_new_story(self, story: Story, dependencies: Dict[str, str]) -> bool:
+        """
+        Write a new story to its assignee's shard, unless the queue is full.
+
+        The queue is checked under the shard's lock before the index is
+        updated, so a rejected story never reaches the index. The index is
+        updated before the shard: an entry for a story that was never written
+        is harmless, while a story missing from the index would be missed by
+        its assigner's completion trigger.
+
+        Returns:
+            False if the assignee's queue is full
+        """
+        shard = self._shard(story.assignee)
+        limit = self.max_pending_per_member
+        with shard._mutation_lock():
+            depth, _ = shard._member_load(story.assignee)
+            if limit is not None and depth >= limit:
+                return False
+            self._update_index(story.assigner, story.assignee, dependencies)
+            shard._insert_story(story, limit=limit)
+        return True
+
+    def reassign_pending(self, from_member: str, to: str) -> List[Story]:
+        """
+        Move every incomplete task of a member to other members' shards.
+
+        Each story is re-read and moved while holding the locks of both
+        shards (taken in name order, like `compare_and_update`), so a task the
+        old assignee completes meanwhile is either left in place, completed,
+        or moved before it could be completed. Stories are added to their new
+        shard before they are removed from the old one, so a crash in between
+        duplicates a task instead of losing it.
+        """
+        source = self._shard(from_member)
+        task_ids = [
+            story.task_id
+            for story in source._read_stories()
+            if story.assignee == from_member and not story.is_completed
+        ]
+        moved = []
+        for task_id in task_ids:
+            # Routed one by one, so each choice sees the previous ones
+            target_name = self._reroute_target(to)
+            if target_name == from_member:
+                continue
+            with ExitStack() as stack:
+                for name in sorted({from_member, target_name}):
+                    stack.enter_context(self._shard(name)._mutation_lock())
+                story = next(
+                    (
+                        item
+                        for item in source._read_stories()
+                        if item.task_id == task_id
+                    ),
+                    None,
+                )
+                if story is None or story.is_completed:
+                    # Completed or moved by someone else since it was listed
+                    continue
+                story.assignee = target_name
+                story.version += 1
+                self._record_location(story)
+                self._move_story(story, source, self._shard(target_name))
+            moved.append(story)
+        return moved
+
+    def compare_and_update(
+        self, task_id: str, expected_version: int, changes: Dict[str, Any]
+    ) -> Story:
+        """
+        Change a story, unless it changed since the writer read it.
+
+        Only the story's shard is locked, so writers of stories assigned to
+        different members never wait for each other. Reassigning a story
+        locks both shards, always in name order, and moves it.
+        """
+        self._validate_changes(changes)
+        found = self._locate_stories({task_id}).get(task_id)
+        if found is None:
+            raise ValueError(f"Unknown task '{task_id}'")
+        if found.version != expected_version:
+            raise VersionConflictError(task_id, expected_version, found.version)
+        source_name = found.assignee
+        if "assignee" in changes:
+            changes = dict(changes, assignee=self._reroute_target(changes["assignee"]))
+        target_name = changes.get("assignee", source_name)
+        source, target = self._shard(source_name), self._shard(target_name)
+        with ExitStack() as stack:
+            for name in sorted({source_name, target_name}):
+                stack.enter_context(self._shard(name)._mutation_lock())
+            stories = source._read_stories()
+            story = next((item for item in stories if item.task_id == task_id), None)
+            if story is None:
+                # Moved to another shard since it was located
+                raise VersionConflictError(task_id, expected_version, None)
+            if story.version != expected_version:
+                raise VersionConflictError(task_id, expected_version, story.version)
+            dependency_pool = stories
+            if "blocked_by" in changes:
+                dependency_pool = self._dependency_closure(
+                    list(changes["blocked_by"] or []), [source_name]
+                )
+            self._apply_changes(story, changes, dependency_pool)
+            dependencies = {}
+            if "blocked_by" in changes:
+                dependencies = {
+                    item.task_id: item.assignee
+                    for item in dependency_pool
+                    if item.task_id in story.blocked_by
+                }
+            self._record_location(story, dependencies)
+            if target is source:
+                source._replace_story(story)
+            else:
+                self._move_story(story, source, target)
+        return story
+
+    def update(self, task_id: str, patch: Dict[str, Any]) -> Story:
+        """Set a story's result and/or metadata in the delta log of its shard."""
+        return self._shard(self._story_owner(task_id)).update(task_id, patch)
+
+    def append_note(self, task_id: str, text: str, author: str = "") -> Story:
+        """Add a progress note to the delta log of the story's shard."""
+        owner = self._story_owner(task_id)
+        return self._shard(owner).append_note(task_id, text, author=author)
+
+    def _story_owner(self, task_id: str) -> str:
+        """Get the assignee whose shard holds a story."""
+        found = self._locate_stories({task_id}).get(task_id)
+        if found is None:
+            raise ValueError(f"Unknown task '{task_id}'")
+        return found.assignee
+
+    def _record_location(
+        self, story: Story, dependencies: Dict[str, str] | None = None
+    ) -> None:
+        """
+        Record the shard a changed story is about to be written to.
+
+        Args:
+            story: The story, with its new assignee
+            dependencies: Shards of the story's new dependencies
+        """
+        index = self._read_index()
+        located = (
+            {story.task_id: story.assignee}
+            if story.task_id in index["dependencies"]
+            else {}
+        )
+        located.update(dependencies or {})
+        self._update_index(story.assigner, story.assignee, located)
+
+    def _move_story(self, story: Story, source: FileBoard, target: FileBoard) -> None:
+        """
+        Move a reassigned story to its new shard.
+
+        Must be called while holding the mutation locks of both shards. The
+        story is added to the new shard first, so a crash in between
+        duplicates it instead of losing it.
+        """
+        target._insert_story(story)
+        source._remove_story(story.task_id)
+
+    def get_by_assignee(self, assignee: str) -> List[Story]:
+        """Get all tasks assigned to a specific squad member."""
+        return self._shard(assignee).get_by_assignee(assignee)
+
+    def get_by_assigner(self, assigner: str) -> List[Story]:
+        """Get all tasks assigned by a specific squad member."""
+        assignees = self._read_index()["assigners"].get(assigner, [])
+        stories = []
+        for assignee in assignees:
+            stories.extend(self._shard(assignee).get_by_assigner(assigner))
+        return stories
+
+    def complete(self, task_id: str, assignee: str, result: str | None = None) -> bool:
+        """Mark a task as completed."""
+        if not self._shard(assignee).complete(task_id, assignee, result=result):
+            return False
+        if self._response_cache is not None:
+            story = self._locate_stories({task_id}, [assignee]).get(task_id)
+            if story is not None:
+                self._remember_response(story)
+        return True
+
+    def get_all(self) -> List[Story]:
+        """Get all tasks in the board."""
+        stories = []
+        for assignee in self._known_assignees():
+            stories.extend(self._shard(assignee)._read_stories())
+        return stories
+
+    def get_since(self, since: float | str) -> List[Story]:
+        """Get the stories created after a timestamp, or after a given story."""
+        if isinstance(since, str):
+            story = self._locate_stories({since}).get(since)
+            if story is not None:
+                key = (story.created_at, story.task_id)
+            elif task_id_timestamp(since) is not None:
+                key = (task_id_timestamp(since), since)
+            else:
+                raise ValueError(f"Unknown task '{since}'")
+        else:
+            key = self._resolve_since(since)
+        # Each shard is already in creation order
+        return list(
+            heapq.merge(
+                *[
+                    self._shard(assignee)._stories_after(key)
+                    for assignee in self._known_assignees()
+                ],
+                key=lambda story: (story.created_at, story.task_id),
+            )
+        )
+
+    def journal_sources(self) -> List[str]:
+        """Name the shards, each with its own journal, by assignee."""
+        return self._known_assignees()
+
+    def read_and_follow(self, source: str = "") -> tuple[List[Story], JournalTail]:
+        """Read the stories of an assignee's shard and start following its journal."""
+        return self._shard(source).read_and_follow()
+
+    def _split_shard_by_readiness(
+        self, assignee: str
+    ) -> tuple[List[Story], List[Story]]:
+        """Split an assignee's incomplete stories, reading dependency shards only."""
+        stories = self._shard(assignee)._read_stories()
+        external_ids = _external_dependencies(stories)
+        if external_ids:
+            stories = stories + list(self._locate_stories(external_ids).values())
+        return self._split_by_readiness(stories, assignee)
+
+    def get_pending_by_assignee(self, assignee: str) -> List[Story]:
+        """Get pending (incomplete) tasks assigned to a specific squad member."""
+        ready, _ = self._split_shard_by_readiness(assignee)
+        return ready
+
+    def get_blocked_by_assignee(self, assignee: str) -> List[Story]:
+        """Get incomplete tasks that are still waiting for their dependencies."""
+        _, blocked = self._split_shard_by_readiness(assignee)
+        return blocked
+
+    def get_completed_by_assignee(self, assignee: str) -> List[Story]:
+        """Get completed tasks assigned to a specific squad member."""
+        return self._shard(assignee).get_completed_by_assignee(assignee)
+
+    def _activity_signature(self, agent_name: str) -> Any:
+        """
+        Fingerprint only the shards an agent's triggers read.
+
+        That is the agent's own shard, the shards it assigned into, and the
+        shards holding what its blocked tasks wait on (their completion makes
+        a task ready without touching the agent's shard).
+        """
+        index = self._read_index()
+        relevant = {agent_name}
+        relevant.update(index["assigners"].get(agent_name, []))
+        relevant.update(
+            index["dependencies"][task_id]
+            for task_id in self._waiting_on(agent_name)
+            if task_id in index["dependencies"]
+        )
+        return tuple(
+            (assignee, self._shard(assignee)._file_signature())
+            for assignee in sorted(relevant)
+        )
+
+    def _waiting_on(self, assignee: str) -> set[str]:
+        """Get the IDs in other shards that an assignee's tasks depend on."""
+        shard = self._shard(assignee)
+        signature = shard._file_signature()
+        with self._lock.read():
+            cached = self._waiting_on_cache.get(assignee)
+        if cached is not None and cached[0] == signature:
+            return cached[1]
+        waiting = _external_dependencies(shard._read_stories())
+        with self._lock.write():
+            self._waiting_on_cache[assignee] = (signature, waiting)
+        return waiting
+
+    def _raw_stats(self) -> Dict[str, dict]:
+        """Merge the running aggregates of every shard."""
+        members: Dict[str, dict] = {}
+        for assignee in self._known_assignees():
+            members.update(self._shard(assignee)._raw_stats())
+        return members
+
+    def _search_scored(self, text: str, limit: int) -> List[tuple[int, Story]]:
+        """Search every shard's index and merge the best matches."""
+        results = []
+        for assignee in self._known_assignees():
+            results.extend(self._shard(assignee)._search_scored(text, limit))
+        results.sort(key=lambda item: (item[0], item[1].created_at), reverse=True)
+        return results[:limit]
+
+    def delete(self, task_id: str, assigner: str) -> bool:
+        """Delete a task from the board."""
+        for assignee in self._read_index()["assigners"].get(assigner, []):
+            if self._shard(assignee).delete(task_id, assigner):
+                return True
+        return False
+
+    def clear_completed(self, assignee: str) -> int:
+        """Clear all completed tasks for a specific assignee."""
+        return self._shard(assignee).clear_completed(assignee)
+
+
+def _external_dependencies(stories: List[Story]) -> set[str]:
+    """Get the dependencies of incomplete stories that are not among them."""
+    own_ids = {story.task_id for story in stories}
+    return {
+        dependency_id
+        for story in stories
+        if not story.is_completed
+        for dependency_id in story.blocked_by
+        if dependency_id not in own_ids
+    }
@@ -0,0 +1,226 @@
+"""
+Running aggregates of board activity.
+"""
+
+import json
+import os
+import time
+from typing import Any, Dict, Iterable, List
+
+from .story import Story
+
+# Completions within this window count towards the completion rate
+RATE_WINDOW_SECONDS = 15 * 60
+# Most recent time-to-complete samples kept per member for percentiles
+MAX_DURATIONS = 500
+
+ASSIGNED = "assigned"
+COMPLETED = "completed"
+REMOVED = "removed"
+
+
+def _empty_member() -> Dict[str, Any]:
+    return {"pending": 0, "completed": 0, "durations": [], "completions": []}
+
+
+class BoardStats:
+    """
+    Per-member aggregates, updated by each mutation instead of by scans.
+
+    The aggregates live in a small sidecar file, tagged with the journal
+    sequence number they reflect. A mutation applies its own changes when the
+    sidecar is current; if it is not (e.g., after a crash between the board
+    write and the sidecar write), the sidecar is rebuilt from the board once.
+    """
+
+    def __init__(self, file_path: str):
+        """
+        Initialize the aggregates.
+
+        Args:
+            file_path: Path of the board file the aggregates belong to
+        """
+        self.file_path = file_path + ".stats.json"
+        self._data: Dict[str, Any] = {"seq": None, "members": {}}
+        self._signature: tuple | None = None
+
+    def _file_signature(self) -> tuple | None:
+        try:
+            stat = os.stat(self.file_path)
+        except OSError:
+            return None
+        return (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+    def _load(self) -> Dict[str, Any]:
+        signature = self._file_signature()
+        if signature is not None and signature == self._signature:
+            return self._data
+        try:
+            with open(self.file_path, "r") as f:
+                self._data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            self._data = {"seq": None, "members": {}}
+        self._signature = signature
+        return self._data
+
+    def _save(self, data: Dict[str, Any]) -> None:
+        # Derived data: a lost write only costs a rebuild, so no fsync
+        temp_path = self.file_path + ".tmp"
+        with open(temp_path, "w") as f:
+            json.dump(data, f)
+        os.replace(temp_path, self.file_path)
+        self._data = data
+        self._signature = self._file_signature()
+
+    def apply(
+        self,
+        previous_seq: int,
+        seq: int,
+        changes: Iterable[tuple],
+        stories: List[Story],
+    ) -> None:
+        """
+        Apply the changes of one mutation.
+
+        Must be called while holding the board's mutation lock.
+
+        Args:
+            previous_seq: Journal sequence number before the mutation
+            seq: Journal sequence number after the mutation
+            changes: (ASSIGNED, assignee), (COMPLETED, assignee, duration,
+                completed_at) or (REMOVED, assignee) tuples
+            stories: Every story on the board after the mutation, used if the
+                aggregates have to be rebuilt
+        """
+        data = self._load()
+        if data["seq"] != previous_seq:
+            data = self._rebuild(stories)
+        else:
+            now = time.time()
+            for change in changes:
+                member = data["members"].setdefault(change[1], _empty_member())
+                if change[0] == ASSIGNED:
+                    member["pending"] += 1
+                elif change[0] == COMPLETED:
+                    member["pending"] = max(0, member["pending"] - 1)
+                    member["completed"] += 1
+                    member["durations"] = (member["durations"] + [change[2]])[
+                        -MAX_DURATIONS:
+                    ]
+                    member["completions"] = [
+                        timestamp
+                        for timestamp in member["completions"] + [change[3]]
+                        if now - timestamp <= RATE_WINDOW_SECONDS
+                    ]
+                elif change[0] == REMOVED:
+                    member["pending"] = max(0, member["pending"] - 1)
+        data["seq"] = seq
+        self._save(data)
+
+    def read(self, seq: int) -> Dict[str, dict] | None:
+        """
+        Get the raw per-member aggregates if they are current.
+
+        Needs no file lock: the sidecar is replaced atomically, and its
+        sequence number tells whether it matches the board.
+
+        Args:
+            seq: Current journal sequence number
+
+        Returns:
+            The aggregates, or None if they must be rebuilt
+        """
+        data = self._load()
+        return data["members"] if data["seq"] == seq else None
+
+    def current(self, seq: int, stories_loader) -> Dict[str, dict]:
+        """
+        Get the raw per-member aggregates, rebuilding them if they are stale.
+
+        Must be called while holding the board's mutation lock.
+
+        Args:
+            seq: Current journal sequence number
+            stories_loader: Returns every story, only called to rebuild
+        """
+        members = self.read(seq)
+        if members is not None:
+            return members
+        data = self._rebuild(stories_loader())
+        data["seq"] = seq
+        self._save(data)
+        return data["members"]
+
+    def _rebuild(self, stories: List[Story]) -> Dict[str, Any]:
+        """Recompute the aggregates from the stories on the board."""
+        now = time.time()
+        members: Dict[str, Dict[str, Any]] = {}
+        completed = sorted(
+            (story for story in stories if story.is_completed and story.completed_at),
+            key=lambda story: story.completed_at,
+        )
+        for story in stories:
+            member = members.setdefault(story.assignee, _empty_member())
+            if not story.is_completed:
+                member["pending"] += 1
+        for story in completed:
+            member = members[story.assignee]
+            member["completed"] += 1
+            member["durations"].append(max(0.0, story.completed_at - story.created_at))
+            if now - story.completed_at <= RATE_WINDOW_SECONDS:
+                member["completions"].append(story.completed_at)
+        for member in members.values():
+            member["durations"] = member["durations"][-MAX_DURATIONS:]
+        return {"seq": None, "members": members}
+
+
+def _percentile(values: List[float], percentile: float) -> float | None:
+    if not values:
+        return None
+    values = sorted(values)
+    return round(values[min(len(values) - 1, int(len(values) * percentile / 100))], 3)
+
+
+def _summarize_member(member: Dict[str, Any], now: float) -> Dict[str, Any]:
+    recent = [t for t in member["completions"] if now - t <= RATE_WINDOW_SECONDS]
+    return {
+        "pending": member["pending"],
+        "completed": member["completed"],
+        "completions_per_minute": round(len(recent) / (RATE_WINDOW_SECONDS / 60), 3),
+        "p50_seconds_to_complete": _percentile(member["durations"], 50),
+        "p95_seconds_to_complete": _percentile(member["durations"], 95),
+    }
+
+
+def summarize(
+    members: Dict[str, Dict[str, Any]], known_members: Iterable[str] = ()
+) -> Dict[str, Any]:
+    """
+    Turn raw per-member aggregates into the report returned by `stats()`.
+
+    Args:
+        members: Raw aggregates per member, possibly merged from several shards
+        known_members: Members to report even if they have no tasks yet
+
+    Returns:
+        Per-member and squad-wide pending depth, completion rate and
+        time-to-complete percentiles
+    """
+    now = time.time()
+    members = dict(members)
+    for name in known_members:
+        members.setdefault(name, _empty_member())
+    total = _empty_member()
+    for member in members.values():
+        total["pending"] += member["pending"]
+        total["completed"] += member["completed"]
+        total["durations"] += member["durations"]
+        total["completions"] += member["completions"]
+    return {
+        "rate_window_minutes": RATE_WINDOW_SECONDS // 60,
+        "members": {
+            name: _summarize_member(member, now)
+            for name, member in sorted(members.items())
+        },
+        "total": _summarize_member(total, now),
+    }
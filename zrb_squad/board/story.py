@@ -2,10 +2,82 @@
 Story class representing a single task in the kanban board.
 """
 
+import secrets
+import threading
 import time
-import uuid
 from datetime import datetime
-from typing import Optional
+from typing import Callable, Optional
+
+# Length of the description preview kept inline for blob-stored descriptions
+PREVIEW_LENGTH = 200
+
+# Crockford's base32: no I, L, O or U, so IDs are easy to read back
+_ID_ALPHABET = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+_ID_TIME_CHARS = 10  # 50 bits of milliseconds since the epoch
+_ID_RANDOM_CHARS = 6  # 30 random bits
+_ID_RANDOM_BITS = 5 * _ID_RANDOM_CHARS
+_id_lock = threading.Lock()
+_last_id_state = (0, 0)
+
+
+def _encode(value: int, length: int) -> str:
+    chars = []
+    for _ in range(length):
+        value, remainder = divmod(value, 32)
+        chars.append(_ID_ALPHABET[remainder])
+    return "".join(reversed(chars))
+
+
+def new_task_id(timestamp: Optional[float] = None) -> str:
+    """
+    Generate a compact, time-sortable task ID.
+
+    IDs are 16 characters: the creation time in milliseconds followed by
+    random bits, both in Crockford's base32, so sorting IDs sorts stories by
+    creation time. IDs generated by one process for the current time are
+    strictly increasing; an ID for another time encodes exactly that time.
+
+    Args:
+        timestamp: Creation time (defaults to now)
+    """
+    global _last_id_state
+    if timestamp is not None:
+        randomness = secrets.randbits(_ID_RANDOM_BITS)
+        return _encode(int(timestamp * 1000), _ID_TIME_CHARS) + _encode(
+            randomness, _ID_RANDOM_CHARS
+        )
+    millis = int(time.time() * 1000)
+    with _id_lock:
+        last_millis, last_random = _last_id_state
+        if millis <= last_millis:
+            # Same millisecond (or the clock went back): keep increasing
+            millis, randomness = last_millis, last_random + 1
+            if randomness >= 1 << _ID_RANDOM_BITS:
+                millis, randomness = last_millis + 1, 0
+        else:
+            randomness = secrets.randbits(_ID_RANDOM_BITS)
+        _last_id_state = (millis, randomness)
+    return _encode(millis, _ID_TIME_CHARS) + _encode(randomness, _ID_RANDOM_CHARS)
+
+
+def task_id_timestamp(task_id: str) -> Optional[float]:
+    """
+    Get the creation time encoded in a task ID.
+
+    Returns:
+        The timestamp, or None for IDs without one (e.g., legacy uuid4 IDs)
+    """
+    if len(task_id) != _ID_TIME_CHARS + _ID_RANDOM_CHARS:
+        return None
+    millis = 0
+    for char in task_id[:_ID_TIME_CHARS]:
+        position = _ID_ALPHABET.find(char)
+        if position < 0:
+            return None
+        millis = millis * 32 + position
+    if any(char not in _ID_ALPHABET for char in task_id[_ID_TIME_CHARS:]):
+        return None
+    return millis / 1000
 
 
 class Story:
@@ -13,13 +85,23 @@ class Story:
     A single task/story in the kanban board.
 
     Attributes:
-        task_id: Unique identifier for the task
+        task_id: Unique identifier for the task; new stories get compact,
+            time-sortable IDs (see `new_task_id`), older boards keep their
+            uuid4 IDs
         assignee: Who the task is assigned to
         assigner: Who assigned the task
         description: Description of the task
         is_completed: Whether the task is completed
         created_at: When the task was created (timestamp)
         completed_at: When the task was completed (timestamp, None if not completed)
+        blocked_by: IDs of the stories that must be completed before this one
+        description_ref: Digest of the full description in the board's blob
+            store, set when the description is too large to keep inline
+        result: Summary of the outcome, given by the assignee on completion
+        version: Incremented by every change, so writers can detect that the
+            story changed since they read it
+        notes: Progress notes, as {"at", "author", "text"} dicts, oldest first
+        metadata: Free-form key/value data attached by the squad members
     """
 
     def __init__(
@@ -31,36 +113,127 @@ class Story:
         is_completed: bool = False,
         created_at: Optional[float] = None,
         completed_at: Optional[float] = None,
+        blocked_by: Optional[list[str]] = None,
+        description_ref: Optional[str] = None,
+        description_loader: Optional[Callable[[str], str]] = None,
+        result: Optional[str] = None,
+        version: int = 1,
+        notes: Optional[list[dict]] = None,
+        metadata: Optional[dict] = None,
     ):
-        self.task_id = task_id or str(uuid.uuid4())
         self.assignee = assignee
         self.assigner = assigner
-        self.description = description
+        self.description_ref = description_ref
+        self._description_loader = description_loader
+        if description_ref and description_loader:
+            # `description` is only the preview; load the full text on demand
+            self._description: Optional[str] = None
+            self._description_preview: Optional[str] = description
+        else:
+            self._description = description
+            self._description_preview = None
         self.is_completed = is_completed
-        self.created_at = created_at or time.time()
+        if created_at:
+            self.created_at = created_at
+            self.task_id = task_id or new_task_id(created_at)
+        else:
+            self.created_at = time.time()
+            # New stories of this process get increasing IDs
+            self.task_id = task_id or new_task_id()
         self.completed_at = completed_at
+        self.blocked_by = list(blocked_by) if blocked_by else []
+        self.result = result
+        self.version = version
+        self.notes = list(notes) if notes else []
+        self.metadata = dict(metadata) if metadata else {}
+
+    @property
+    def description(self) -> str:
+        """The full description, loaded from the blob store on first access."""
+        if self._description is None:
+            self._description = self._description_loader(self.description_ref)
+        return self._description
+
+    @description.setter
+    def description(self, value: str) -> None:
+        self._description = value
+        self._description_preview = None
+        self.description_ref = None
 
-    def complete(self) -> None:
-        """Mark the story as completed."""
+    @property
+    def description_preview(self) -> str:
+        """A short preview of the description that never hits the blob store."""
+        if self._description is None:
+            return self._description_preview
+        if len(self._description) <= PREVIEW_LENGTH:
+            return self._description
+        return self._description[: PREVIEW_LENGTH - 1] + "…"
+
+    def complete(self, result: Optional[str] = None) -> None:
+        """Mark the story as completed, optionally recording its result."""
         if not self.is_completed:
             self.is_completed = True
             self.completed_at = time.time()
+            if result is not None:
+                self.result = result
+            self.version += 1
+
+    def is_ready(self, completed_ids: set[str], known_ids: set[str]) -> bool:
+        """
+        Check whether every dependency of the story has been resolved.
+
+        A dependency is resolved when it is completed or no longer on the board
+        (e.g., it was deleted).
+        """
+        return all(
+            task_id in completed_ids or task_id not in known_ids
+            for task_id in self.blocked_by
+        )
+
+    def to_dict(self, compact: bool = False) -> dict:
+        """
+        Convert the story to a dictionary for serialization.
 
-    def to_dict(self) -> dict:
-        """Convert the story to a dictionary for serialization."""
-        return {
+        Args:
+            compact: Keep only the preview of blob-stored descriptions, without
+                loading the full text (used when writing the board)
+        """
+        data = {
             "task_id": self.task_id,
             "assignee": self.assignee,
             "assigner": self.assigner,
-            "description": self.description,
+            "description": (
+                self.description_preview
+                if compact and self.description_ref
+                else self.description
+            ),
             "is_completed": self.is_completed,
             "created_at": self.created_at,
             "completed_at": self.completed_at,
+            "blocked_by": self.blocked_by,
+            "result": self.result,
+            "version": self.version,
         }
+        if self.description_ref:
+            data["description_ref"] = self.description_ref
+        if self.notes:
+            data["notes"] = self.notes
+        if self.metadata:
+            data["metadata"] = self.metadata
+        return data
 
     @classmethod
-    def from_dict(cls, data: dict) -> "Story":
-        """Create a Story instance from a dictionary."""
+    def from_dict(
+        cls, data: dict, description_loader: Optional[Callable[[str], str]] = None
+    ) -> "Story":
+        """
+        Create a Story instance from a dictionary.
+
+        Args:
+            data: The serialized story
+            description_loader: Resolves `description_ref` digests to the full
+                description; without it the stored preview is used
+        """
         return cls(
             task_id=data["task_id"],
             assignee=data["assignee"],
@@ -69,6 +242,14 @@ class Story:
             is_completed=data["is_completed"],
             created_at=data["created_at"],
             completed_at=data.get("completed_at"),
+            blocked_by=data.get("blocked_by"),
+            description_ref=data.get("description_ref"),
+            description_loader=description_loader,
+            result=data.get("result"),
+            # Stories written before versioning start at the first version
+            version=data.get("version", 1),
+            notes=data.get("notes"),
+            metadata=data.get("metadata"),
         )
 
     def __repr__(self) -> str:
@@ -78,5 +259,5 @@ class Story:
             completed = datetime.fromtimestamp(self.completed_at).strftime(
                 "%Y-%m-%d %H:%M"
             )
-            return f"Story({self.task_id[:8]}... {status} '{self.description[:30]}...' → {self.assignee} by {self.assigner} | Created: {created} | Completed: {completed})"
-        return f"Story({self.task_id[:8]}... {status} '{self.description[:30]}...' → {self.assignee} by {self.assigner} | Created: {created})"
+            return f"Story({self.task_id} {status} '{self.description_preview[:30]}...' → {self.assignee} by {self.assigner} | Created: {created} | Completed: {completed})"
+        return f"Story({self.task_id} {status} '{self.description_preview[:30]}...' → {self.assignee} by {self.assigner} | Created: {created})"
@@ -0,0 +1,205 @@
+"""
+Live dashboard of a squad board, shown in its own tmux pane.
+"""
+
+import asyncio
+import sys
+import time
+from collections import deque
+from typing import TYPE_CHECKING, Any, Deque, Dict, List, TextIO, Tuple
+
+from .board.journal import UPSERT_OP, JournalTail
+from .board.stats import RATE_WINDOW_SECONDS
+
+if TYPE_CHECKING:
+    from .board.file_board import FileBoard
+
+# (assignee, is_completed, created_at, description preview, version)
+_Entry = Tuple[str, bool, float, str, int]
+
+
+class BoardDashboard:
+    """
+    Per-member view of a board, kept up to date from the board's journal.
+
+    The board is read once; after that only the journal records appended
+    since the previous refresh are applied, so a refresh costs a `stat` per
+    journal when the board is quiet and is proportional to the number of
+    changes otherwise, whatever the size of the board. The board is only
+    read again if a snapshot trimmed records the dashboard had not seen.
+
+    On a sharded board a story moved to another member is written to its new
+    shard and deleted from its old one, and the two journals may be read in
+    either order. A delete therefore only applies to the story as last seen
+    in that shard, and a record never replaces a newer version of a story.
+    """
+
+    def __init__(self, board: "FileBoard", interval: float = 1.0):
+        """
+        Initialize the dashboard.
+
+        Args:
+            board: The squad board (a FileBoard or a ShardedFileBoard)
+            interval: Seconds between two checks of the journal
+        """
+        self.board = board
+        self.interval = interval
+        self._tails: Dict[str, JournalTail] = {}
+        self._entries: Dict[str, _Entry] = {}
+        self._completed: Dict[str, int] = {}
+        # Recent completion timestamps, oldest first
+        self._completions: Deque[Tuple[float, str]] = deque()
+
+    def refresh(self) -> bool:
+        """
+        Apply the board changes since the previous refresh.
+
+        Returns:
+            True if anything changed
+        """
+        changed = False
+        # One storage file for a board, one per assignee's shard if sharded
+        for key in self.board.journal_sources():
+            tail = self._tails.get(key)
+            records = tail.read() if tail is not None else None
+            if records is None:
+                self._load(key)
+                changed = True
+                continue
+            for record in records:
+                if record["op"] == UPSERT_OP:
+                    self._apply_upsert(record["data"])
+                else:
+                    self._apply_delete(record["data"], key)
+                changed = True
+        return changed
+
+    def _load(self, key: str) -> None:
+        """Read a storage file from scratch and follow its journal from there."""
+        stories, tail = self.board.read_and_follow(key)
+        ids = {story.task_id for story in stories}
+        # Forget what this file held before, keeping the other shards
+        for task_id, entry in list(self._entries.items()):
+            if task_id not in ids and (key == "" or entry[0] == key):
+                del self._entries[task_id]
+        for story in stories:
+            self._apply_upsert(story.to_dict(compact=True), count_completion=False)
+        self._rebuild_completed()
+        self._tails[key] = tail
+
+    def _apply_upsert(
+        self, data: Dict[str, Any], count_completion: bool = True
+    ) -> None:
+        previous = self._entries.get(data["task_id"])
+        version = data.get("version") or 1
+        if previous is not None and previous[4] > version:
+            # Written to the story's old shard before it moved
+            return
+        is_completed = bool(data.get("is_completed"))
+        self._entries[data["task_id"]] = (
+            data["assignee"],
+            is_completed,
+            data.get("created_at") or 0.0,
+            # Compact records carry the preview of blob-stored descriptions
+            data.get("description") or "",
+            version,
+        )
+        newly_completed = is_completed and (previous is None or not previous[1])
+        if newly_completed and count_completion:
+            self._completed[data["assignee"]] = (
+                self._completed.get(data["assignee"], 0) + 1
+            )
+            completed_at = data.get("completed_at") or time.time()
+            self._completions.append((completed_at, data["assignee"]))
+
+    def _apply_delete(self, task_id: str, key: str) -> None:
+        entry = self._entries.get(task_id)
+        # A shard deleting a story that moved away must not drop its new copy
+        if entry is None or (key and entry[0] != key):
+            return
+        del self._entries[task_id]
+        if entry[1]:
+            self._completed[entry[0]] = max(0, self._completed.get(entry[0], 0) - 1)
+
+    def _rebuild_completed(self) -> None:
+        """Recount completions after a (re)load."""
+        self._completed = {}
+        recent = []
+        now = time.time()
+        for assignee, is_completed, *_ in self._entries.values():
+            if is_completed:
+                self._completed[assignee] = self._completed.get(assignee, 0) + 1
+        for completed_at, assignee in self._completions:
+            if now - completed_at <= RATE_WINDOW_SECONDS:
+                recent.append((completed_at, assignee))
+        self._completions = deque(recent)
+
+    def render(self) -> str:
+        """Format the current view of the board."""
+        now = time.time()
+        window_start = now - RATE_WINDOW_SECONDS
+        while self._completions and self._completions[0][0] < window_start:
+            self._completions.popleft()
+        members = list(self.board.members()) or sorted(
+            {entry[0] for entry in self._entries.values()}
+        )
+        pending: Dict[str, List[_Entry]] = {member: [] for member in members}
+        for entry in self._entries.values():
+            if not entry[1]:
+                pending.setdefault(entry[0], []).append(entry)
+        recent: Dict[str, int] = {}
+        for _, assignee in self._completions:
+            recent[assignee] = recent.get(assignee, 0) + 1
+        window = RATE_WINDOW_SECONDS // 60
+        lines = [
+            f"{'member':<16} {'pending':>7} {'done':>6} {'oldest':>8} "
+            f"{'done/min':>8}  ({window} min)",
+        ]
+        for member in pending:
+            oldest = min((entry[2] for entry in pending[member]), default=None)
+            lines.append(
+                f"{member[:16]:<16} {len(pending[member]):>7} "
+                f"{self._completed.get(member, 0):>6} "
+                f"{_format_age(now - oldest) if oldest else '-':>8} "
+                f"{recent.get(member, 0) / window:>8.2f}"
+            )
+        total_pending = sum(len(entries) for entries in pending.values())
+        lines.append(
+            f"{'total':<16} {total_pending:>7} {sum(self._completed.values()):>6} "
+            f"{'':>8} {len(self._completions) / window:>8.2f}"
+        )
+        stuck = sorted(
+            (entry for entries in pending.values() for entry in entries),
+            key=lambda entry: entry[2],
+        )[:3]
+        if stuck:
+            lines += ["", "Oldest pending:"]
+            lines += [
+                f"  {_format_age(now - entry[2]):>6}  {entry[0]}: {entry[3][:60]}"
+                for entry in stuck
+            ]
+        return "\n".join(lines)
+
+    async def run(self, output: TextIO = sys.stdout) -> None:
+        """
+        Redraw the dashboard whenever the board changes.
+
+        Ages and rates also move while the board is quiet, so the view is
+        redrawn (from memory) at least every 10 checks.
+        """
+        checks = 0
+        while True:
+            if self.refresh() or checks % 10 == 0:
+                # Clear the pane and draw from the top-left corner
+                output.write("\033[H\033[2J" + self.render() + "\n")
+                output.flush()
+            checks += 1
+            await asyncio.sleep(self.interval)
+
+
+def _format_age(seconds: float) -> str:
+    if seconds < 60:
+        return f"{int(seconds)}s"
+    if seconds < 3600:
+        return f"{int(seconds // 60)}m"
+    return f"{seconds / 3600:.1f}h"
@@ -0,0 +1,342 @@
+"""
+Squad-wide rate limits for LLM calls, shared by every member process.
+"""
+
+import asyncio
+import copy
+import fcntl
+import json
+import os
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator
+
+from zrb.llm.config.limiter import LLMLimiter
+from zrb.util.cli.style import stylize_cyan
+
+if TYPE_CHECKING:
+    from zrb.llm.hook.manager import HookManager
+
+# Used when the limiter is not given a state path and runs outside a squad
+DEFAULT_STATE_PATH = "zrb_squad_llm.json"
+# Waiters that stopped checking for this long gave up (e.g., were cancelled)
+WAITER_TIMEOUT_SECONDS = 5.0
+
+
+class SquadLimiter(LLMLimiter):
+    """
+    Token buckets and a concurrency cap for the LLM calls of a whole squad.
+
+    Every member runs its chat task in its own process, and zrb's limiter
+    only sees the calls of its own process, so members fanning out work
+    burst together and trip the provider's rate limits. This limiter keeps
+    its state in a small JSON file next to the board instead, changed under
+    a file lock, so its limits hold across every member process:
+
+    - a request bucket and a token bucket, refilled at `max_request_per_minute`
+      and `max_token_per_minute`, each holding `burst_seconds` worth of its
+      rate
+    - at most `max_concurrent` turns in flight. A turn's slot is freed when
+      the turn ends (zrb's SessionEnd hook), when the member starts its next
+      turn, when its process exits, or after `lease_seconds`
+    - while members wait, the one with the highest weight times seconds
+      waited goes first, so heavily weighted roles (e.g., the orchestrator)
+      keep priority without starving the others
+
+    Each member's wait times are recorded, see `stats`.
+    """
+
+    def __init__(
+        self,
+        state_path: str | None = None,
+        max_request_per_minute: int | None = None,
+        max_token_per_minute: int | None = None,
+        max_concurrent: int | None = None,
+        role_weights: Dict[str, float] | None = None,
+        burst_seconds: float = 10.0,
+        lease_seconds: float = 300.0,
+    ):
+        """
+        Initialize the limiter.
+
+        Args:
+            state_path: JSON file shared by the member processes (defaults to
+                `<board>.llm.json` next to the squad's board)
+            max_request_per_minute: Request rate of the squad (defaults to
+                zrb's LLM_MAX_REQUEST_PER_MINUTE setting)
+            max_token_per_minute: Token rate of the squad (defaults to zrb's
+                LLM_MAX_TOKEN_PER_MINUTE setting)
+            max_concurrent: Most turns in flight at once; None for no limit
+            role_weights: Priority of each role (or member name) while
+                waiting; others weigh 1
+            burst_seconds: Seconds of rate the buckets hold, i.e. how much
+                an idle squad may send at once
+            lease_seconds: Longest a turn may hold its concurrency slot
+        """
+        super().__init__()
+        if max_request_per_minute is not None:
+            self.max_request_per_minute = max_request_per_minute
+        if max_token_per_minute is not None:
+            self.max_token_per_minute = max_token_per_minute
+        self.state_path = os.path.expanduser(state_path) if state_path else None
+        self.max_concurrent = max_concurrent
+        self.role_weights = dict(role_weights or {})
+        self.burst_seconds = burst_seconds
+        self.lease_seconds = lease_seconds
+        # Member whose calls this instance limits, see `for_member`
+        self.member = ""
+        self.role = ""
+        # Shared with the member limiters, so a default set later reaches them
+        self._defaults: Dict[str, str] = {}
+
+    def set_default_state_path(self, path: str) -> None:
+        """
+        Set where the state is kept when the limiter has no `state_path`.
+
+        Squads set this to a file next to their board. It also applies to
+        the member limiters already made with `for_member`.
+
+        Args:
+            path: JSON file shared by the member processes
+        """
+        self._defaults["state_path"] = os.path.expanduser(path)
+
+    def for_member(self, name: str, role: str = "") -> "SquadLimiter":
+        """
+        Get a limiter for one member's chat task, sharing these limits.
+
+        Pass it as the chat task's `llm_limitter`.
+
+        Args:
+            name: Name of the member
+            role: Role of the member, for `role_weights`
+        """
+        limiter = copy.copy(self)
+        limiter.member = name
+        limiter.role = role
+        return limiter
+
+    @property
+    def weight(self) -> float:
+        """Priority of this limiter's member."""
+        if self.role and self.role in self.role_weights:
+            return self.role_weights[self.role]
+        return self.role_weights.get(self.member, 1.0)
+
+    async def acquire(self, content: Any, notifier: Callable[[str], Any] | None = None):
+        """
+        Wait until the squad's limits allow another turn, then start it.
+
+        Args:
+            content: The prompt and history of the turn, to count its tokens
+            notifier: Shows the member why it is waiting
+        """
+        tokens = min(self._count_tokens(content), self._token_capacity())
+        started = time.time()
+        notified = False
+        while True:
+            with self._locked_state() as state:
+                wait = self._try_acquire(state, tokens, started, notified)
+            if wait is None:
+                break
+            if notifier:
+                notifier(
+                    stylize_cyan(
+                        f"Squad LLM rate limit reached. Waiting {wait:.1f}s..."
+                    )
+                )
+            notified = True
+            await asyncio.sleep(min(max(wait, self.throttle_check_interval), 1.0))
+        if notified and notifier:
+            notifier("")
+
+    def release(self) -> None:
+        """Free the concurrency slot of this member's current turn."""
+        with self._locked_state() as state:
+            state["leases"].pop(self._holder(), None)
+
+    def create_hook_factory(self) -> Callable[["HookManager"], None]:
+        """Create a chat task hook factory that frees the slot when a turn ends."""
+
+        def register_release_hook(manager: "HookManager") -> None:
+            from zrb.llm.hook.interface import HookContext, HookResult
+            from zrb.llm.hook.types import HookEvent
+
+            async def release_llm_slot(context: HookContext) -> HookResult:
+                self.release()
+                return HookResult()
+
+            manager.register(release_llm_slot, events=[HookEvent.SESSION_END])
+
+        return register_release_hook
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get the squad's turns in flight and each member's wait times.
+
+        Returns:
+            {"in_flight", "waiting", "members": {name: {"requests",
+            "throttled", "wait_seconds_total", "wait_seconds_avg",
+            "wait_seconds_max"}}}
+        """
+        state = self._read_state()
+        members = {}
+        for name, metrics in state["metrics"].items():
+            requests = metrics["requests"]
+            members[name] = {
+                "requests": requests,
+                "throttled": metrics["throttled"],
+                "wait_seconds_total": round(metrics["wait_seconds_total"], 3),
+                "wait_seconds_avg": round(
+                    metrics["wait_seconds_total"] / requests if requests else 0.0, 3
+                ),
+                "wait_seconds_max": round(metrics["wait_seconds_max"], 3),
+            }
+        return {
+            "in_flight": len(state["leases"]),
+            "waiting": len(state["waiting"]),
+            "members": members,
+        }
+
+    def _try_acquire(
+        self, state: Dict[str, Any], tokens: int, started: float, throttled: bool
+    ) -> float | None:
+        """
+        Start a turn if the limits allow it.
+
+        Must be called while holding the state lock.
+
+        Returns:
+            None if the turn started, otherwise seconds to wait before trying
+            again
+        """
+        now = time.time()
+        holder = self._holder()
+        leases, waiting = state["leases"], state["waiting"]
+        # A member's previous turn is over once it starts the next one
+        leases.pop(holder, None)
+        for name, lease in list(leases.items()):
+            if lease["until"] < now or not _is_alive(lease["pid"]):
+                del leases[name]
+        for name, waiter in list(waiting.items()):
+            if now - waiter["seen"] > WAITER_TIMEOUT_SECONDS or not _is_alive(
+                waiter["pid"]
+            ):
+                del waiting[name]
+        self._refill(state, now)
+
+        wait = 0.0
+        priority = self.weight * (now - started)
+        if any(
+            waiter["weight"] * (now - waiter["since"]) > priority
+            for name, waiter in waiting.items()
+            if name != holder
+        ):
+            wait = self.throttle_check_interval
+        if self.max_concurrent is not None and len(leases) >= self.max_concurrent:
+            wait = self.throttle_check_interval
+        requests, budget = state["requests"]["level"], state["tokens"]["level"]
+        if requests < 1:
+            wait = max(wait, (1 - requests) * 60 / self.max_request_per_minute)
+        if budget < tokens:
+            wait = max(wait, (tokens - budget) * 60 / self.max_token_per_minute)
+        if wait > 0:
+            waiting[holder] = {
+                "pid": os.getpid(),
+                "weight": self.weight,
+                "since": started,
+                "seen": now,
+            }
+            return wait
+
+        waiting.pop(holder, None)
+        state["requests"]["level"] -= 1
+        state["tokens"]["level"] -= tokens
+        leases[holder] = {"pid": os.getpid(), "until": now + self.lease_seconds}
+        metrics = state["metrics"].setdefault(
+            self.member,
+            {
+                "requests": 0,
+                "throttled": 0,
+                "wait_seconds_total": 0.0,
+                "wait_seconds_max": 0.0,
+            },
+        )
+        metrics["requests"] += 1
+        if throttled:
+            metrics["throttled"] += 1
+            metrics["wait_seconds_total"] += now - started
+            metrics["wait_seconds_max"] = max(
+                metrics["wait_seconds_max"], now - started
+            )
+        return None
+
+    def _refill(self, state: Dict[str, Any], now: float) -> None:
+        """Add the requests and tokens earned since the last change."""
+        for key, per_minute, capacity in (
+            ("requests", self.max_request_per_minute, self._request_capacity()),
+            ("tokens", self.max_token_per_minute, self._token_capacity()),
+        ):
+            bucket = state.setdefault(key, {"level": capacity, "at": now})
+            elapsed = max(0.0, now - bucket["at"])
+            bucket["level"] = min(capacity, bucket["level"] + elapsed * per_minute / 60)
+            bucket["at"] = now
+
+    def _request_capacity(self) -> float:
+        return max(1.0, self.max_request_per_minute * self.burst_seconds / 60)
+
+    def _token_capacity(self) -> float:
+        burst = self.max_token_per_minute * self.burst_seconds / 60
+        # A bucket smaller than one request would never let it through
+        return min(
+            self.max_token_per_minute, max(burst, float(self.max_token_per_request))
+        )
+
+    def _holder(self) -> str:
+        return f"{self.member}:{os.getpid()}"
+
+    def _path(self) -> str:
+        if self.state_path is not None:
+            return self.state_path
+        return self._defaults.get("state_path", DEFAULT_STATE_PATH)
+
+    def _read_state(self) -> Dict[str, Any]:
+        """Read the shared state; writes replace the file atomically."""
+        try:
+            with open(self._path(), "r") as f:
+                state = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            state = {}
+        for key in ("leases", "waiting", "metrics"):
+            state.setdefault(key, {})
+        return state
+
+    @contextmanager
+    def _locked_state(self) -> Iterator[Dict[str, Any]]:
+        """Read, change and write back the shared state under its lock."""
+        path = self._path()
+        dir_path = os.path.dirname(path)
+        if dir_path:
+            os.makedirs(dir_path, exist_ok=True)
+        with open(path + ".lock", "w") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                state = self._read_state()
+                yield state
+                temp_path = path + ".tmp"
+                with open(temp_path, "w") as f:
+                    json.dump(state, f)
+                os.replace(temp_path, path)
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def _is_alive(pid: int) -> bool:
+    """Check whether a process still exists."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
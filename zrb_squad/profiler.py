@@ -0,0 +1,219 @@
+"""
+Sampling profiler for squad member processes.
+"""
+
+import atexit
+import glob
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from typing import Dict, List, Tuple
+
+PROFILE_DIR_ENV = "ZRB_SQUAD_PROFILE_DIR"
+PROFILE_MEMBER_ENV = "ZRB_SQUAD_PROFILE_MEMBER"
+
+_Frame = Tuple[str, int, str]
+
+# Profiler of this process, if it was launched as a profiled member
+_member_profiler: "SamplingProfiler | None" = None
+
+
+class SamplingProfiler:
+    """
+    Samples the stacks of every thread of the process at a fixed interval.
+
+    Sampling keeps the overhead low and independent of how many calls the
+    chat loop, trigger polling and board I/O make, so it can stay enabled
+    during a live run. Every `summary_interval` seconds (and at exit) it
+    writes, into `output_dir`:
+
+    - `<member>.folded`: every sampled stack with its count, in the folded
+      format flame graph tools read
+    - `<member>.top.txt`: the `top_n` hottest functions of the member
+    - `summary.txt`: the `top_n` hottest functions across every member that
+      wrote to the directory
+    """
+
+    def __init__(
+        self,
+        output_dir: str,
+        member_name: str,
+        interval: float = 0.01,
+        summary_interval: float = 30.0,
+        top_n: int = 20,
+    ):
+        """
+        Initialize the profiler.
+
+        Args:
+            output_dir: Directory of the squad run's profiles
+            member_name: Name of the profiled member
+            interval: Seconds between two samples
+            summary_interval: Seconds between two writes of the results
+            top_n: Number of functions in the summaries
+        """
+        self.output_dir = output_dir
+        self.member_name = member_name
+        self.interval = interval
+        self.summary_interval = summary_interval
+        self.top_n = top_n
+        self._stacks: Counter[Tuple[str, Tuple[_Frame, ...]]] = Counter()
+        self._samples = 0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        """Start sampling in a daemon thread."""
+        if self._thread is not None:
+            return
+        os.makedirs(self.output_dir, exist_ok=True)
+        self._thread = threading.Thread(
+            target=self._run, name="zrb-squad-profiler", daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.stop)
+
+    def stop(self) -> None:
+        """Stop sampling and write the results."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._thread.join()
+        self._thread = None
+        self.write()
+
+    def _run(self) -> None:
+        next_write = time.monotonic() + self.summary_interval
+        while not self._stop.wait(self.interval):
+            self._sample()
+            if time.monotonic() >= next_write:
+                self.write()
+                next_write = time.monotonic() + self.summary_interval
+
+    def _sample(self) -> None:
+        own_id = threading.get_ident()
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        frames = sys._current_frames()
+        with self._lock:
+            self._samples += 1
+            for thread_id, frame in frames.items():
+                if thread_id == own_id:
+                    continue
+                stack = []
+                while frame is not None:
+                    code = frame.f_code
+                    stack.append((code.co_filename, code.co_firstlineno, code.co_name))
+                    frame = frame.f_back
+                stack.reverse()
+                # Thread names become the root frame of folded stacks
+                thread = names.get(thread_id, str(thread_id))
+                thread = thread.replace(";", "_").replace(" ", "_")
+                self._stacks[(thread, tuple(stack))] += 1
+
+    def write(self) -> None:
+        """Write the member's stacks and summaries."""
+        with self._lock:
+            stacks = dict(self._stacks)
+            samples = self._samples
+        folded = [
+            ";".join([thread] + [_label(frame) for frame in stack]) + f" {count}"
+            for (thread, stack), count in stacks.items()
+        ]
+        _write_atomically(
+            os.path.join(self.output_dir, f"{self.member_name}.folded"),
+            "\n".join(folded) + "\n",
+        )
+        _write_atomically(
+            os.path.join(self.output_dir, f"{self.member_name}.top.txt"),
+            format_top(
+                _parse_folded(folded),
+                self.top_n,
+                f"{self.member_name}: {samples} samples every {self.interval * 1000:g} ms",
+            ),
+        )
+        # Merge every member of the run into one summary
+        merged: List[str] = []
+        for path in sorted(glob.glob(os.path.join(self.output_dir, "*.folded"))):
+            with open(path, "r") as f:
+                merged.extend(line.rstrip("\n") for line in f if line.strip())
+        _write_atomically(
+            os.path.join(self.output_dir, "summary.txt"),
+            format_top(_parse_folded(merged), self.top_n, "all members"),
+        )
+
+
+def _label(frame: _Frame) -> str:
+    filename, lineno, name = frame
+    return f"{name} ({filename}:{lineno})"
+
+
+def _parse_folded(lines: List[str]) -> List[Tuple[List[str], int]]:
+    stacks = []
+    for line in lines:
+        stack, _, count = line.rpartition(" ")
+        # Drop the thread name, which is not a function
+        stacks.append((stack.split(";")[1:], int(count)))
+    return stacks
+
+
+def format_top(stacks: List[Tuple[List[str], int]], top_n: int, title: str) -> str:
+    """
+    Format the hottest functions of a set of sampled stacks.
+
+    Args:
+        stacks: (frames, count) pairs, outermost frame first
+        top_n: Number of functions to list
+        title: First line of the summary
+
+    Returns:
+        A table of the functions with the most samples on top of the stack
+        (self) and anywhere in it (total)
+    """
+    total_samples = sum(count for _, count in stacks) or 1
+    self_counts: Dict[str, int] = {}
+    total_counts: Dict[str, int] = {}
+    for frames, count in stacks:
+        if frames:
+            self_counts[frames[-1]] = self_counts.get(frames[-1], 0) + count
+        for label in set(frames):
+            total_counts[label] = total_counts.get(label, 0) + count
+    ranked = sorted(
+        total_counts, key=lambda label: (self_counts.get(label, 0), total_counts[label])
+    )
+    lines = [title, f"{'self %':>7} {'total %':>8}  function"]
+    for label in reversed(ranked[-top_n:]):
+        lines.append(
+            f"{100 * self_counts.get(label, 0) / total_samples:7.1f} "
+            f"{100 * total_counts[label] / total_samples:8.1f}  {label}"
+        )
+    return "\n".join(lines) + "\n"
+
+
+def _write_atomically(path: str, content: str) -> None:
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    with open(temp_path, "w") as f:
+        f.write(content)
+    os.replace(temp_path, path)
+
+
+def start_member_profiler_from_env() -> SamplingProfiler | None:
+    """
+    Start profiling this process if the squad launched it with profiling on.
+
+    Returns:
+        The running profiler, or None if profiling is off
+    """
+    global _member_profiler
+    if _member_profiler is not None:
+        return _member_profiler
+    # Processes spawned by the member (e.g., shell tools) are not profiled
+    output_dir = os.environ.pop(PROFILE_DIR_ENV, None)
+    member_name = os.environ.pop(PROFILE_MEMBER_ENV, None)
+    if not output_dir or not member_name:
+        return None
+    _member_profiler = SamplingProfiler(output_dir, member_name)
+    _member_profiler.start()
+    return _member_profiler
@@ -0,0 +1,282 @@
+"""
+Offline squad simulation with scripted stand-in agents.
+
+Stand-ins replace the members' chat tasks: they listen to the real board
+triggers and call the real board tools, but "think" for a configurable time
+instead of calling a model, so boards and topologies can be measured without
+network access or LLM cost.
+"""
+
+import asyncio
+import random
+import re
+import time
+from typing import TYPE_CHECKING, Any, Callable, Dict, List
+
+if TYPE_CHECKING:
+    from .squad import Squad
+
+# Matches the task entries of trigger digests
+_ENTRY_PATTERN = re.compile(r"\[([0-9A-Za-z-]+)\] (from|by) ")
+
+
+class StandInAgent:
+    """
+    Scripted behaviour of a simulated squad member.
+
+    On every new-task notification the stand-in calls `list_my_tasks` (as a
+    real agent would), then works through the notified tasks one by one:
+    it thinks for `think_time` seconds, assigns `fan_out` sub-tasks to
+    `fan_out_to` (as long as the task is less than `max_depth` levels deep)
+    and completes the task with `complete_my_task`.
+    """
+
+    def __init__(
+        self,
+        think_time: float | tuple[float, float] = 0.0,
+        fan_out: int | tuple[int, int] = 0,
+        fan_out_to: List[str] | None = None,
+        max_depth: int = 1,
+    ):
+        """
+        Initialize the stand-in agent.
+
+        Args:
+            think_time: Seconds spent per task, or a (low, high) range to draw
+                from uniformly
+            fan_out: Sub-tasks assigned per task, or a (low, high) range
+            fan_out_to: Assignees of the sub-tasks, picked in turn (member
+                names or `role:<role>`)
+            max_depth: Tasks this many levels below a seed task do not fan out
+        """
+        self.think_time = think_time
+        self.fan_out = fan_out
+        self.fan_out_to = fan_out_to or []
+        self.max_depth = max_depth
+
+    def draw_think_time(self, rng: random.Random) -> float:
+        if isinstance(self.think_time, tuple):
+            return rng.uniform(*self.think_time)
+        return self.think_time
+
+    def draw_fan_out(self, rng: random.Random) -> int:
+        if not self.fan_out_to:
+            return 0
+        if isinstance(self.fan_out, tuple):
+            return rng.randint(*self.fan_out)
+        return self.fan_out
+
+
+class SimulationReport:
+    """Measurements of a simulation run."""
+
+    def __init__(self):
+        self.elapsed = 0.0
+        self.assigned = 0
+        self.completed = 0
+        # (seconds since start, {member: ready queue depth})
+        self.queue_depths: List[tuple[float, Dict[str, int]]] = []
+        # Seconds from a board change to the notification reaching the member
+        self.notification_latencies: Dict[str, List[float]] = {
+            "new_task": [],
+            "completed": [],
+        }
+
+    @property
+    def tasks_per_second(self) -> float:
+        return self.completed / self.elapsed if self.elapsed else 0.0
+
+    def latency_percentile(self, kind: str, percentile: float) -> float | None:
+        """Get a notification latency percentile (0-100) in seconds."""
+        latencies = sorted(self.notification_latencies[kind])
+        if not latencies:
+            return None
+        index = min(len(latencies) - 1, int(len(latencies) * percentile / 100))
+        return latencies[index]
+
+    def max_queue_depth(self) -> Dict[str, int]:
+        """Get the deepest ready queue observed per member."""
+        depths: Dict[str, int] = {}
+        for _, sample in self.queue_depths:
+            for member, depth in sample.items():
+                depths[member] = max(depths.get(member, 0), depth)
+        return depths
+
+    def summary(self) -> str:
+        """Format the report for humans."""
+        lines = [
+            f"elapsed:     {self.elapsed:.2f} s",
+            f"tasks:       {self.completed}/{self.assigned} completed",
+            f"throughput:  {self.tasks_per_second:.2f} tasks/s",
+        ]
+        for kind, latencies in self.notification_latencies.items():
+            if not latencies:
+                continue
+            p50 = self.latency_percentile(kind, 50)
+            p95 = self.latency_percentile(kind, 95)
+            lines.append(
+                f"latency {kind:<10} p50 {p50 * 1000:8.1f} ms   "
+                f"p95 {p95 * 1000:8.1f} ms   ({len(latencies)} notifications)"
+            )
+        depths = ", ".join(
+            f"{member}={depth}" for member, depth in self.max_queue_depth().items()
+        )
+        lines.append(f"max queue:   {depths}")
+        return "\n".join(lines)
+
+
+class SquadSimulator:
+    """
+    Runs a squad with stand-in agents instead of chat tasks.
+
+    Example:
+        ```python
+        simulator = SquadSimulator(
+            squad,
+            agents={
+                "alice": StandInAgent(fan_out=4, fan_out_to=["role:executor"]),
+                "charlie": StandInAgent(think_time=(0.1, 0.5)),
+                "diaz": StandInAgent(think_time=(0.1, 0.5)),
+            },
+        )
+        report = asyncio.run(simulator.run(seed_tasks=10))
+        print(report.summary())
+        ```
+    """
+
+    def __init__(
+        self,
+        squad: "Squad",
+        agents: Dict[str, StandInAgent] | None = None,
+        sample_interval: float = 0.5,
+        seed: int | None = None,
+    ):
+        """
+        Initialize the simulator.
+
+        Args:
+            squad: The squad to simulate; its board is used as-is
+            agents: Stand-in per member name (members without one complete
+                their tasks immediately)
+            sample_interval: Seconds between two queue-depth samples
+            seed: Seed for the think-time and fan-out draws
+        """
+        self.squad = squad
+        self.agents = agents or {}
+        self.sample_interval = sample_interval
+        self._rng = random.Random(seed)
+        self._report = SimulationReport()
+        self._start = 0.0
+        self._assigned_at: Dict[str, float] = {}
+        self._completed_at: Dict[str, float] = {}
+        self._depths: Dict[str, int] = {}
+        self._done = asyncio.Event()
+
+    async def run(self, seed_tasks: int = 1, timeout: float = 60.0) -> SimulationReport:
+        """
+        Assign seed tasks to the main agent and run until all tasks are done.
+
+        Args:
+            seed_tasks: Number of tasks the main agent assigns to itself
+            timeout: Seconds after which the run is stopped
+
+        Returns:
+            The measurements of the run
+        """
+        board = self.squad.board
+        self._done = asyncio.Event()
+        self._start = time.monotonic()
+        workers = [
+            asyncio.create_task(self._run_member(member.name))
+            for member in self.squad.members
+        ]
+        workers.append(asyncio.create_task(self._sample_queue_depths()))
+        main_agent = self.squad.main_agent
+        tools = self._tools(main_agent)
+        for index in range(seed_tasks):
+            self._assign(tools, main_agent, f"seed-{index}", depth=0)
+        try:
+            await asyncio.wait_for(self._done.wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+        self._report.elapsed = time.monotonic() - self._start
+        self._report.queue_depths.append((self._report.elapsed, self._sample(board)))
+        return self._report
+
+    def _tools(self, agent_name: str) -> Dict[str, Callable]:
+        return {
+            tool.__name__: tool for tool in self.squad.board.create_tools(agent_name)
+        }
+
+    def _assign(
+        self, tools: Dict[str, Callable], assignee: str, task_name: str, depth: int
+    ) -> None:
+        result = tools["assign_task_to_agent"](
+            assignee=assignee,
+            task_name=task_name,
+            description=f"Simulated task {task_name}",
+        )
+        if not result["success"]:
+            raise RuntimeError(result["message"])
+        self._assigned_at[result["task_id"]] = time.monotonic()
+        self._depths[result["task_id"]] = depth
+        self._report.assigned += 1
+
+    async def _run_member(self, agent_name: str) -> None:
+        """Drive one member from its real board triggers."""
+        agent = self.agents.get(agent_name, StandInAgent())
+        tools = self._tools(agent_name)
+        trigger = self.squad._create_board_trigger(agent_name)
+        async for message in trigger():
+            new_task_ids = self._record_latencies(str(message))
+            if not new_task_ids:
+                continue
+            # A real agent usually looks at its queue before starting
+            tools["list_my_tasks"]()
+            for task_id in new_task_ids:
+                await asyncio.sleep(agent.draw_think_time(self._rng))
+                depth = self._depths.get(task_id, 0)
+                if depth < agent.max_depth:
+                    for index in range(agent.draw_fan_out(self._rng)):
+                        assignee = agent.fan_out_to[index % len(agent.fan_out_to)]
+                        self._assign(tools, assignee, f"{task_id}-{index}", depth + 1)
+                result = tools["complete_my_task"](task_id=task_id, result="done")
+                if result["success"]:
+                    self._completed_at[task_id] = time.monotonic()
+                    self._report.completed += 1
+            if self._report.completed >= self._report.assigned:
+                self._done.set()
+
+    def _record_latencies(self, message: str) -> List[str]:
+        """Record notification latencies and return the new task IDs."""
+        received = time.monotonic()
+        new_task_ids = []
+        for task_id, kind in _ENTRY_PATTERN.findall(message):
+            if kind == "from":
+                new_task_ids.append(task_id)
+                changed_at = self._assigned_at.get(task_id)
+                latencies = self._report.notification_latencies["new_task"]
+            else:
+                changed_at = self._completed_at.get(task_id)
+                latencies = self._report.notification_latencies["completed"]
+            if changed_at is not None:
+                latencies.append(received - changed_at)
+        return new_task_ids
+
+    async def _sample_queue_depths(self) -> None:
+        board = self.squad.board
+        while True:
+            self._report.queue_depths.append(
+                (time.monotonic() - self._start, self._sample(board))
+            )
+            await asyncio.sleep(self.sample_interval)
+
+    def _sample(self, board: Any) -> Dict[str, int]:
+        return {
+            member.name: len(board.get_pending_by_assignee(member.name))
+            for member in self.squad.members
+        }
@@ -1,8 +1,34 @@
-from zrb import CFG, AnyGroup, AnyTask, CmdTask, Group, LLMChatTask, cli
+import asyncio
+import os
+import re
+import shlex
+import time
+from typing import TYPE_CHECKING, Any, AsyncIterable, Callable
+
+from zrb import (
+    CFG,
+    AnyContext,
+    AnyGroup,
+    AnyTask,
+    CmdTask,
+    Group,
+    LLMChatTask,
+    StrInput,
+    Task,
+    cli,
+)
 from zrb.util.string.conversion import to_kebab_case
 
-from .board.any_board import AnyBoard
-from .board.factory import create_board
+if TYPE_CHECKING:
+    from .board.any_board import AnyBoard
+    from .board.namespaced_board import NamespacedBoard
+    from .board.response_cache import ResponseCache
+    from .llm_limiter import SquadLimiter
+
+# Default board of earlier versions, still used while it exists
+LEGACY_BOARD_PATH = "zrb_squad_board.json"
+# Names and roles of members added at runtime, used in tmux and shell commands
+MEMBER_NAME_PATTERN = re.compile(r"[A-Za-z0-9_-]+")
 
 
 class Member:
@@ -38,10 +64,16 @@ class Squad:
         self,
         name: str,
         members: list[Member],
-        board: AnyBoard | None = None,
+        board: "AnyBoard | NamespacedBoard | None" = None,
         main_agent: str | None = None,
         group_name: str | None = None,
         group_description: str | None = None,
+        response_cache: "ResponseCache | bool" = False,
+        profile: bool | None = None,
+        run_dir: str = "zrb_squad_runs",
+        member_factory: Callable[[str, str], LLMChatTask] | None = None,
+        dashboard: bool = False,
+        llm_limiter: "SquadLimiter | None" = None,
     ):
         """
         Initialize a new squad.
@@ -49,20 +81,56 @@ class Squad:
         Args:
             name: Name of the squad
             members: List of Member objects, each with a name and chat_task
-            board: Optional board instance (defaults to FileBoard if None)
+            board: Optional board instance, or a NamespacedBoard shared
+                with other squads (defaults to this squad's namespace in
+                `zrb_squad_boards/`, created the first time the board is used;
+                `zrb_squad_board.json` is used instead while it exists)
             main_agent: Name of the main agent (defaults to first member if None)
             group_name: Optional name for the group (defaults to kebab-case of squad name)
             group_description: Optional description for the group
+            response_cache: Share results of completed tasks with later,
+                identical tasks (same role, description and dependency
+                results). True stores the cache next to the board; a
+                ResponseCache instance sets the location and limits.
+            profile: Run every member under a sampling profiler (defaults to
+                the ZRB_SQUAD_PROFILE environment variable)
+            run_dir: Directory holding one sub-directory per squad run, where
+                profiles are written
+            member_factory: Creates the chat task of a member added at
+                runtime with `zrb <squad> member add`, from its name and role
+                (members cannot be added without it)
+            dashboard: Add a pane showing each member's queue, oldest pending
+                task and throughput, updated as the board changes
+            llm_limiter: Rate limits and a concurrency cap shared by the LLM
+                calls of every member process. Build each member's chat task
+                with `llm_limitter=llm_limiter.for_member(name, role)`, also
+                in `member_factory`; state is kept next to the board unless
+                the limiter has a `state_path`
         """
         self.name = name
         self.members = members
-        self.board = board if board is not None else create_board()
+        self._board = board
+        self._is_board_configured = False
+        self._response_cache = response_cache
         self.main_agent = main_agent if main_agent is not None else members[0].name
         self.group_name = (
             to_kebab_case(group_name) if group_name is not None else to_kebab_case(name)
         )
         self.group_description = group_description
         self.session_name = f"zrb-squad-{name}"
+        if profile is None:
+            profile = os.environ.get("ZRB_SQUAD_PROFILE", "").lower() in (
+                "1",
+                "true",
+                "yes",
+            )
+        self.profile = profile
+        self.run_dir = run_dir
+        self.member_factory = member_factory
+        self.dashboard = dashboard
+        self.llm_limiter = llm_limiter
+        # Directory of the current run, set when the squad task builds its script
+        self._current_run_dir: str | None = None
 
         # Validate inputs
         self._validate_members()
@@ -74,12 +142,26 @@ class Squad:
         """
         Create and register the squad task.
 
+        Nothing here touches the board or builds the tmux script: this runs
+        every time zrb_init.py is loaded, so the work is deferred until a
+        member's chat task or the squad task actually runs.
+
         Returns:
             The created squad task
         """
-        # Set valid members on the board for validation
-        member_names = [member.name for member in self.members]
-        self.board.set_valid_members(member_names)
+        # Profile this process if the squad task launched it as a member
+        if "ZRB_SQUAD_PROFILE_MEMBER" in os.environ:
+            from .profiler import start_member_profiler_from_env
+
+            start_member_profiler_from_env()
+
+        # Members added at runtime need a chat task in every process
+        if self.member_factory is not None:
+            self._add_runtime_members()
+
+        # Share one set of LLM rate limits across every member process
+        if self.llm_limiter is not None:
+            self._add_llm_limiter()
 
         # Add board tools and triggers to each member
         self._add_board_tools_and_triggers()
@@ -105,6 +187,13 @@ class Squad:
         for member in self.members:
             member_group.add_task(member.chat_task)
 
+        # Add the dashboard, shown in its own pane if enabled
+        main_group.add_task(self._create_dashboard_task(), alias="dashboard")
+
+        # Add tasks that change the members of a running squad
+        member_group.add_task(self._create_add_member_task(), alias="add")
+        member_group.add_task(self._create_remove_member_task(), alias="remove")
+
         return self._task
 
     @property
@@ -112,6 +201,55 @@ class Squad:
         """Get the squad task (only available after serve() is called)."""
         return self._task
 
+    @property
+    def board(self) -> "AnyBoard":
+        """Get the squad board, creating and configuring it on first use."""
+        if not self._is_board_configured:
+            self._board = self._open_board(register=True)
+            # Set valid members on the board for validation
+            member_names = [member.name for member in self.members]
+            member_roles = {
+                member.name: member.role for member in self.members if member.role
+            }
+            self._board.set_valid_members(member_names, roles=member_roles)
+            if self._response_cache:
+                self._board.set_response_cache(self._create_response_cache())
+            self._is_board_configured = True
+        return self._board
+
+    def _open_board(self, register: bool) -> "AnyBoard":
+        """
+        Open the squad's board without configuring it.
+
+        Args:
+            register: Record the squad's namespace on a shared board host;
+                without it, opening the board never touches the disk
+        """
+        from .board.factory import create_board, create_namespaced_board
+        from .board.namespaced_board import NamespacedBoard
+
+        if self._board is None:
+            if os.path.exists(LEGACY_BOARD_PATH):
+                # Keep the board of earlier versions, shared by its squads
+                self._board = create_board(LEGACY_BOARD_PATH)
+            else:
+                self._board = create_namespaced_board()
+        if isinstance(self._board, NamespacedBoard):
+            # Squads sharing a host get their own board, lock and members
+            return self._board.namespace(self.name, register=register)
+        return self._board
+
+    def _create_response_cache(self) -> "ResponseCache":
+        """Get the configured response cache, placing it next to the board."""
+        from .board.response_cache import ResponseCache
+
+        if isinstance(self._response_cache, ResponseCache):
+            return self._response_cache
+        board_path = getattr(self._board, "file_path", None)
+        if board_path is None:
+            return ResponseCache()
+        return ResponseCache(os.path.splitext(board_path)[0] + ".responses.json")
+
     def _validate_members(self) -> None:
         """Validate that the squad has at least one member."""
         if not self.members:
@@ -127,21 +265,56 @@ class Squad:
     def _add_board_tools_and_triggers(self) -> None:
         """Add board tools and triggers to each member's chat task."""
         for member in self.members:
-            # Add board tools
-            board_tools = self.board.create_tools(member.name)
-            for tool in board_tools:
-                member.chat_task.add_tool(tool)
+            # Board tools are resolved when the chat task runs
+            member.chat_task.add_tool_factory(
+                self._create_board_tool_factory(member.name)
+            )
+            member.chat_task.add_trigger(self._create_board_trigger(member.name))
+
+    def _create_board_tool_factory(
+        self, agent_name: str
+    ) -> Callable[[AnyContext], list[Callable]]:
+        """Create a tool factory that builds the board tools on demand."""
+
+        def create_board_tools(ctx: AnyContext) -> list[Callable]:
+            return self.board.create_tools(agent_name)
+
+        return create_board_tools
+
+    def _create_board_trigger(
+        self, agent_name: str
+    ) -> Callable[[], AsyncIterable[Any]]:
+        """
+        Create a single trigger that merges every board trigger of an agent.
+
+        The board triggers are only created once the chat task starts
+        listening, so defining the squad never instantiates the board.
+        """
 
-            # Add board triggers
-            board_triggers = self.board.create_triggers(member.name)
-            for trigger in board_triggers:
-                member.chat_task.add_trigger(trigger)
+        async def board_trigger() -> AsyncIterable[Any]:
+            # maxsize=1 keeps the board triggers from running ahead of the UI
+            queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+
+            async def pump(trigger: Callable[[], AsyncIterable[Any]]) -> None:
+                async for result in trigger():
+                    await queue.put(result)
+
+            pumps = [
+                asyncio.create_task(pump(trigger))
+                for trigger in self.board.create_triggers(agent_name)
+            ]
+            try:
+                while True:
+                    yield await queue.get()
+            finally:
+                for task in pumps:
+                    task.cancel()
+
+        board_trigger.__name__ = f"board_trigger_{agent_name}"
+        return board_trigger
 
     def _add_squad_member_tool(self) -> None:
         """Add a tool to each member that lists all squad members."""
-        member_info = [
-            {"name": member.name, "role": member.role} for member in self.members
-        ]
         squad_name = self.name
         main_agent = self.main_agent
 
@@ -153,7 +326,6 @@ class Squad:
                 agent_name=member.name,
                 squad_name=squad_name,
                 main_agent=main_agent,
-                all_members=member_info,
             )
             member.chat_task.add_tool(member_tool)
 
@@ -162,7 +334,6 @@ class Squad:
         agent_name: str,
         squad_name: str,
         main_agent: str,
-        all_members: list[dict],
     ) -> callable:
         """Create a squad member listing tool for a specific agent."""
 
@@ -173,6 +344,11 @@ class Squad:
             Returns:
                 Dictionary with squad information including member names and roles
             """
+            # Read from the board, which knows about members added at runtime
+            all_members = [
+                {"name": name, "role": role}
+                for name, role in self.board.members().items()
+            ]
             return {
                 "success": True,
                 "squad_name": squad_name,
@@ -188,24 +364,237 @@ class Squad:
         )
         return list_squad_members
 
-    def _create_squad_task(self) -> CmdTask:
-        """Create the CmdTask that starts the squad."""
-        full_cmd = self._build_tmux_commands()
+    def _add_runtime_members(self) -> None:
+        """
+        Create the members that were added to the squad at runtime.
 
-        # Add a message about assigning initial task
-        cmd_with_message = self._add_initial_task_message(full_cmd)
+        This runs every time zrb_init.py is loaded, so it only reads the
+        roster: the board is neither configured nor registered, and nothing
+        is written.
+        """
+        known = {member.name for member in self.members}
+        if self._is_board_configured:
+            members = self.board.members()
+        else:
+            members = self._open_board(register=False).members()
+        for name, role in members.items():
+            if name not in known:
+                chat_task = self.member_factory(name, role)
+                self.members.append(Member(name, chat_task, role))
+
+    def _add_llm_limiter(self) -> None:
+        """
+        Keep the squad's LLM limiter state next to the board.
 
+        Each member's chat task is given its limiter when it is built
+        (`llm_limitter=limiter.for_member(name, role)`); here every member
+        only gets the hook that frees its slot when a turn ends.
+        """
+        if self.llm_limiter.state_path is None:
+            self.llm_limiter.set_default_state_path(self._llm_limiter_state_path())
+        for member in self.members:
+            limiter = self.llm_limiter.for_member(member.name, member.role)
+            member.chat_task.add_hook_factory(limiter.create_hook_factory())
+
+    def _llm_limiter_state_path(self) -> str:
+        """Place the shared limiter state next to the board."""
+        from .llm_limiter import DEFAULT_STATE_PATH
+
+        if self._is_board_configured:
+            board = self.board
+        else:
+            board = self._open_board(register=False)
+        board_path = getattr(board, "file_path", None)
+        if board_path is None:
+            return DEFAULT_STATE_PATH
+        return os.path.splitext(board_path)[0] + ".llm.json"
+
+    def _create_add_member_task(self) -> CmdTask:
+        """Create the tasks that record a new member, then open its pane."""
+        record_member = Task(
+            name=f"record-{self.name}-member",
+            description=f"Record a new member of the {self.name} squad",
+            input=[
+                StrInput(name="name", description="Name of the new member"),
+                StrInput(
+                    name="role",
+                    description="Role of the new member",
+                    allow_empty=True,
+                ),
+            ],
+            action=self._record_member,
+            retries=0,
+        )
+        return CmdTask(
+            name=f"add-{self.name}-member",
+            description=f"Add a member to the running {self.name} squad",
+            upstream=record_member,
+            cmd=self._build_add_member_script,
+            render_cmd=False,
+            retries=0,
+        )
+
+    def _create_remove_member_task(self) -> Task:
+        """Create the tasks that close a member's pane, then remove it."""
+        close_pane = CmdTask(
+            name=f"close-{self.name}-member-pane",
+            description=f"Close a member's pane in the running {self.name} squad",
+            input=[StrInput(name="name", description="Name of the member")],
+            cmd=self._build_close_member_pane_script,
+            render_cmd=False,
+            retries=0,
+        )
+        return Task(
+            name=f"remove-{self.name}-member",
+            description=f"Remove a member from the running {self.name} squad",
+            upstream=close_pane,
+            action=self._remove_member,
+            retries=0,
+        )
+
+    def _record_member(self, ctx: AnyContext) -> None:
+        """Record a new member on the board, for every process of the squad."""
+        name = ctx.input.name
+        role = ctx.input.role or ""
+        if self.member_factory is None:
+            raise ValueError(
+                f"Squad '{self.name}' has no member_factory to create new members"
+            )
+        if not MEMBER_NAME_PATTERN.fullmatch(name):
+            raise ValueError(
+                f"Invalid member name '{name}': use letters, digits, '_' and '-'"
+            )
+        if role and not MEMBER_NAME_PATTERN.fullmatch(role):
+            raise ValueError(f"Invalid role '{role}': use letters, digits, '_' and '-'")
+        if name in ("add", "remove") or name in self.board.members():
+            raise ValueError(f"Invalid or existing member '{name}'")
+        self.board.add_member(name, role)
+
+    def _build_add_member_script(self, ctx: AnyContext) -> str:
+        """Build the script that opens a pane for the member just recorded."""
+        name = ctx.input.name
+        role = ctx.input.role or ""
+        member = Member(name, self.member_factory(name, role), role)
+        not_running = f"{self.name} is not running; {name} joins on its next start"
+        return "\n".join(
+            [
+                self._build_find_window_command(),
+                'if [ -z "$window" ]; then',
+                f"  echo {shlex.quote(not_running)}",
+                "  exit 0",
+                "fi",
+                f'pane=$(tmux split-window -t "$window" -h -P -F "#{{pane_id}}" '
+                f"{shlex.quote(self._build_member_command(member))})",
+                f'tmux select-pane -t "$pane" -T {shlex.quote(name)}',
+                f'tmux set-option -p -t "$pane" @zrb_squad_member {shlex.quote(name)}',
+                'tmux select-layout -t "$window" tiled',
+                f"echo {shlex.quote(f'Added {name} to {self.name}')}",
+            ]
+        )
+
+    def _build_close_member_pane_script(self, ctx: AnyContext) -> str:
+        """
+        Build the script that closes the pane of a member about to be removed.
+
+        The member is stopped first, so it cannot work on (or complete) its
+        tasks while they are rerouted.
+        """
+        name = ctx.input.name
+        if name not in self.board.members():
+            return self._build_error_command(f"Unknown member '{name}'")
+        if name == self.main_agent:
+            return self._build_error_command("The main agent cannot be removed")
+        return self._build_kill_member_pane_command(name)
+
+    def _remove_member(self, ctx: AnyContext) -> None:
+        """Remove a member whose pane is closed and reroute its pending tasks."""
+        name = ctx.input.name
+        members = self.board.members()
+        # Hand pending work to a peer with the same role, or to the main agent
+        role = members.get(name, "")
+        peers = [
+            other
+            for other, other_role in members.items()
+            if other != name and role and other_role == role
+        ]
+        reroute_to = f"role:{role}" if peers else self.main_agent
+        moved = self.board.remove_member(name, reroute_to=reroute_to)
+        ctx.print(
+            f"Removed {name} from {self.name}, "
+            f"{len(moved)} pending tasks rerouted to {reroute_to}"
+        )
+
+    def _build_kill_member_pane_command(self, name: str) -> str:
+        """Build command that closes a member's pane, if the squad is running."""
+        return "\n".join(
+            [
+                self._build_find_window_command(),
+                'if [ -n "$window" ]; then',
+                '  pane=$(tmux list-panes -t "$window" '
+                '-F "#{pane_id} #{@zrb_squad_member}" '
+                f"| awk -v name={shlex.quote(name)} "
+                "'$2 == name {print $1; exit}')",
+                '  if [ -n "$pane" ]; then',
+                '    tmux kill-pane -t "$pane"',
+                '    tmux select-layout -t "$window" tiled',
+                "  fi",
+                "fi",
+            ]
+        )
+
+    def _build_find_window_command(self) -> str:
+        """Build command that finds the squad window, in any tmux session."""
+        return (
+            'window=$(tmux list-windows -a -F "#{session_name}:#{window_index} '
+            '#{window_name}" 2>/dev/null '
+            f"| awk '$2 == \"{self.session_name}\" {{print $1; exit}}')"
+        )
+
+    def _build_error_command(self, message: str) -> str:
+        """Build command that reports an error and fails the task."""
+        return f"echo {shlex.quote('Error: ' + message)} >&2\nexit 1"
+
+    def _create_dashboard_task(self) -> Task:
+        """Create the task that shows the live board dashboard."""
+
+        async def show_dashboard(ctx: AnyContext) -> None:
+            from .dashboard import BoardDashboard
+
+            await BoardDashboard(self.board).run()
+
+        return Task(
+            name=f"{self.name}-dashboard",
+            description=f"Show the live board of the {self.name} squad",
+            action=show_dashboard,
+            retries=0,
+        )
+
+    def _create_squad_task(self) -> CmdTask:
+        """Create the CmdTask that starts the squad."""
         return CmdTask(
             name=f"start-{self.name}",
             description=f"Start {self.name} squad with {len(self.members)} members",
-            cmd=cmd_with_message,
+            # The tmux script is only generated when the task runs
+            cmd=self._build_squad_script,
             is_interactive=True,
             render_cmd=False,
         )
 
+    def _build_squad_script(self, ctx: AnyContext) -> str:
+        """Build the full script run by the squad task."""
+        run_name = f"{self.group_name}-{time.strftime('%Y%m%d-%H%M%S')}"
+        self._current_run_dir = os.path.abspath(os.path.join(self.run_dir, run_name))
+        full_cmd = self._build_tmux_commands()
+        if self.profile:
+            profile_dir = os.path.join(self._current_run_dir, "profile")
+            full_cmd = f'echo "📈 Profiling members into {profile_dir}"\n' + full_cmd
+
+        # Add a message about assigning initial task
+        return self._add_initial_task_message(full_cmd)
+
     def _add_initial_task_message(self, original_cmd: str) -> str:
         """Add a message about assigning initial task to the main agent."""
-        message = f'echo "🚀 Starting {self.name} squad with {len(self.members)} members..."\n'
+        message = f'echo "🚀 Starting {self.name} squad with {len(self._active_members())} members..."\n'
         return message + original_cmd
 
     def _build_tmux_commands(self) -> str:
@@ -239,6 +628,11 @@ class Squad:
         # Join all commands with newlines for the if/else structure
         return "\n".join(cmd_parts)
 
+    def _active_members(self) -> list[Member]:
+        """Get the members to launch, leaving out those removed at runtime."""
+        current = self.board.members()
+        return [member for member in self.members if member.name in current]
+
     def _build_kill_session_command(self) -> str:
         """Build command to kill any existing session with the same name."""
         return f"tmux kill-session -t {self.session_name} 2>/dev/null || true"
@@ -246,7 +640,8 @@ class Squad:
     def _build_new_window_commands(self) -> list[str]:
         """Build commands for creating a new window in current tmux session."""
         commands = []
-        first_member = self.members[0]
+        members = self._active_members()
+        first_member = members[0]
         first_cmd = self._build_member_command(first_member)
 
         # Get current session name to create window in the same session
@@ -263,17 +658,30 @@ class Squad:
         commands.append('  window_id=$(tmux display-message -p "#I")')
 
         # Create panes for remaining members
-        for i, member in enumerate(self.members[1:], 1):
+        for i, member in enumerate(members[1:], 1):
             cmd = self._build_member_command(member)
             commands.append(
                 f'  tmux split-window -t ${{current_session}}:${{window_id}} -h "{cmd}"'
             )
+        if self.dashboard:
+            commands.append(
+                f"  tmux split-window -t ${{current_session}}:${{window_id}} -v "
+                f'"{self._build_dashboard_command()}"'
+            )
+            commands.append(
+                f"  tmux select-pane -t ${{current_session}}:${{window_id}}.{len(members)} "
+                '-T "dashboard"'
+            )
 
         # Set pane titles for all members
-        for i, member in enumerate(self.members):
+        for i, member in enumerate(members):
             commands.append(
                 f'  tmux select-pane -t ${{current_session}}:${{window_id}}.{i} -T "{member.name}"'
             )
+            # Pane titles can be changed by the program, so tag the pane too
+            commands.append(
+                f'  tmux set-option -p -t ${{current_session}}:${{window_id}}.{i} @zrb_squad_member "{member.name}"'
+            )
 
         # Tile the layout
         commands.append(
@@ -288,7 +696,8 @@ class Squad:
     def _build_new_session_commands(self, switch_to_session: bool = True) -> list[str]:
         """Build commands for creating a new tmux session."""
         commands = []
-        first_member = self.members[0]
+        members = self._active_members()
+        first_member = members[0]
         first_cmd = self._build_member_command(first_member)
 
         commands.append(f"  # Creating new session and switching to it")
@@ -300,15 +709,27 @@ class Squad:
         commands.append("  sleep 0.5")
 
         # Create panes for remaining members
-        for i, member in enumerate(self.members[1:], 1):
+        for i, member in enumerate(members[1:], 1):
             cmd = self._build_member_command(member)
             commands.append(f'  tmux split-window -t {self.session_name} -h "{cmd}"')
+        if self.dashboard:
+            commands.append(
+                f"  tmux split-window -t {self.session_name} -v "
+                f'"{self._build_dashboard_command()}"'
+            )
+            commands.append(
+                f"  tmux select-pane -t {self.session_name}:0.{len(members)} "
+                '-T "dashboard"'
+            )
 
         # Set pane titles for all members
-        for i, member in enumerate(self.members):
+        for i, member in enumerate(members):
             commands.append(
                 f'  tmux select-pane -t {self.session_name}:0.{i} -T "{member.name}"'
             )
+            commands.append(
+                f'  tmux set-option -p -t {self.session_name}:0.{i} @zrb_squad_member "{member.name}"'
+            )
 
         # Tile the layout
         commands.append(f"  tmux select-layout -t {self.session_name} tiled")
@@ -332,7 +753,8 @@ class Squad:
     def _build_detached_session_commands(self) -> list[str]:
         """Build commands for creating a detached tmux session when not inside tmux."""
         commands = []
-        first_member = self.members[0]
+        members = self._active_members()
+        first_member = members[0]
         first_cmd = self._build_member_command(first_member)
 
         commands.append(f"  # Not inside tmux, use normal detached session with attach")
@@ -341,15 +763,27 @@ class Squad:
         )
 
         # Create panes for remaining members
-        for i, member in enumerate(self.members[1:], 1):
+        for i, member in enumerate(members[1:], 1):
             cmd = self._build_member_command(member)
             commands.append(f'  tmux split-window -t {self.session_name} -h "{cmd}"')
+        if self.dashboard:
+            commands.append(
+                f"  tmux split-window -t {self.session_name} -v "
+                f'"{self._build_dashboard_command()}"'
+            )
+            commands.append(
+                f"  tmux select-pane -t {self.session_name}:0.{len(members)} "
+                '-T "dashboard"'
+            )
 
         # Set pane titles for all members
-        for i, member in enumerate(self.members):
+        for i, member in enumerate(members):
             commands.append(
                 f'  tmux select-pane -t {self.session_name}:0.{i} -T "{member.name}"'
             )
+            commands.append(
+                f'  tmux set-option -p -t {self.session_name}:0.{i} @zrb_squad_member "{member.name}"'
+            )
 
         # Tile the layout
         commands.append(f"  tmux select-layout -t {self.session_name} tiled")
@@ -359,8 +793,19 @@ class Squad:
 
         return commands
 
+    def _build_dashboard_command(self) -> str:
+        """Build the shell command to run the dashboard."""
+        return f"{CFG.ROOT_GROUP_NAME} {self.group_name} dashboard; exec ${{SHELL:-bash}} -i"
+
     def _build_member_command(self, member: Member) -> str:
         """Build the shell command to run a member's chat task."""
         # Wrap command to keep shell alive even if command exits
         # Use $SHELL if available, otherwise fall back to bash
-        return f"{CFG.ROOT_GROUP_NAME} {self.group_name} member {member.chat_task.name}; exec ${{SHELL:-bash}} -i"
+        command = f"{CFG.ROOT_GROUP_NAME} {self.group_name} member {member.chat_task.name}; exec ${{SHELL:-bash}} -i"
+        if self.profile and self._current_run_dir is not None:
+            profile_dir = os.path.join(self._current_run_dir, "profile")
+            command = (
+                f"ZRB_SQUAD_PROFILE_DIR={shlex.quote(profile_dir)} "
+                f"ZRB_SQUAD_PROFILE_MEMBER={shlex.quote(member.name)} {command}"
+            )
+        return command